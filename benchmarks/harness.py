@@ -0,0 +1,135 @@
+from typing import Callable, Dict, List, Optional, Tuple
+import dataclasses
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+
+
+@dataclasses.dataclass(frozen=True)
+class Scenario:
+
+    name: str
+    func: Callable[[], object]
+    group: str
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+
+    name: str
+    group: str
+    ops_per_sec: float
+    allocated_bytes: int
+
+    def to_dict(self) -> dict:
+
+        return {
+            "group": self.group,
+            "ops_per_sec": round(self.ops_per_sec, 1),
+            "allocated_bytes": self.allocated_bytes
+        }
+
+
+def measure_ops_per_sec(func: Callable[[], object], *, min_time: float, repeat: int) -> float:
+
+    calls_quantity = 1
+    while True:
+        started_at = time.perf_counter()
+        for _ in range(calls_quantity):
+            func()
+        duration = time.perf_counter() - started_at
+        if duration >= min_time / 10:
+            break
+        calls_quantity *= 2
+
+    calls_quantity = max(1, int(calls_quantity * min_time / (10 * duration)))
+    best_duration = None
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(calls_quantity):
+            func()
+        duration = time.perf_counter() - started_at
+        if (best_duration is None) or (duration < best_duration):
+            best_duration = duration
+
+    return calls_quantity / best_duration
+
+
+def measure_allocated_bytes(func: Callable[[], object], *, calls_quantity: int = 10) -> int:
+
+    func()
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        allocated_bytes = 0
+        for _ in range(calls_quantity):
+            tracemalloc.reset_peak()
+            current_size, _ = tracemalloc.get_traced_memory()
+            func()
+            _, peak_size = tracemalloc.get_traced_memory()
+            allocated_bytes += peak_size - current_size
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    return allocated_bytes // calls_quantity
+
+
+def run_scenarios(scenarios: List[Scenario], *, min_time: float, repeat: int, rounds: int = 1) -> List[Result]:
+
+    scenarios_ops_per_sec = {scenario.name: [] for scenario in scenarios}
+    for _ in range(rounds):
+        for scenario in scenarios:
+            scenarios_ops_per_sec[scenario.name].append(measure_ops_per_sec(scenario.func, min_time=min_time,
+                                                                            repeat=repeat))
+
+    results = []
+    for scenario in scenarios:
+        results.append(Result(name=scenario.name,
+                              group=scenario.group,
+                              ops_per_sec=statistics.median(scenarios_ops_per_sec[scenario.name]),
+                              allocated_bytes=measure_allocated_bytes(scenario.func)))
+
+    return results
+
+
+def load_baseline(path: str) -> Dict[str, dict]:
+
+    with open(path, encoding="UTF-8") as file:
+        return json.load(file)["results"]
+
+
+def save_baseline(path: str, results: List[Result]):
+
+    data = {"results": {result.name: result.to_dict() for result in results}}
+    with open(path, "w", encoding="UTF-8") as file:
+        json.dump(data, file, indent=4, sort_keys=True)
+        file.write("\n")
+
+
+def compare_with_baseline(results: List[Result], baseline: Dict[str, dict], *,
+                          tolerance: float) -> List[Tuple[Result, Optional[dict], List[str]]]:
+
+    comparisons = []
+    for result in results:
+        baseline_result = baseline.get(result.name)
+        regressions = []
+        if baseline_result is not None:
+            if result.ops_per_sec < baseline_result["ops_per_sec"] * (1 - tolerance):
+                regressions.append("ops/sec")
+            if result.allocated_bytes > baseline_result["allocated_bytes"] * (1 + tolerance):
+                regressions.append("allocations")
+        comparisons.append((result, baseline_result, regressions))
+
+    return comparisons
+
+
+def format_change(value: float, baseline_value: Optional[float]) -> str:
+
+    if not baseline_value:
+        return "      -"
+
+    return f"{(value / baseline_value - 1) * 100:+6.1f}%"
@@ -0,0 +1,65 @@
+import argparse
+import fnmatch
+import pathlib
+import sys
+
+from benchmarks import harness
+from benchmarks.scenarios import make_scenarios
+
+
+DEFAULT_BASELINE_PATH = pathlib.Path(__file__).parent / "baseline.json"
+
+
+def parse_args() -> argparse.Namespace:
+
+    parser = argparse.ArgumentParser(description="Benchmark calendars rendering.")
+    parser.add_argument("-k", "--filter", default="*", help="glob pattern of scenarios names to run")
+    parser.add_argument("--min-time", type=float, default=1.0, help="approximate time per scenario in seconds")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats within a round (the best one is kept)")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="interleaved measuring rounds over all scenarios (the median one is reported)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH), help="baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline with the results")
+    parser.add_argument("--tolerance", type=float, default=0.35, help="allowed relative regression")
+
+    return parser.parse_args()
+
+
+def main() -> int:
+
+    args = parse_args()
+    scenarios = [scenario for scenario in make_scenarios() if fnmatch.fnmatch(scenario.name, args.filter)]
+    results = harness.run_scenarios(scenarios, min_time=args.min_time, repeat=args.repeat, rounds=args.rounds)
+
+    if args.save_baseline:
+        harness.save_baseline(args.baseline, results)
+        baseline = {}
+    else:
+        try:
+            baseline = harness.load_baseline(args.baseline)
+        except FileNotFoundError:
+            baseline = {}
+
+    comparisons = harness.compare_with_baseline(results, baseline, tolerance=args.tolerance)
+    print(f"{'scenario':<52} {'ops/sec':>12} {'change':>8} {'peak B':>10} {'change':>8}")
+    regressions_quantity = 0
+    for result, baseline_result, regressions in comparisons:
+        baseline_result = baseline_result or {}
+        line = (f"{result.name:<52} {result.ops_per_sec:>12,.0f} "
+                f"{harness.format_change(result.ops_per_sec, baseline_result.get('ops_per_sec')):>8} "
+                f"{result.allocated_bytes:>10,} "
+                f"{harness.format_change(result.allocated_bytes, baseline_result.get('allocated_bytes')):>8}")
+        if regressions:
+            regressions_quantity += 1
+            line += f"  REGRESSION ({', '.join(regressions)})"
+        print(line)
+
+    if regressions_quantity:
+        print(f"\n{regressions_quantity} scenario(s) regressed beyond {args.tolerance:.0%} of the baseline.")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
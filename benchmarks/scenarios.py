@@ -0,0 +1,215 @@
+from typing import List, Optional
+import dataclasses
+import datetime as datetimelib
+import json
+
+import tgbotcalendar
+from tgbotcalendar.utils import helpers
+
+from benchmarks.harness import Scenario
+
+
+CURRENT_DATE = datetimelib.date(2024, 2, 14)
+SELECTED_DATES_QUANTITIES = (0, 10, 1000)
+FILTERS_PARTS_HOLDER = tgbotcalendar.CallbackFiltersPartsHolder(pass_="p", previous_month="pm", next_month="nm",
+                                                                select_date="sd", reset="r", confirm="c")
+
+
+class StubButton:
+
+    __slots__ = ("text", "callback_data")
+
+    def __init__(self, text: str, callback_data: str):
+
+        self.text = text
+        self.callback_data = callback_data
+
+
+class StubMarkup:
+
+    __slots__ = ("rows",)
+
+    def __init__(self, row_width: int = 3):
+
+        self.rows = []
+
+    def row(self, *buttons: StubButton):
+
+        self.rows.append(buttons)
+
+
+@dataclasses.dataclass
+class DataclassButton:
+
+    text: str
+    callback_data: Optional[str] = None
+    url: Optional[str] = None
+    switch_inline_query: Optional[str] = None
+    switch_inline_query_current_chat: Optional[str] = None
+    pay: Optional[bool] = None
+
+
+@dataclasses.dataclass
+class DataclassMarkup:
+
+    row_width: int = 3
+    inline_keyboard: List[List[DataclassButton]] = dataclasses.field(default_factory=list)
+
+    def row(self, *buttons: DataclassButton):
+
+        self.inline_keyboard.append(list(buttons))
+
+
+MARKUP_CLASSES = {
+    "stub": (StubMarkup, StubButton),
+    "dataclass": (DataclassMarkup, DataclassButton)
+}
+
+
+def build_callback_data(filter_part: str, data) -> str:
+
+    return json.dumps([filter_part, data], separators=(",", ":"))
+
+
+def make_calendars(markup_kind: str) -> tuple:
+
+    markup_class, button_class = MARKUP_CLASSES[markup_kind]
+    specific_dates_calendar = tgbotcalendar.SpecificDatesCalendar(
+        markup_class=markup_class,
+        button_class=button_class,
+        formatter=tgbotcalendar.SpecificDatesFormatter(),
+        callback_data_build_func=build_callback_data,
+        callback_filters_parts_holder=FILTERS_PARTS_HOLDER
+    )
+    period_dates_calendar = tgbotcalendar.PeriodDatesCalendar(
+        markup_class=markup_class,
+        button_class=button_class,
+        formatter=tgbotcalendar.PeriodDatesFormatter(),
+        callback_data_build_func=build_callback_data,
+        callback_filters_parts_holder=FILTERS_PARTS_HOLDER
+    )
+
+    return specific_dates_calendar, period_dates_calendar
+
+
+def make_selected_dates(quantity: int) -> List[datetimelib.date]:
+
+    return [CURRENT_DATE + datetimelib.timedelta(days=index) for index in range(quantity)]
+
+
+def make_specific_dates_scenarios(markup_kind: str) -> List[Scenario]:
+
+    calendar, _ = make_calendars(markup_kind)
+    scenarios = []
+    for quantity in SELECTED_DATES_QUANTITIES:
+        selected_dates = make_selected_dates(quantity)
+        scenarios.append(Scenario(
+            name=f"specific_dates/{markup_kind}/{quantity}_selected",
+            group="specific_dates",
+            func=lambda selected_dates=selected_dates: calendar.render_markup(CURRENT_DATE.year, CURRENT_DATE.month,
+                                                                              selected_dates=selected_dates)
+        ))
+    selected_strings = [helpers.serialize_date(date) for date in make_selected_dates(1000)]
+    scenarios.append(Scenario(
+        name=f"specific_dates/{markup_kind}/1000_selected_strings",
+        group="specific_dates",
+        func=lambda: calendar.render_markup(CURRENT_DATE.year, CURRENT_DATE.month, selected_dates=selected_strings)
+    ))
+    scenarios.append(Scenario(
+        name=f"specific_dates/{markup_kind}/edge_months",
+        group="specific_dates",
+        func=lambda: (calendar.render_markup(2024, 2, selected_dates=selected_strings[:10],
+                                             edge_start_date=CURRENT_DATE, edge_end_date=datetimelib.date(2024, 2, 20)))
+    ))
+
+    return scenarios
+
+
+def make_period_dates_scenarios(markup_kind: str) -> List[Scenario]:
+
+    _, calendar = make_calendars(markup_kind)
+    scenarios = [Scenario(
+        name=f"period_dates/{markup_kind}/0_selected",
+        group="period_dates",
+        func=lambda: calendar.render_markup(CURRENT_DATE.year, CURRENT_DATE.month)
+    )]
+    for quantity in SELECTED_DATES_QUANTITIES[1:]:
+        end_date = CURRENT_DATE + datetimelib.timedelta(days=quantity - 1)
+        scenarios.append(Scenario(
+            name=f"period_dates/{markup_kind}/{quantity}_selected",
+            group="period_dates",
+            func=lambda end_date=end_date: calendar.render_markup(CURRENT_DATE.year, CURRENT_DATE.month,
+                                                                  selected_start_date=CURRENT_DATE,
+                                                                  selected_end_date=end_date)
+        ))
+    scenarios.append(Scenario(
+        name=f"period_dates/{markup_kind}/multi_year_middle_month",
+        group="period_dates",
+        func=lambda: calendar.render_markup(2026, 7, selected_start_date="14.02.2024", selected_end_date="31.12.2029")
+    ))
+    scenarios.append(Scenario(
+        name=f"period_dates/{markup_kind}/edge_months",
+        group="period_dates",
+        func=lambda: calendar.render_markup(2024, 2, selected_start_date="15.02.2024", selected_end_date="18.02.2024",
+                                            edge_start_date=CURRENT_DATE, edge_end_date=datetimelib.date(2024, 2, 20))
+    ))
+
+    return scenarios
+
+
+def make_helpers_scenarios() -> List[Scenario]:
+
+    dates = make_selected_dates(1000)
+    date_strings = [helpers.serialize_date(date) for date in dates]
+    end_date = dates[-1]
+    selected_dates = dates[::3]
+
+    scenarios = [
+        Scenario(name="helpers/serialize_date", group="helpers",
+                 func=lambda: helpers.serialize_date(CURRENT_DATE)),
+        Scenario(name="helpers/deserialize_date", group="helpers",
+                 func=lambda: helpers.deserialize_date("14.02.2024")),
+        Scenario(name="helpers/make_offset_months", group="helpers",
+                 func=lambda: (helpers.make_offset_previous_month(2024, 1), helpers.make_offset_next_month(2024, 12))),
+        Scenario(name="helpers/get_period_dates_1000", group="helpers",
+                 func=lambda: helpers.get_period_dates(CURRENT_DATE, end_date)),
+        Scenario(name="helpers/serialize_dates_1000", group="helpers",
+                 func=lambda: helpers.serialize_dates(dates)),
+        Scenario(name="helpers/deserialize_dates_1000", group="helpers",
+                 func=lambda: helpers.deserialize_dates(date_strings)),
+        Scenario(name="helpers/dates_masks_index_1000", group="helpers",
+                 func=lambda: tgbotcalendar.DatesMasksIndex.from_dates(dates)),
+        Scenario(name="helpers/get_dates_membership_1000", group="helpers",
+                 func=lambda: helpers.get_dates_membership(dates, selected_dates))
+    ]
+    if helpers.numpy is None:
+        return scenarios
+
+    scenarios.append(Scenario(name="helpers/get_period_dates_array_1000", group="helpers",
+                              func=lambda: helpers.get_period_dates_array(CURRENT_DATE, end_date)))
+    for quantity in (100, 1000, 30000):
+        dates_array = helpers.get_period_dates_array(CURRENT_DATE,
+                                                     CURRENT_DATE + datetimelib.timedelta(days=quantity - 1))
+        scenarios.append(Scenario(
+            name=f"helpers/get_dates_membership_array_input_{quantity}",
+            group="helpers",
+            func=lambda dates_array=dates_array: helpers.get_dates_membership(dates_array, selected_dates)
+        ))
+        scenarios.append(Scenario(
+            name=f"helpers/get_dates_membership_array_{quantity}",
+            group="helpers",
+            func=lambda dates_array=dates_array: helpers.get_dates_membership_array(dates_array, selected_dates)
+        ))
+
+    return scenarios
+
+
+def make_scenarios() -> List[Scenario]:
+
+    scenarios = []
+    for markup_kind in MARKUP_CLASSES:
+        scenarios.extend(make_specific_dates_scenarios(markup_kind))
+        scenarios.extend(make_period_dates_scenarios(markup_kind))
+    scenarios.extend(make_helpers_scenarios())
+
+    return scenarios
@@ -0,0 +1,81 @@
+import datetime
+import enum
+
+from tgbotcalendar import (PeriodDatesCalendar, PeriodDatesFormatter, CallbackFiltersPartsHolder,
+                           CalendarSession, CalendarEvent, CompactCallbackDataCodec, serialize_date)
+from aiogram import Bot, Dispatcher, executor
+from aiogram.dispatcher import FSMContext
+from aiogram.contrib.fsm_storage.memory import MemoryStorage
+from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton, Message, CallbackQuery
+from aiogram_callback_factory import make_callback_data, CallbackDataFilter, CallbackFactoryMiddleware
+
+
+BOT_TOKEN = "..."  # insert your token here
+
+
+class CallbackFilterKey(enum.IntEnum):
+    """ Keys for filtering callback_data. """
+
+    PASS = 1
+    PREVIOUS_MONTH = 2
+    NEXT_MONTH = 3
+    SELECT_DATE = 4
+    RESET = 5
+    CONFIRM = 6
+
+
+bot = Bot(token=BOT_TOKEN)
+dispatcher = Dispatcher(bot, storage=MemoryStorage())
+dispatcher.filters_factory.bind(CallbackDataFilter, event_handlers=[dispatcher.callback_query_handlers])
+dispatcher.middleware.setup(CallbackFactoryMiddleware())
+
+# creating a calendar factory
+calendar = PeriodDatesCalendar(
+    markup_class=InlineKeyboardMarkup,
+    button_class=InlineKeyboardButton,
+    formatter=PeriodDatesFormatter(),
+    callback_data_build_func=make_callback_data,
+    callback_filters_parts_holder=CallbackFiltersPartsHolder(
+        pass_=CallbackFilterKey.PASS.value,
+        previous_month=CallbackFilterKey.PREVIOUS_MONTH.value,
+        next_month=CallbackFilterKey.NEXT_MONTH.value,
+        select_date=CallbackFilterKey.SELECT_DATE.value,
+        reset=CallbackFilterKey.RESET.value,
+        confirm=CallbackFilterKey.CONFIRM.value
+    ),
+    callback_data_codec=CompactCallbackDataCodec(),
+    stateless=True  # every button carries the next state, so no storage I/O is needed on callbacks
+)
+# the session keeps the handler logic: month offset, start/end selection, reset and confirmation
+session = CalendarSession(calendar, edge_start_date=datetime.date.today)  # dates for selection will start from today
+
+
+@dispatcher.message_handler(commands=["start"])
+async def handle_start_command(event: Message):
+
+    today = datetime.date.today()
+    _, markup = session.start(today.year, today.month)
+    await bot.send_message(event.from_user.id, "📅 Please select a period:", reply_markup=markup)
+
+
+@dispatcher.callback_query_handler(callback_data=list(CallbackFilterKey))
+async def handle_calendar(event: CallbackQuery, state: FSMContext):
+
+    filter_part, payload = event.data  # depends on your callback data factory
+    calendar_state, markup, calendar_event = session.handle(None, filter_part, payload)
+    await bot.answer_callback_query(event.id)
+
+    if calendar_event is CalendarEvent.CONFIRMED:
+        # a few bytes instead of a list of dates, restore with PeriodDatesState.deserialize()
+        await state.update_data({"period": calendar_state.serialize()})
+        await bot.edit_message_text(f"✅ You have selected period: "
+                                    f"{serialize_date(calendar_state.selected_start_date)} - "
+                                    f"{serialize_date(calendar_state.selected_end_date)}",
+                                    event.from_user.id, event.message.message_id)
+    elif markup is not None:
+        await bot.edit_message_reply_markup(event.from_user.id, event.message.message_id, reply_markup=markup)
+
+
+if __name__ == '__main__':
+    print("Started!")
+    executor.start_polling(dispatcher, fast=False)
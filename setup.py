@@ -27,5 +27,6 @@ setuptools.setup(
     author="Abstract-X",
     author_email="abstract-x-mail@protonmail.com",
     description="The most flexible of Telegram bots calendars.",
+    extras_require={"numpy": ["numpy"]},
     include_package_data=False
 )
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from tgbotcalendar import (SpecificDatesCalendar, SpecificDatesFormatter, PeriodDatesCalendar, PeriodDatesFormatter,
+                           CallbackFiltersPartsHolder, DictMarkupAdapter)
+
+
+FILTERS_PARTS_HOLDER = CallbackFiltersPartsHolder(pass_=1, previous_month=2, next_month=3, select_date=4, reset=5,
+                                                  confirm=6, show_months=7, show_years=8, select_month=9)
+
+
+def build_callback_data(filter_part, data):
+
+    return json.dumps([filter_part, data])
+
+
+def make_specific_dates_calendar(**kwargs) -> SpecificDatesCalendar:
+
+    kwargs.setdefault("formatter", SpecificDatesFormatter())
+    kwargs.setdefault("markup_adapter", DictMarkupAdapter())
+    kwargs.setdefault("callback_filters_parts_holder", FILTERS_PARTS_HOLDER)
+
+    return SpecificDatesCalendar(callback_data_build_func=build_callback_data, **kwargs)
+
+
+def make_period_dates_calendar(**kwargs) -> PeriodDatesCalendar:
+
+    kwargs.setdefault("formatter", PeriodDatesFormatter())
+    kwargs.setdefault("markup_adapter", DictMarkupAdapter())
+    kwargs.setdefault("callback_filters_parts_holder", FILTERS_PARTS_HOLDER)
+
+    return PeriodDatesCalendar(callback_data_build_func=build_callback_data, **kwargs)
+
+
+def get_buttons_data(markup, filter_part) -> list:
+
+    buttons_data = []
+    for row in markup["inline_keyboard"]:
+        for button in row:
+            button_filter_part, data = json.loads(button["callback_data"])
+            if button_filter_part == filter_part:
+                buttons_data.append(data)
+
+    return buttons_data
+
+
+@pytest.fixture
+def specific_dates_calendar_factory():
+
+    return make_specific_dates_calendar
+
+
+@pytest.fixture
+def period_dates_calendar_factory():
+
+    return make_period_dates_calendar
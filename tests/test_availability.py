@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from tgbotcalendar import (BaseAvailabilityProvider, CachedAvailabilityProvider, MonthAvailability,
+                           SpecificDatesState, CalendarSession, RenderCache)
+from tgbotcalendar.availability import providers
+from tgbotcalendar.exceptions import AsyncRenderRequiredError
+
+
+class StaticAvailabilityProvider(BaseAvailabilityProvider):
+
+    def __init__(self, unavailable_days=(3,)):
+
+        self.unavailable_days = unavailable_days
+        self.calls = []
+
+    async def get_month_availability(self, year: int, month: int) -> MonthAvailability:
+
+        self.calls.append((year, month))
+        await asyncio.sleep(0)
+        return MonthAvailability.from_days(unavailable_days=self.unavailable_days)
+
+
+def get_callback_data(markup, text):
+
+    return [button["callback_data"] for row in markup["inline_keyboard"] for button in row if button["text"] == text]
+
+
+def test_sync_render_with_availability_provider_raises(specific_dates_calendar_factory):
+
+    calendar = specific_dates_calendar_factory(availability_provider=StaticAvailabilityProvider())
+
+    with pytest.raises(AsyncRenderRequiredError):
+        calendar.render_markup(2024, 1, selected_dates=[])
+    with pytest.raises(AsyncRenderRequiredError):
+        calendar.render_state(SpecificDatesState(2024, 1))
+    with pytest.raises(AsyncRenderRequiredError):
+        calendar.render_many([SpecificDatesState(2024, 1)])
+
+
+def test_async_render_applies_availability(specific_dates_calendar_factory):
+
+    render_cache = RenderCache()
+    calendar = specific_dates_calendar_factory(availability_provider=StaticAvailabilityProvider(),
+                                               render_cache=render_cache)
+    plain_calendar = specific_dates_calendar_factory(render_cache=render_cache)
+
+    markup = asyncio.run(calendar.render_markup_async(2024, 1, selected_dates=[]))
+    plain_markup = plain_calendar.render_markup(2024, 1, selected_dates=[])
+
+    assert get_callback_data(markup, "3") == []
+    assert get_callback_data(plain_markup, "3") == ['[4, "03.01.2024"]']
+
+
+def test_session_starts_asynchronously_with_availability_provider(specific_dates_calendar_factory):
+
+    session = CalendarSession(specific_dates_calendar_factory(availability_provider=StaticAvailabilityProvider()))
+
+    state, markup = asyncio.run(session.start_async(2024, 1))
+
+    assert state == SpecificDatesState(2024, 1)
+    assert get_callback_data(markup, "3") == []
+
+
+def test_cached_provider_expires_entries(monkeypatch):
+
+    now = [100.0]
+    monkeypatch.setattr(providers.time, "monotonic", lambda: now[0])
+    provider = StaticAvailabilityProvider()
+    cached_provider = CachedAvailabilityProvider(provider, ttl=10.0)
+
+    asyncio.run(cached_provider.get_month_availability(2024, 1))
+    now[0] = 109.0
+    asyncio.run(cached_provider.get_month_availability(2024, 1))
+    now[0] = 110.0
+    asyncio.run(cached_provider.get_month_availability(2024, 1))
+
+    assert provider.calls == [(2024, 1), (2024, 1)]
+    assert (cached_provider.hits, cached_provider.misses) == (1, 2)
+
+
+def test_cached_provider_invalidates_months():
+
+    provider = StaticAvailabilityProvider()
+    cached_provider = CachedAvailabilityProvider(provider)
+
+    async def load_months():
+
+        for month in (1, 2):
+            await cached_provider.get_month_availability(2024, month)
+        await cached_provider.get_month_availability(2025, 1)
+
+    asyncio.run(load_months())
+    cached_provider.invalidate(2024, 1)
+    asyncio.run(load_months())
+    cached_provider.invalidate(2024)
+    asyncio.run(load_months())
+
+    assert provider.calls.count((2024, 1)) == 3
+    assert provider.calls.count((2024, 2)) == 2
+    assert provider.calls.count((2025, 1)) == 1
+    with pytest.raises(ValueError):
+        cached_provider.invalidate(month=1)
+
+
+def test_cached_provider_loads_month_once_for_concurrent_requests():
+
+    provider = StaticAvailabilityProvider()
+    cached_provider = CachedAvailabilityProvider(provider)
+
+    async def load_month():
+
+        return await asyncio.gather(*(cached_provider.get_month_availability(2024, 1) for _ in range(10)))
+
+    availabilities = asyncio.run(load_month())
+
+    assert provider.calls == [(2024, 1)]
+    assert cached_provider.loads_quantity == 1
+    assert all(i is availabilities[0] for i in availabilities)
+
+
+def test_cached_provider_evicts_least_recently_used_month():
+
+    provider = StaticAvailabilityProvider()
+    cached_provider = CachedAvailabilityProvider(provider, max_size=2)
+
+    async def load_months():
+
+        for month in (1, 2, 1, 3, 1, 2):
+            await cached_provider.get_month_availability(2024, month)
+
+    asyncio.run(load_months())
+
+    assert len(cached_provider) == 2
+    assert provider.calls == [(2024, 1), (2024, 2), (2024, 3), (2024, 2)]
@@ -0,0 +1,81 @@
+import datetime as datetimelib
+
+import pytest
+
+from tgbotcalendar import CalendarSession, CalendarEvent, SpecificDatesState
+
+from conftest import FILTERS_PARTS_HOLDER, get_buttons_data
+
+
+@pytest.fixture
+def session(specific_dates_calendar_factory):
+
+    return CalendarSession(specific_dates_calendar_factory())
+
+
+def test_start_renders_initial_state(session):
+
+    state, markup = session.start(2024, 1)
+
+    assert state == SpecificDatesState(2024, 1)
+    assert markup == session.render(state)
+
+
+def test_reducer_events(session):
+
+    state, _ = session.start(2024, 1)
+
+    state, markup, event = session.handle(state, FILTERS_PARTS_HOLDER.next_month, [2024, 2])
+    assert (state, event) == (SpecificDatesState(2024, 2), CalendarEvent.MONTH_CHANGED)
+    assert markup == session.render(state)
+
+    state, markup, event = session.handle(state, FILTERS_PARTS_HOLDER.select_date, "03.02.2024")
+    assert (set(state.selected_dates), event) == ({datetimelib.date(2024, 2, 3)}, CalendarEvent.DATE_SELECTED)
+    assert markup == session.render(state)
+
+    state, _, event = session.handle(state, FILTERS_PARTS_HOLDER.select_date, "03.02.2024")
+    assert (set(state.selected_dates), event) == (set(), CalendarEvent.DATE_SELECTED)
+
+    state, _, _ = session.handle(state, FILTERS_PARTS_HOLDER.select_date, "05.02.2024")
+    state, _, event = session.handle(state, FILTERS_PARTS_HOLDER.reset)
+    assert (state, event) == (SpecificDatesState(2024, 2), CalendarEvent.RESET)
+
+
+@pytest.mark.parametrize("filter_part, payload, expected_event", [
+    (FILTERS_PARTS_HOLDER.pass_, "c0", CalendarEvent.PASS),
+    (FILTERS_PARTS_HOLDER.confirm, None, CalendarEvent.CONFIRMED)
+])
+def test_inert_events_keep_state_without_markup(session, filter_part, payload, expected_event):
+
+    state = SpecificDatesState(2024, 1, selected_dates=[datetimelib.date(2024, 1, 3)])
+
+    assert session.handle(state, filter_part, payload) == (state, None, expected_event)
+
+
+def test_show_months_renders_months_view(session):
+
+    state = SpecificDatesState(2024, 1)
+
+    next_state, markup, event = session.handle(state, FILTERS_PARTS_HOLDER.show_months, [2024, 1])
+
+    assert (next_state, event) == (state, CalendarEvent.MONTHS_SHOWN)
+    assert len(get_buttons_data(markup, FILTERS_PARTS_HOLDER.select_month)) == 12
+
+
+def test_unknown_filter_part_raises(session):
+
+    with pytest.raises(ValueError):
+        session.handle(SpecificDatesState(2024, 1), "unknown")
+
+
+def test_callable_edge_dates_are_read_per_call(specific_dates_calendar_factory):
+
+    edge_end_dates = [datetimelib.date(2024, 3, 1)]
+    session = CalendarSession(specific_dates_calendar_factory(), edge_end_date=lambda: edge_end_dates[-1])
+    state = SpecificDatesState(2024, 1)
+
+    first_state, _, _ = session.handle(state, FILTERS_PARTS_HOLDER.next_month, [2024, 2])
+    edge_end_dates.append(datetimelib.date(2024, 1, 1))
+    second_state, _, _ = session.handle(state, FILTERS_PARTS_HOLDER.next_month, [2024, 2])
+
+    assert (first_state.month, second_state.month) == (2, 1)
@@ -0,0 +1,86 @@
+import datetime as datetimelib
+
+import pytest
+
+from tgbotcalendar import DatesMasksIndex
+from tgbotcalendar.utils.selections.dates_masks_index import PACKED_MASKS_FORMAT, PACKED_RUNS_FORMAT
+
+
+def test_from_strings_accepts_last_day_of_month():
+
+    index = DatesMasksIndex.from_strings(["29.02.2024", "31.01.2024"])
+
+    assert len(index) == 2
+    assert list(index) == [datetimelib.date(2024, 1, 31), datetimelib.date(2024, 2, 29)]
+
+
+@pytest.mark.parametrize("date", ["31.02.2024", "29.02.2023", "31.04.2024", "00.01.2024", "01.13.2024",
+                                  "01.00.2024"])
+def test_from_strings_rejects_nonexistent_dates(date):
+
+    with pytest.raises(ValueError):
+        DatesMasksIndex.from_strings([date])
+
+
+def test_init_rejects_mask_bits_above_month_length():
+
+    DatesMasksIndex({(2024, 2): 1 << 28})
+    with pytest.raises(ValueError):
+        DatesMasksIndex({(2024, 2): 1 << 29})
+    with pytest.raises(ValueError):
+        DatesMasksIndex({(2023, 2): 1 << 28})
+
+
+def test_packed_masks_round_trip():
+
+    index = DatesMasksIndex.from_dates([datetimelib.date(2024, 1, day) for day in range(1, 32, 2)] +
+                                       [datetimelib.date(2030, 12, 31)])
+
+    assert index.to_bytes()[0] == PACKED_MASKS_FORMAT
+    assert DatesMasksIndex.from_bytes(index.to_bytes()) == index
+    assert DatesMasksIndex.from_base64(index.to_base64()) == index
+
+
+def test_packed_runs_round_trip():
+
+    start_date = datetimelib.date(2024, 1, 20)
+    index = DatesMasksIndex.from_dates([start_date + datetimelib.timedelta(days=i) for i in range(100)] +
+                                       [datetimelib.date(2025, 3, 1)])
+
+    assert index.to_bytes()[0] == PACKED_RUNS_FORMAT
+    assert DatesMasksIndex.from_bytes(index.to_bytes()) == index
+    assert DatesMasksIndex.from_base64(index.to_base64()) == index
+
+
+def test_compact_string_falls_back_to_legacy_text_form():
+
+    index = DatesMasksIndex.from_dates([datetimelib.date(2024, 1, 1)])
+
+    compact_string = index.to_compact_string()
+
+    assert compact_string == index.to_string()
+    assert DatesMasksIndex.from_compact_string(compact_string) == index
+    assert DatesMasksIndex.from_compact_string(index.to_base64()) == index
+
+
+def test_empty_index_round_trip():
+
+    index = DatesMasksIndex()
+
+    assert index.to_bytes() == b""
+    assert DatesMasksIndex.from_compact_string(index.to_compact_string()) == index
+
+
+@pytest.mark.parametrize("data", ["!!", "ä", "A", "AQ", "Aw", "AYA", "AQEA", "AgEAAA", "AgH_____fwA", "AQH_____DwE",
+                                  "AgEB_____w8", "AQEBAQA"])
+def test_from_base64_rejects_malformed_data(data):
+
+    with pytest.raises(ValueError):
+        DatesMasksIndex.from_base64(data)
+
+
+@pytest.mark.parametrize("data", [b"\x03", b"\x01\x80", b"\x01\x01", b"\x02\x01\x01", b"\x01\x00\x00"])
+def test_from_bytes_rejects_malformed_data(data):
+
+    with pytest.raises(ValueError):
+        DatesMasksIndex.from_bytes(data)
@@ -0,0 +1,70 @@
+import datetime as datetimelib
+
+import pytest
+
+from tgbotcalendar import DatesPeriodsIndex
+
+
+def make_date(day: int) -> datetimelib.date:
+
+    return datetimelib.date(2024, 1, day)
+
+
+@pytest.fixture
+def periods_index():
+
+    return DatesPeriodsIndex([(make_date(1), make_date(3)), (make_date(10), make_date(12))])
+
+
+def test_add_merges_adjacent_periods(periods_index):
+
+    merged_index = periods_index.add(make_date(4), make_date(9))
+
+    assert merged_index.intervals == [(make_date(1), make_date(12))]
+    assert len(merged_index) == 12
+
+
+def test_remove_splits_period(periods_index):
+
+    split_index = periods_index.remove(make_date(2))
+
+    assert split_index.intervals == [(make_date(1), make_date(1)), (make_date(3), make_date(3)),
+                                     (make_date(10), make_date(12))]
+    assert make_date(2) not in split_index
+
+
+def test_add_and_remove_leave_original_index_unchanged(periods_index):
+
+    intervals = periods_index.intervals
+    state_hash = hash(periods_index)
+
+    periods_index.add(make_date(5))
+    periods_index.remove(make_date(1), make_date(11))
+
+    assert periods_index.intervals == intervals
+    assert hash(periods_index) == state_hash
+
+
+def test_equal_indexes_built_in_different_orders_are_equal(periods_index):
+
+    other_index = DatesPeriodsIndex().add(make_date(10), make_date(12)).add(make_date(1), make_date(3))
+
+    assert other_index == periods_index
+    assert repr(other_index) == repr(periods_index)
+
+
+@pytest.mark.parametrize("to_data, from_data", [("to_string", "from_string"), ("to_base64", "from_base64"),
+                                                ("to_compact_string", "from_compact_string")])
+def test_serialization_round_trip(periods_index, to_data, from_data):
+
+    data = getattr(periods_index, to_data)()
+
+    assert getattr(DatesPeriodsIndex, from_data)(data) == periods_index
+
+
+@pytest.mark.parametrize("data", [b"\x01", b"\x02\x01\x01", b"\x02\x01\x01\x00\x00", b"\x02\x02\x01\x01\x00\x01",
+                                  b"\x02\x01\x00\x00"])
+def test_from_bytes_rejects_malformed_data(data):
+
+    with pytest.raises(ValueError):
+        DatesPeriodsIndex.from_bytes(data)
@@ -0,0 +1,29 @@
+import datetime as datetimelib
+
+from tgbotcalendar import DatesMasksIndex, MonthAvailability, is_markup_modified
+
+
+def test_equal_selections_built_in_different_orders_get_same_fingerprint(specific_dates_calendar_factory):
+
+    calendar = specific_dates_calendar_factory(stateless=True)
+    first_date = datetimelib.date(2024, 1, 5)
+    second_date = datetimelib.date(2024, 2, 5)
+    first_selection = DatesMasksIndex().toggle(first_date).toggle(second_date)
+    second_selection = DatesMasksIndex().toggle(second_date).toggle(first_date)
+
+    first_markup, first_fingerprint = calendar.render_markup(2024, 1, selected_dates=first_selection,
+                                                             with_fingerprint=True)
+    second_markup, second_fingerprint = calendar.render_markup(2024, 1, selected_dates=second_selection,
+                                                               with_fingerprint=True)
+
+    assert first_markup == second_markup
+    assert first_fingerprint == second_fingerprint
+    assert not is_markup_modified(second_fingerprint, first_fingerprint)
+
+
+def test_month_availability_repr_does_not_depend_on_texts_order():
+
+    first_availability = MonthAvailability(texts={1: "a", 2: "b"})
+    second_availability = MonthAvailability(texts={2: "b", 1: "a"})
+
+    assert repr(first_availability) == repr(second_availability)
@@ -0,0 +1,56 @@
+import datetime as datetimelib
+
+import pytest
+
+from tgbotcalendar.utils import helpers
+
+
+START_DATE = datetimelib.date(2024, 1, 1)
+
+
+def make_dates(quantity: int):
+
+    return helpers.get_period_dates(START_DATE, START_DATE + datetimelib.timedelta(days=quantity - 1))
+
+
+@pytest.mark.parametrize("quantity", [1, 10, helpers.NUMPY_MEMBERSHIP_MIN_DATES_QUANTITY + 1])
+def test_dates_membership_is_same_for_lists_and_arrays(quantity):
+
+    numpy = pytest.importorskip("numpy")
+    dates = make_dates(quantity)
+    selected_dates = dates[::3] + [datetimelib.date(1999, 1, 1)]
+    expected_membership = [i in set(selected_dates) for i in dates]
+    dates_array = helpers.get_period_dates_array(dates[0], dates[-1])
+
+    assert helpers.get_dates_membership(dates, selected_dates) == expected_membership
+    assert helpers.get_dates_membership(dates_array, selected_dates) == expected_membership
+    assert helpers.get_dates_membership(dates_array, numpy.array(selected_dates,
+                                                                 dtype="datetime64[D]")) == expected_membership
+    assert helpers.get_dates_membership_array(dates_array, selected_dates).tolist() == expected_membership
+    assert helpers.get_dates_membership_array(dates, selected_dates).tolist() == expected_membership
+
+
+def test_dates_membership_without_numpy_returns_list(monkeypatch):
+
+    monkeypatch.setattr(helpers, "numpy", None)
+    dates = make_dates(5)
+
+    assert helpers.get_dates_membership(dates, dates[1:2]) == [False, True, False, False, False]
+
+
+def test_period_dates_array_returns_numpy_array():
+
+    numpy = pytest.importorskip("numpy")
+
+    dates_array = helpers.get_period_dates_array("30.12.2023", START_DATE)
+
+    assert isinstance(dates_array, numpy.ndarray)
+    assert dates_array.tolist() == [datetimelib.date(2023, 12, 30), datetimelib.date(2023, 12, 31), START_DATE]
+
+
+def test_period_dates_array_requires_numpy(monkeypatch):
+
+    monkeypatch.setattr(helpers, "numpy", None)
+
+    with pytest.raises(ImportError):
+        helpers.get_period_dates_array(START_DATE, START_DATE)
@@ -0,0 +1,33 @@
+import time
+
+from tgbotcalendar import HistogramRenderObserver, DisabledDatesIndex
+
+
+def test_observed_render_matches_plain_render(specific_dates_calendar_factory):
+
+    disabled_dates = DisabledDatesIndex([5, 6])
+    calendar = specific_dates_calendar_factory(disabled_dates=disabled_dates)
+    observer = HistogramRenderObserver()
+    observed_calendar = specific_dates_calendar_factory(disabled_dates=disabled_dates, render_observer=observer)
+
+    markup = calendar.render_markup(2024, 1, selected_dates=["05.01.2024"])
+    observed_markup = observed_calendar.render_markup(2024, 1, selected_dates=["05.01.2024"])
+
+    assert observed_markup == markup
+    snapshot = observer.snapshot()
+    assert {"header", "month_cells", "disabled_dates", "month_buttons", "materialize",
+            "callback_data_build_func"} <= set(snapshot["stages_durations"])
+    assert snapshot["buttons_quantity"]["count"] == 1
+
+
+def test_render_without_observer_takes_no_timestamps(specific_dates_calendar_factory, monkeypatch):
+
+    calendar = specific_dates_calendar_factory(disabled_dates=DisabledDatesIndex([5, 6]))
+
+    def fail_perf_counter():
+
+        raise AssertionError("timestamp taken without an observer!")
+
+    monkeypatch.setattr(time, "perf_counter", fail_perf_counter)
+
+    calendar.render_markup(2024, 1, selected_dates=["05.01.2024"])
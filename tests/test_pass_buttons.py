@@ -0,0 +1,36 @@
+from conftest import FILTERS_PARTS_HOLDER, get_buttons_data
+
+
+def get_callbacks_data(markup) -> list:
+
+    return [button["callback_data"] for row in markup["inline_keyboard"] for button in row]
+
+
+def test_identical_renders_are_equal(specific_dates_calendar_factory):
+
+    first_markup = specific_dates_calendar_factory().render_markup(2024, 1, selected_dates=["03.01.2024"])
+    second_markup = specific_dates_calendar_factory().render_markup(2024, 1, selected_dates=["03.01.2024"])
+
+    assert first_markup == second_markup
+
+
+def test_callbacks_data_are_unique_within_markup(specific_dates_calendar_factory, period_dates_calendar_factory):
+
+    markups = [specific_dates_calendar_factory().render_markup(2024, 1, selected_dates=[]),
+               period_dates_calendar_factory().render_markup(2024, 1, selected_start_date="10.01.2024")]
+
+    for markup in markups:
+        callbacks_data = get_callbacks_data(markup)
+        assert len(callbacks_data) == len(set(callbacks_data))
+
+
+def test_pass_button_data_func_builds_data(specific_dates_calendar_factory):
+
+    calendar = specific_dates_calendar_factory(pass_button_data_func=lambda position: f"pass:{position}")
+
+    markup = calendar.render_markup(2024, 1, selected_dates=[])
+    passes_data = get_buttons_data(markup, FILTERS_PARTS_HOLDER.pass_)
+
+    assert passes_data[:2] == ["pass:w0", "pass:w1"]
+    assert "pass:r" in passes_data
+    assert all(i.startswith("pass:") for i in passes_data)
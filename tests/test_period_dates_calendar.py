@@ -0,0 +1,79 @@
+import datetime as datetimelib
+
+import pytest
+
+from tgbotcalendar import DatesPeriod, PeriodDatesState
+
+from conftest import FILTERS_PARTS_HOLDER, get_buttons_data
+
+
+START_DATE = datetimelib.date(2024, 1, 10)
+END_DATE = datetimelib.date(2024, 3, 5)
+
+
+def test_dates_period_is_interval():
+
+    period = DatesPeriod(START_DATE, END_DATE)
+
+    assert len(period) == 56
+    assert datetimelib.date(2024, 2, 29) in period
+    assert END_DATE + datetimelib.timedelta(days=1) not in period
+    assert list(period)[0] == START_DATE
+    assert list(period)[-1] == END_DATE
+    assert period.get_month_days_range(2024, 1) == (10, 31)
+    assert period.get_month_days_range(2024, 2) == (1, 29)
+    assert period.get_month_days_range(2024, 3) == (1, 5)
+    assert period.get_month_days_range(2024, 4) is None
+
+
+def test_dates_period_rejects_reversed_dates():
+
+    with pytest.raises(ValueError):
+        DatesPeriod(END_DATE, START_DATE)
+
+
+def test_single_date_period_is_open():
+
+    period = DatesPeriod(START_DATE)
+
+    assert not period.is_closed
+    assert len(period) == 1
+    assert DatesPeriod(START_DATE, END_DATE).is_closed
+
+
+def test_select_state_date_builds_period(period_dates_calendar_factory):
+
+    calendar = period_dates_calendar_factory()
+    state = PeriodDatesState(2024, 1)
+
+    started_state = calendar.select_state_date(state, START_DATE)
+    closed_state = calendar.select_state_date(started_state, END_DATE)
+    restarted_state = calendar.select_state_date(closed_state, datetimelib.date(2024, 1, 1))
+
+    assert started_state == PeriodDatesState(2024, 1, selected_start_date=START_DATE)
+    assert closed_state == PeriodDatesState(2024, 1, selected_start_date=START_DATE, selected_end_date=END_DATE)
+    assert restarted_state == PeriodDatesState(2024, 1, selected_start_date=datetimelib.date(2024, 1, 1))
+
+
+def test_render_marks_period_edges(period_dates_calendar_factory):
+
+    calendar = period_dates_calendar_factory()
+
+    start_markup = calendar.render_markup(2024, 1, selected_start_date=START_DATE, selected_end_date=END_DATE)
+    end_markup = calendar.render_markup(2024, 3, selected_start_date=START_DATE, selected_end_date=END_DATE)
+
+    assert get_buttons_data(start_markup, FILTERS_PARTS_HOLDER.select_date) == []
+    assert get_buttons_data(start_markup, FILTERS_PARTS_HOLDER.previous_month) == []
+    assert get_buttons_data(start_markup, FILTERS_PARTS_HOLDER.next_month) == [[2024, 2]]
+    assert get_buttons_data(end_markup, FILTERS_PARTS_HOLDER.next_month) == []
+    assert start_markup["inline_keyboard"][-1][1]["text"] == "Confirm (56)"
+
+
+def test_render_long_period_without_materializing_dates(period_dates_calendar_factory):
+
+    calendar = period_dates_calendar_factory()
+
+    markup = calendar.render_markup(2024, 1, selected_start_date=datetimelib.date(1, 1, 1),
+                                    selected_end_date=datetimelib.date(9999, 12, 31))
+
+    assert markup["inline_keyboard"][-1][1]["text"] == f"Confirm ({datetimelib.date.max.toordinal()})"
@@ -0,0 +1,73 @@
+import datetime as datetimelib
+import calendar
+import pickle
+
+import pytest
+
+from tgbotcalendar import PeriodDatesConstraints, PeriodDatesState
+
+from conftest import FILTERS_PARTS_HOLDER, get_buttons_data
+
+
+MONDAY_DATE = datetimelib.date(2024, 1, 1)
+
+
+def make_date(day: int) -> datetimelib.date:
+
+    return datetimelib.date(2024, 1, day)
+
+
+@pytest.fixture
+def calendar_with_constraints(period_dates_calendar_factory):
+
+    constraints = PeriodDatesConstraints(min_days_quantity=3, max_days_quantity=7,
+                                         start_weekdays=[calendar.MONDAY, calendar.FRIDAY])
+    return period_dates_calendar_factory(constraints=constraints)
+
+
+def test_select_state_date_rejects_disallowed_start(calendar_with_constraints):
+
+    state = PeriodDatesState(2024, 1)
+
+    assert calendar_with_constraints.select_state_date(state, make_date(2)) == state
+    assert calendar_with_constraints.select_state_date(state, make_date(5)).selected_start_date == make_date(5)
+
+
+@pytest.mark.parametrize("end_day, is_allowed", [(1, False), (2, False), (3, True), (7, True), (8, False)])
+def test_select_state_date_checks_period_length(calendar_with_constraints, end_day, is_allowed):
+
+    state = PeriodDatesState(2024, 1, selected_start_date=MONDAY_DATE)
+
+    next_state = calendar_with_constraints.select_state_date(state, make_date(end_day))
+
+    assert (next_state != state) == is_allowed
+    if is_allowed:
+        assert next_state.selected_end_date == make_date(end_day)
+
+
+def test_render_offers_only_allowed_dates(calendar_with_constraints):
+
+    start_markup = calendar_with_constraints.render_markup(2024, 1)
+    end_markup = calendar_with_constraints.render_markup(2024, 1, selected_start_date=MONDAY_DATE)
+
+    assert get_buttons_data(start_markup, FILTERS_PARTS_HOLDER.select_date)[:3] == ["01.01.2024", "05.01.2024",
+                                                                                     "08.01.2024"]
+    assert get_buttons_data(end_markup, FILTERS_PARTS_HOLDER.select_date) == [f"0{i}.01.2024" for i in range(3, 8)]
+
+
+@pytest.mark.parametrize("kwargs", [{"min_days_quantity": 0}, {"max_days_quantity": 1},
+                                    {"min_days_quantity": 5, "max_days_quantity": 4}, {"start_weekdays": []},
+                                    {"start_weekdays": [7]}])
+def test_invalid_constraints_raise(kwargs):
+
+    with pytest.raises(ValueError):
+        PeriodDatesConstraints(**kwargs)
+
+
+def test_constraints_are_immutable_and_picklable():
+
+    constraints = PeriodDatesConstraints(min_days_quantity=2, start_weekdays=[calendar.SUNDAY])
+
+    assert pickle.loads(pickle.dumps(constraints)) == constraints
+    with pytest.raises(AttributeError):
+        constraints.min_days_quantity = 3
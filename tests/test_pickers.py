@@ -0,0 +1,90 @@
+import datetime as datetimelib
+
+from tgbotcalendar import (CalendarSession, CalendarEvent, SpecificDatesState, PeriodDatesState,
+                           PeriodDatesConstraints)
+
+from conftest import FILTERS_PARTS_HOLDER, get_buttons_data
+
+
+MARCH_DATES = (datetimelib.date(2024, 3, 1), datetimelib.date(2024, 3, 31))
+
+
+def test_months_picker_skips_fully_disabled_months(specific_dates_calendar_factory):
+
+    calendar = specific_dates_calendar_factory(disabled_dates=[MARCH_DATES])
+
+    markup = calendar.render_months_state(SpecificDatesState(2024, 1))
+
+    assert get_buttons_data(markup, FILTERS_PARTS_HOLDER.select_month) == [[2024, i] for i in range(1, 13) if i != 3]
+
+
+def test_session_ignores_disabled_month_selection(specific_dates_calendar_factory):
+
+    session = CalendarSession(specific_dates_calendar_factory(disabled_dates=[MARCH_DATES]))
+    state = SpecificDatesState(2024, 1)
+
+    disabled_state, _, disabled_event = session.handle(state, FILTERS_PARTS_HOLDER.select_month, [2024, 3])
+    next_state, _, next_event = session.handle(state, FILTERS_PARTS_HOLDER.select_month, [2024, 4])
+
+    assert (disabled_state, disabled_event) == (state, CalendarEvent.PASS)
+    assert (next_state, next_event) == (SpecificDatesState(2024, 4), CalendarEvent.MONTH_CHANGED)
+
+
+def test_period_pickers_follow_constraints(period_dates_calendar_factory):
+
+    calendar = period_dates_calendar_factory(constraints=PeriodDatesConstraints(max_days_quantity=10))
+    state = PeriodDatesState(2024, 1, selected_start_date=datetimelib.date(2024, 1, 25))
+
+    assert get_buttons_data(calendar.render_state(state), FILTERS_PARTS_HOLDER.previous_month) == []
+    assert get_buttons_data(calendar.render_state(state), FILTERS_PARTS_HOLDER.next_month) == [[2024, 2]]
+    assert get_buttons_data(calendar.render_months_state(state),
+                            FILTERS_PARTS_HOLDER.select_month) == [[2024, 1], [2024, 2]]
+    assert get_buttons_data(calendar.render_years_state(state), FILTERS_PARTS_HOLDER.show_months) == [[2024, 1]]
+
+
+def test_years_picker_clamps_to_edges(specific_dates_calendar_factory):
+
+    calendar = specific_dates_calendar_factory()
+
+    markup = calendar.render_years_state(SpecificDatesState(2024, 6), edge_start_date=datetimelib.date(2023, 8, 1),
+                                         edge_end_date=datetimelib.date(2025, 3, 1))
+
+    assert get_buttons_data(markup, FILTERS_PARTS_HOLDER.show_months) == [[2023, 8], [2024, 6], [2025, 3]]
+
+
+def test_session_clamps_month_selection(period_dates_calendar_factory):
+
+    calendar = period_dates_calendar_factory(constraints=PeriodDatesConstraints(max_days_quantity=10))
+    session = CalendarSession(calendar, edge_start_date=datetimelib.date(2023, 12, 1))
+    state = PeriodDatesState(2024, 1, selected_start_date=datetimelib.date(2024, 1, 25))
+
+    assert session.handle(state, FILTERS_PARTS_HOLDER.select_month,
+                          [2024, 6])[0] == calendar.move_state(state, 2024, 2)
+    assert session.handle(state, FILTERS_PARTS_HOLDER.previous_month,
+                          [2023, 12])[0] == calendar.move_state(state, 2024, 1)
+
+
+def test_months_picker_limits_months_and_arrows_to_edges(specific_dates_calendar_factory):
+
+    calendar = specific_dates_calendar_factory()
+    state = SpecificDatesState(2024, 6)
+
+    inner_markup = calendar.render_months_state(state, edge_start_date=datetimelib.date(2024, 3, 15),
+                                                edge_end_date=datetimelib.date(2024, 10, 1))
+    outer_markup = calendar.render_months_state(state, edge_start_date=datetimelib.date(2023, 8, 15),
+                                                edge_end_date=datetimelib.date(2025, 3, 1))
+
+    assert get_buttons_data(inner_markup, FILTERS_PARTS_HOLDER.select_month) == [[2024, i] for i in range(3, 11)]
+    assert get_buttons_data(inner_markup, FILTERS_PARTS_HOLDER.show_months) == []
+    assert get_buttons_data(outer_markup, FILTERS_PARTS_HOLDER.show_months) == [[2023, 8], [2025, 3]]
+
+
+def test_years_picker_arrows_follow_edges(specific_dates_calendar_factory):
+
+    calendar = specific_dates_calendar_factory()
+
+    markup = calendar.render_years_state(SpecificDatesState(2024, 6), edge_start_date=datetimelib.date(2020, 3, 15),
+                                         edge_end_date=datetimelib.date(2030, 10, 1))
+
+    assert get_buttons_data(markup, FILTERS_PARTS_HOLDER.show_years) == [[2028, 6]]
+    assert [data for data in get_buttons_data(markup, FILTERS_PARTS_HOLDER.pass_) if data in ("p", "n")] == ["p"]
@@ -0,0 +1,94 @@
+import threading
+import asyncio
+
+import pytest
+
+from tgbotcalendar import MonthsPrefetcher, SharedRenderCache, SQLiteCacheBackend
+
+
+class RecordingBackend(SQLiteCacheBackend):
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+        self.getting_threads = []
+
+    def get(self, key):
+
+        self.getting_threads.append(threading.get_ident())
+        return super().get(key)
+
+
+def test_shared_cache_prefetch_does_not_block_rendering_thread(tmp_path, specific_dates_calendar_factory):
+
+    backend = RecordingBackend(str(tmp_path / "render_cache.sqlite3"))
+    prefetcher = MonthsPrefetcher()
+    render_cache = SharedRenderCache(backend)
+    calendar = specific_dates_calendar_factory(render_cache=render_cache, prefetcher=prefetcher)
+
+    calendar.render_markup(2024, 2, selected_dates=[])
+    prefetcher.shutdown()
+
+    assert backend.getting_threads.count(threading.get_ident()) == 1
+    assert prefetcher.completed == 2
+    assert render_cache.prefetched == 2
+
+
+def test_submit_skips_duplicate_and_excess_keys():
+
+    release_event = threading.Event()
+    prefetcher = MonthsPrefetcher(max_concurrency=1, max_pending=2)
+
+    submitted = [prefetcher.submit(key, release_event.wait) for key in ("a", "a", "b", "c")]
+    pending_quantity = prefetcher.pending_quantity
+    release_event.set()
+    prefetcher.shutdown()
+
+    assert submitted == [True, False, True, False]
+    assert pending_quantity == 2
+    assert (prefetcher.scheduled, prefetcher.skipped, prefetcher.completed) == (2, 2, 2)
+    assert prefetcher.pending_quantity == 0
+
+
+def test_failed_job_releases_key():
+
+    prefetcher = MonthsPrefetcher()
+
+    prefetcher.submit("a", lambda: 1 / 0)
+    prefetcher.shutdown()
+
+    assert (prefetcher.completed, prefetcher.failed, prefetcher.pending_quantity) == (0, 1, 0)
+    assert prefetcher.submit("a", lambda: None)
+    prefetcher.shutdown()
+    assert prefetcher.completed == 1
+
+
+def test_submit_async_bounds_concurrency():
+
+    prefetcher = MonthsPrefetcher(max_concurrency=2, max_pending=4)
+    running = []
+    max_running = []
+
+    async def job():
+
+        running.append(None)
+        max_running.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+
+    async def prefetch():
+
+        submitted = [prefetcher.submit_async(i, job) for i in range(5)]
+        await prefetcher.wait()
+        return submitted
+
+    assert asyncio.run(prefetch()) == [True, True, True, True, False]
+    assert max(max_running) == 2
+    assert (prefetcher.scheduled, prefetcher.skipped, prefetcher.completed) == (4, 1, 4)
+
+
+@pytest.mark.parametrize("kwargs", [{"max_concurrency": 0}, {"max_concurrency": 2, "max_pending": 1}])
+def test_invalid_limits_raise(kwargs):
+
+    with pytest.raises(ValueError):
+        MonthsPrefetcher(**kwargs)
@@ -0,0 +1,63 @@
+import datetime as datetimelib
+
+import pytest
+
+from tgbotcalendar import RecurringDatesIndex, DatesMasksIndex, WeekdaysRule, EveryNDaysRule
+
+
+START_DATE = datetimelib.date(2024, 1, 1)
+END_DATE = datetimelib.date(2024, 2, 29)
+
+
+@pytest.fixture
+def rules():
+
+    return [WeekdaysRule(weekdays=[0, 2], start_date=START_DATE, end_date=END_DATE),
+            EveryNDaysRule(days_interval=3, start_date=START_DATE, end_date=END_DATE)]
+
+
+def test_rules_order_does_not_change_identity(rules, specific_dates_calendar_factory):
+
+    first_index = RecurringDatesIndex(rules)
+    second_index = RecurringDatesIndex(reversed(rules))
+    calendar = specific_dates_calendar_factory(stateless=True)
+
+    assert first_index == second_index
+    assert hash(first_index) == hash(second_index)
+    assert repr(first_index) == repr(second_index)
+    assert first_index.to_compact_string() == second_index.to_compact_string()
+    assert (calendar.render_markup(2024, 1, selected_dates=first_index, with_fingerprint=True) ==
+            calendar.render_markup(2024, 1, selected_dates=second_index, with_fingerprint=True))
+
+
+def test_duplicate_rules_are_dropped(rules):
+
+    assert RecurringDatesIndex(rules + rules).rules == RecurringDatesIndex(rules).rules
+
+
+def test_string_forms_round_trip(rules):
+
+    index = RecurringDatesIndex(rules, included_dates=DatesMasksIndex.from_dates([datetimelib.date(2024, 3, 5)]),
+                                excluded_dates=DatesMasksIndex.from_dates([datetimelib.date(2024, 1, 1)]))
+
+    assert RecurringDatesIndex.from_compact_string(index.to_string()) == index
+    assert RecurringDatesIndex.from_compact_string(index.to_compact_string()) == index
+
+
+def test_masks_match_iteration(rules):
+
+    index = RecurringDatesIndex(rules, excluded_dates=DatesMasksIndex.from_dates([datetimelib.date(2024, 1, 1)]))
+
+    assert DatesMasksIndex(index.masks) == DatesMasksIndex.from_dates(index)
+
+
+def test_union_contains_dates_of_both_indexes(rules):
+
+    first_index = RecurringDatesIndex(rules[:1], excluded_dates=DatesMasksIndex.from_dates([START_DATE]))
+    second_index = RecurringDatesIndex(rules[1:])
+    dates_index = DatesMasksIndex.from_dates([datetimelib.date(2024, 3, 5)])
+
+    union_index = first_index.union(second_index).union(dates_index)
+
+    assert set(union_index) == set(first_index) | set(second_index) | set(dates_index)
+    assert START_DATE in union_index
@@ -0,0 +1,30 @@
+import gc
+
+from tgbotcalendar import RenderCache, SpecificDatesFormatter
+
+
+def test_calendars_sharing_cache_get_distinct_namespaces(specific_dates_calendar_factory):
+
+    render_cache = RenderCache()
+    first_calendar = specific_dates_calendar_factory(render_cache=render_cache)
+    second_calendar = specific_dates_calendar_factory(render_cache=render_cache,
+                                                      formatter=SpecificDatesFormatter(selected_date_text="X"))
+
+    first_markup = first_calendar.render_markup(2024, 1, selected_dates=["05.01.2024"])
+    second_markup = second_calendar.render_markup(2024, 1, selected_dates=["05.01.2024"])
+
+    assert first_calendar.cache_namespace != second_calendar.cache_namespace
+    assert first_markup != second_markup
+
+
+def test_namespaces_are_not_reused_after_garbage_collection(specific_dates_calendar_factory):
+
+    render_cache = RenderCache()
+    namespaces = set()
+    for _ in range(100):
+        calendar = specific_dates_calendar_factory(render_cache=render_cache)
+        namespaces.add(calendar.cache_namespace)
+        del calendar
+        gc.collect()
+
+    assert len(namespaces) == 100
@@ -0,0 +1,36 @@
+import copy
+import pickle
+
+from tgbotcalendar import RenderCache, SpecificDatesState
+
+
+def test_deepcopy_keeps_calendar_usable(specific_dates_calendar_factory):
+
+    calendar = specific_dates_calendar_factory(render_cache=RenderCache())
+
+    calendar_copy = copy.deepcopy(calendar)
+
+    assert calendar_copy.render_markup(2024, 1, selected_dates=[]) == calendar.render_markup(2024, 1,
+                                                                                              selected_dates=[])
+
+
+def test_pickle_keeps_calendar_usable(specific_dates_calendar_factory):
+
+    calendar = specific_dates_calendar_factory()
+
+    calendar_copy = pickle.loads(pickle.dumps(calendar))
+
+    assert calendar_copy.render_markup(2024, 1, selected_dates=["05.01.2024"]) == calendar.render_markup(
+        2024, 1, selected_dates=["05.01.2024"])
+
+
+def test_render_many_with_processes_matches_serial_render(specific_dates_calendar_factory):
+
+    render_cache = RenderCache()
+    calendar = specific_dates_calendar_factory(render_cache=render_cache)
+    states = [SpecificDatesState(2024, month) for month in range(1, 13)]
+
+    markups = calendar.render_many(states, processes=2, chunk_size=4)
+
+    assert markups == [calendar.render_state(state) for state in states]
+    assert len(render_cache) == len(states)
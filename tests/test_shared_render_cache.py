@@ -0,0 +1,159 @@
+import datetime as datetimelib
+import time
+
+import pytest
+
+from tgbotcalendar import (SharedRenderCache, SQLiteCacheBackend, RedisCacheBackend, SpecificDatesFormatter,
+                           DatesMasksIndex, MarkupIR)
+
+
+class FakeRedisClient:
+
+    def __init__(self):
+
+        self.now = 0.0
+        self._values = {}
+
+    def get(self, key):
+
+        value, expires_at = self._values.get(key, (None, None))
+        if (expires_at is not None) and (expires_at <= self.now):
+            del self._values[key]
+            return None
+
+        return value
+
+    def set(self, key, value, ex=None):
+
+        self._values[key] = (value, None if ex is None else self.now + ex)
+
+    def delete(self, key):
+
+        self._values.pop(key, None)
+
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+
+    return str(tmp_path / "render_cache.sqlite3")
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def backend(request, sqlite_path):
+
+    if request.param == "sqlite":
+        return SQLiteCacheBackend(sqlite_path)
+
+    return RedisCacheBackend(FakeRedisClient(), key_prefix="test:")
+
+
+def test_render_round_trip_through_backend(backend, specific_dates_calendar_factory):
+
+    first_calendar = specific_dates_calendar_factory(render_cache=SharedRenderCache(backend))
+    render_cache = SharedRenderCache(backend)
+    second_calendar = specific_dates_calendar_factory(render_cache=render_cache)
+
+    markup = first_calendar.render_markup(2024, 1, selected_dates=["05.01.2024"])
+    cached_markup = second_calendar.render_markup(2024, 1, selected_dates=["05.01.2024"])
+
+    assert cached_markup == markup
+    assert render_cache.hits == 1
+    assert render_cache.misses == 0
+
+
+def test_encode_decode_round_trip():
+
+    markup_ir = MarkupIR([[("1", "a"), ("2", "b")], [("ä", "c")]])
+
+    assert SharedRenderCache.decode(SharedRenderCache.encode(markup_ir)).rows == markup_ir.rows
+
+
+def test_sqlite_entries_expire_after_ttl(sqlite_path, monkeypatch):
+
+    render_cache = SharedRenderCache(SQLiteCacheBackend(sqlite_path), ttl=10)
+    key = ("namespace", ("state",))
+    render_cache.put(key, MarkupIR([[("1", "a")]]))
+    now = time.time()
+
+    monkeypatch.setattr(time, "time", lambda: now + 5)
+    assert render_cache.get(key) is not None
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert render_cache.get(key) is None
+
+
+def test_redis_entries_expire_after_ttl():
+
+    client = FakeRedisClient()
+    render_cache = SharedRenderCache(RedisCacheBackend(client), ttl=10)
+    key = ("namespace", ("state",))
+    render_cache.put(key, MarkupIR([[("1", "a")]]))
+
+    client.now = 5
+    assert render_cache.get(key) is not None
+    client.now = 11
+    assert render_cache.get(key) is None
+
+
+def test_namespace_changes_with_formatter(backend, specific_dates_calendar_factory):
+
+    first_calendar = specific_dates_calendar_factory(render_cache=SharedRenderCache(backend))
+    same_calendar = specific_dates_calendar_factory(render_cache=SharedRenderCache(backend))
+    other_calendar = specific_dates_calendar_factory(render_cache=SharedRenderCache(backend),
+                                                     formatter=SpecificDatesFormatter(selected_date_text="X"))
+
+    assert first_calendar.cache_namespace == same_calendar.cache_namespace
+    assert first_calendar.cache_namespace != other_calendar.cache_namespace
+
+
+def test_namespace_changes_with_cache_version(backend, specific_dates_calendar_factory):
+
+    first_calendar = specific_dates_calendar_factory(render_cache=SharedRenderCache(backend, cache_version="1"))
+    second_calendar = specific_dates_calendar_factory(render_cache=SharedRenderCache(backend, cache_version="2"))
+
+    assert first_calendar.cache_namespace != second_calendar.cache_namespace
+
+
+def test_sqlite_backends_on_same_file_share_entries(sqlite_path):
+
+    first_backend = SQLiteCacheBackend(sqlite_path)
+    second_backend = SQLiteCacheBackend(sqlite_path)
+
+    first_backend.set("key", b"value")
+
+    assert second_backend.get("key") == b"value"
+    second_backend.delete("key")
+    assert first_backend.get("key") is None
+
+
+def test_sqlite_backend_evicts_oldest_rows_beyond_cap(sqlite_path):
+
+    backend = SQLiteCacheBackend(sqlite_path, max_rows=3, purge_interval=1)
+
+    for i in range(5):
+        backend.set(f"key-{i}", b"value")
+
+    assert [backend.get(f"key-{i}") for i in range(5)] == [None, None, b"value", b"value", b"value"]
+
+
+def test_sqlite_backend_purges_expired_rows(sqlite_path):
+
+    backend = SQLiteCacheBackend(sqlite_path, max_rows=None)
+    backend.set("expired", b"value", ttl=0.001)
+    backend.set("alive", b"value", ttl=60)
+    time.sleep(0.01)
+
+    assert backend.purge() == 1
+    assert backend.get("alive") == b"value"
+
+
+def test_equal_selections_share_backend_key(backend, specific_dates_calendar_factory):
+
+    render_cache = SharedRenderCache(backend)
+    calendar = specific_dates_calendar_factory(render_cache=render_cache, stateless=True)
+    first_date = datetimelib.date(2024, 1, 5)
+    second_date = datetimelib.date(2024, 2, 5)
+
+    calendar.render_markup(2024, 1, selected_dates=DatesMasksIndex().toggle(first_date).toggle(second_date))
+    calendar.render_markup(2024, 1, selected_dates=DatesMasksIndex().toggle(second_date).toggle(first_date))
+
+    assert render_cache.hits == 1
@@ -0,0 +1,58 @@
+import datetime as datetimelib
+
+import pytest
+
+from tgbotcalendar import SpecificDatesState, PeriodDatesState, CalendarSession, CalendarEvent
+from tgbotcalendar.exceptions import CallbackDataSizeError
+
+from conftest import FILTERS_PARTS_HOLDER, get_buttons_data
+
+
+def test_specific_dates_payloads_round_trip(specific_dates_calendar_factory):
+
+    calendar = specific_dates_calendar_factory(stateless=True)
+    state = SpecificDatesState(2024, 1, selected_dates=[datetimelib.date(2024, 1, 3)])
+
+    markup = calendar.render_state(state)
+    select_date_payload = get_buttons_data(markup, FILTERS_PARTS_HOLDER.select_date)[0]
+    next_month_payload = get_buttons_data(markup, FILTERS_PARTS_HOLDER.next_month)[0]
+    reset_payload = get_buttons_data(markup, FILTERS_PARTS_HOLDER.reset)[0]
+
+    assert set(calendar.decode_state(select_date_payload).selected_dates) == {datetimelib.date(2024, 1, 1),
+                                                                               datetimelib.date(2024, 1, 3)}
+    assert calendar.decode_state(next_month_payload).month == 2
+    assert set(calendar.decode_state(next_month_payload).selected_dates) == {datetimelib.date(2024, 1, 3)}
+    assert set(calendar.decode_state(reset_payload).selected_dates) == set()
+
+
+def test_period_dates_payloads_round_trip(period_dates_calendar_factory):
+
+    calendar = period_dates_calendar_factory(stateless=True)
+    state = PeriodDatesState(2024, 1, selected_start_date=datetimelib.date(2024, 1, 10))
+
+    select_date_payload = get_buttons_data(calendar.render_state(state), FILTERS_PARTS_HOLDER.select_date)[-1]
+
+    assert calendar.decode_state(select_date_payload) == calendar.select_state_date(state,
+                                                                                    datetimelib.date(2024, 1, 31))
+
+
+def test_session_decodes_stateless_payload(period_dates_calendar_factory):
+
+    session = CalendarSession(period_dates_calendar_factory(stateless=True))
+    state, markup = session.start(2024, 1)
+    select_date_payload = get_buttons_data(markup, FILTERS_PARTS_HOLDER.select_date)[0]
+
+    next_state, _, event = session.handle(None, FILTERS_PARTS_HOLDER.select_date, select_date_payload)
+
+    assert event == CalendarEvent.DATE_SELECTED
+    assert next_state == PeriodDatesState(2024, 1, selected_start_date=datetimelib.date(2024, 1, 1))
+
+
+def test_oversized_callback_data_raises(specific_dates_calendar_factory):
+
+    selected_dates = [datetimelib.date(2000 + i, 1, 3) for i in range(12)]
+    state = SpecificDatesState(2024, 1, selected_dates=selected_dates)
+
+    with pytest.raises(CallbackDataSizeError):
+        specific_dates_calendar_factory(stateless=True).render_state(state)
+    specific_dates_calendar_factory().render_state(state)
@@ -1,17 +1,46 @@
 from .calendars.specific_dates.specific_dates_calendar import SpecificDatesCalendar
 from .calendars.specific_dates.specific_dates_formatter import SpecificDatesFormatter
+from .calendars.specific_dates.specific_dates_state import SpecificDatesState
 from .calendars.period_dates.period_dates_calendar import PeriodDatesCalendar
 from .calendars.period_dates.period_dates_formatter import PeriodDatesFormatter
+from .calendars.period_dates.period_dates_state import PeriodDatesState
+from .calendars.period_dates.period_dates_constraints import PeriodDatesConstraints
+from .calendars.multi_period_dates.multi_period_dates_calendar import MultiPeriodDatesCalendar
+from .calendars.multi_period_dates.multi_period_dates_formatter import MultiPeriodDatesFormatter
+from .calendars.multi_period_dates.multi_period_dates_state import MultiPeriodDatesState
 from .calendars.base.base_formatter import (
+    CompiledFormatter,
     RUS_DAYS_OF_WEEK,
     RUS_MONTHS_MAPPING,
     ENG_DAYS_OF_WEEK_STARTING_ON_SUNDAY,
     ENG_DAYS_OF_WEEK_STARTING_ON_MONDAY,
     ENG_MONTHS_MAPPING
 )
+from .markup.markup_ir import MarkupIR
+from .markup.adapters import (BaseMarkupAdapter, RowsMarkupAdapter, InlineKeyboardMarkupAdapter, DictMarkupAdapter,
+                              JSONMarkupAdapter)
+from .availability.month_availability import MonthAvailability
+from .availability.providers import BaseAvailabilityProvider, CachedAvailabilityProvider
+from .session.calendar_session import CalendarSession, CalendarEvent
 from .utils.callback_data.filters_parts_holder import CallbackFiltersPartsHolder
+from .utils.callback_data.codecs import BaseCallbackDataCodec, DefaultCallbackDataCodec, CompactCallbackDataCodec
+from .utils.selections.dates_period import DatesPeriod
+from .utils.selections.dates_masks_index import DatesMasksIndex
+from .utils.selections.dates_periods_index import DatesPeriodsIndex
+from .utils.selections.recurrence_rules import BaseRecurrenceRule, WeekdaysRule, EveryNDaysRule, NthWeekdayRule
+from .utils.selections.recurring_dates_index import RecurringDatesIndex
+from .utils.render_cache import RenderCache
+from .cache.backends import BaseCacheBackend, SQLiteCacheBackend, RedisCacheBackend
+from .cache.shared_render_cache import SharedRenderCache
+from .utils.disabled_dates_index import DisabledDatesIndex
+from .utils.prefetcher import MonthsPrefetcher
+from .utils.instrumentation import RenderObserver, HistogramRenderObserver, Histogram
 from .utils.helpers import (serialize_date, deserialize_date, make_offset_previous_month,
-                            make_offset_next_month, get_period_dates)
+                            make_offset_next_month, get_period_dates, is_markup_modified,
+                            serialize_date_compact, deserialize_date_compact,
+                            serialize_month_compact, deserialize_month_compact, get_period_dates_array,
+                            serialize_dates, deserialize_dates, get_dates_membership,
+                            get_dates_membership_array)
 
 
 __version__ = "0.1.1"
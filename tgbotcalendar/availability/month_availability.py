@@ -0,0 +1,85 @@
+import datetime as datetimelib
+from typing import Optional, Iterable, Mapping, Tuple
+import types
+
+from tgbotcalendar.utils.selections.dates_masks_index import MONTH_MASK_LIMIT
+
+
+class MonthAvailability:
+
+    __slots__ = ("unavailable_mask", "texts", "_texts_items")
+
+    def __init__(self, *, unavailable_mask: int = 0, texts: Optional[Mapping[int, str]] = None):
+
+        if not 0 <= unavailable_mask < MONTH_MASK_LIMIT:
+            raise ValueError(f"incorrect unavailable days mask '{unavailable_mask}'!")
+
+        texts = dict(sorted((texts or {}).items()))
+        for day, text in texts.items():
+            if not 1 <= day <= 31:
+                raise ValueError(f"incorrect day '{day}'!")
+            if not text:
+                raise ValueError("fields for text cannot be empty!")
+
+        object.__setattr__(self, "unavailable_mask", unavailable_mask)
+        object.__setattr__(self, "texts", types.MappingProxyType(texts))
+        object.__setattr__(self, "_texts_items", tuple(sorted(texts.items())))
+
+    @classmethod
+    def from_days(cls, *, unavailable_days: Iterable[int] = (),
+                  texts: Optional[Mapping[int, str]] = None) -> "MonthAvailability":
+
+        unavailable_mask = 0
+        for day in unavailable_days:
+            if not 1 <= day <= 31:
+                raise ValueError(f"incorrect day '{day}'!")
+            unavailable_mask |= 1 << (day - 1)
+
+        return cls(unavailable_mask=unavailable_mask, texts=texts)
+
+    @classmethod
+    def from_dates(cls, year: int, month: int, *, unavailable_dates: Iterable[datetimelib.date] = (),
+                   texts: Optional[Mapping[datetimelib.date, str]] = None) -> "MonthAvailability":
+
+        year_month = (year, month)
+        unavailable_days = [date.day for date in unavailable_dates if (date.year, date.month) == year_month]
+        days_texts = {date.day: text for date, text in (texts or {}).items() if (date.year, date.month) == year_month}
+
+        return cls.from_days(unavailable_days=unavailable_days, texts=days_texts)
+
+    def __setattr__(self, key, value):
+
+        raise AttributeError(f"'{type(self).__name__}' object is immutable!")
+
+    def __reduce__(self):
+
+        return _restore_month_availability, (self.unavailable_mask, self._texts_items)
+
+    def __repr__(self):
+
+        return f"{type(self).__name__}(unavailable_mask={self.unavailable_mask!r}, texts={dict(self.texts)!r})"
+
+    def __eq__(self, other):
+
+        if not isinstance(other, MonthAvailability):
+            return NotImplemented
+
+        return (self.unavailable_mask, self._texts_items) == (other.unavailable_mask, other._texts_items)
+
+    def __hash__(self):
+
+        return hash((self.unavailable_mask, self._texts_items))
+
+    def __bool__(self) -> bool:
+
+        return bool(self.unavailable_mask) or bool(self._texts_items)
+
+    def is_available(self, day: int) -> bool:
+
+        return not (self.unavailable_mask >> (day - 1)) & 1
+
+
+def _restore_month_availability(unavailable_mask: int,
+                                texts_items: Tuple[Tuple[int, str], ...]) -> MonthAvailability:
+
+    return MonthAvailability(unavailable_mask=unavailable_mask, texts=dict(texts_items))
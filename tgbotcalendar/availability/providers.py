@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple, Dict
+from collections import OrderedDict
+import asyncio
+import time
+
+from tgbotcalendar.availability.month_availability import MonthAvailability
+
+
+class BaseAvailabilityProvider(ABC):
+
+    @abstractmethod
+    async def get_month_availability(self, year: int, month: int) -> MonthAvailability:
+
+        pass
+
+
+class CachedAvailabilityProvider(BaseAvailabilityProvider):
+
+    def __init__(self, provider: BaseAvailabilityProvider, *, ttl: Optional[float] = 60.0, max_size: int = 1024):
+
+        if max_size < 1:
+            raise ValueError("cache size must be positive!")
+        if (ttl is not None) and (ttl <= 0):
+            raise ValueError("cache TTL must be positive!")
+
+        self._provider = provider
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[Optional[float], MonthAvailability]]" = OrderedDict()
+        self._loads: Dict[Tuple[int, int], asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.loads_quantity = 0
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+
+        requests_quantity = self.hits + self.misses
+        return self.hits / requests_quantity if requests_quantity else 0.0
+
+    async def get_month_availability(self, year: int, month: int) -> MonthAvailability:
+
+        key = (year, month)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if (entry[0] is None) or (entry[0] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+
+        self.misses += 1
+        load = self._loads.get(key)
+        if load is None:
+            load = self._loads[key] = asyncio.ensure_future(self._load(key))
+            self.loads_quantity += 1
+
+        return await asyncio.shield(load)
+
+    def invalidate(self, year: Optional[int] = None, month: Optional[int] = None):
+
+        if (year is None) and (month is not None):
+            raise ValueError("month can't be set without year!")
+
+        keys = [key for key in (*self._entries, *self._loads)
+                if ((year is None) or (key[0] == year)) and ((month is None) or (key[1] == month))]
+        for key in keys:
+            self._entries.pop(key, None)
+            self._loads.pop(key, None)
+
+    def clear(self):
+
+        self._entries.clear()
+        self._loads.clear()
+        self.hits = 0
+        self.misses = 0
+        self.loads_quantity = 0
+
+    async def _load(self, key: Tuple[int, int]) -> MonthAvailability:
+
+        load = asyncio.current_task()
+        try:
+            availability = await self._provider.get_month_availability(*key)
+        finally:
+            is_actual = self._loads.get(key) is load
+            if is_actual:
+                del self._loads[key]
+
+        if is_actual:
+            expires_at = None if self._ttl is None else time.monotonic() + self._ttl
+            self._entries[key] = (expires_at, availability)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        return availability
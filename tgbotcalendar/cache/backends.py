@@ -0,0 +1,156 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Any
+import itertools
+import math
+import os
+import sqlite3
+import threading
+import time
+
+
+class BaseCacheBackend(ABC):
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+
+        pass
+
+    @abstractmethod
+    def delete(self, key: str):
+
+        pass
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+
+    def __init__(self, path: str, *, table_name: str = "tgbotcalendar_render_cache", timeout: float = 5.0,
+                 max_rows: Optional[int] = 100000, purge_interval: int = 1000):
+
+        if not table_name.isidentifier():
+            raise ValueError(f"incorrect table name '{table_name}'!")
+        if (max_rows is not None) and (max_rows < 1):
+            raise ValueError("max rows quantity must be positive!")
+        if purge_interval < 1:
+            raise ValueError("purge interval must be positive!")
+
+        self._path = path
+        self._table_name = table_name
+        self._timeout = timeout
+        self._max_rows = max_rows
+        self._purge_interval = purge_interval
+        self._sets_counter = itertools.count(1)
+        self._local = threading.local()
+        self._get_connection()
+
+    def __getstate__(self):
+
+        state = self.__dict__.copy()
+        state["_local"] = None
+        state["_sets_counter"] = None
+        return state
+
+    def __setstate__(self, state):
+
+        self.__dict__.update(state)
+        self._sets_counter = itertools.count(1)
+        self._local = threading.local()
+
+    def get(self, key: str) -> Optional[bytes]:
+
+        row = self._get_connection().execute(
+            f"SELECT value FROM {self._table_name} WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time())
+        ).fetchone()
+
+        return None if row is None else bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        self._get_connection().execute(
+            f"INSERT OR REPLACE INTO {self._table_name} (key, value, expires_at, created_at) VALUES (?, ?, ?, ?)",
+            (key, value, expires_at, now)
+        )
+        if not next(self._sets_counter) % self._purge_interval:
+            self.purge()
+
+    def delete(self, key: str):
+
+        self._get_connection().execute(f"DELETE FROM {self._table_name} WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+
+        cursor = self._get_connection().execute(f"DELETE FROM {self._table_name} WHERE expires_at <= ?",
+                                                (time.time(),))
+        return cursor.rowcount
+
+    def evict_overflow(self) -> int:
+
+        if self._max_rows is None:
+            return 0
+
+        connection = self._get_connection()
+        rows_quantity, = connection.execute(f"SELECT COUNT(*) FROM {self._table_name}").fetchone()
+        if rows_quantity <= self._max_rows:
+            return 0
+
+        cursor = connection.execute(
+            f"DELETE FROM {self._table_name} WHERE key IN "
+            f"(SELECT key FROM {self._table_name} ORDER BY created_at LIMIT ?)",
+            (rows_quantity - self._max_rows,)
+        )
+        return cursor.rowcount
+
+    def purge(self) -> int:
+
+        return self.purge_expired() + self.evict_overflow()
+
+    def clear(self):
+
+        self._get_connection().execute(f"DELETE FROM {self._table_name}")
+
+    def _get_connection(self) -> sqlite3.Connection:
+
+        connection = getattr(self._local, "connection", None)
+        if (connection is None) or (self._local.pid != os.getpid()):
+            connection = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(f"CREATE TABLE IF NOT EXISTS {self._table_name} "
+                               f"(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, "
+                               f"created_at REAL NOT NULL)")
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {self._table_name}_created_at "
+                               f"ON {self._table_name} (created_at)")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+
+        return connection
+
+
+class RedisCacheBackend(BaseCacheBackend):
+
+    def __init__(self, client: Any, *, key_prefix: str = ""):
+
+        self._client = client
+        self._key_prefix = key_prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+
+        return self._client.get(self._key_prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+
+        if ttl is None:
+            self._client.set(self._key_prefix + key, value)
+        else:
+            self._client.set(self._key_prefix + key, value, ex=max(1, math.ceil(ttl)))
+
+    def delete(self, key: str):
+
+        self._client.delete(self._key_prefix + key)
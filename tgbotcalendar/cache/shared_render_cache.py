@@ -0,0 +1,99 @@
+from typing import Optional, Hashable, Tuple
+import json
+import threading
+
+from tgbotcalendar.cache.backends import BaseCacheBackend
+from tgbotcalendar.markup.markup_ir import MarkupIR
+from tgbotcalendar.utils import helpers
+
+
+CACHE_KEY_DIGEST_SIZE = 16
+DEFAULT_TTL = 86400.0
+
+
+class SharedRenderCache:
+
+    is_shared = True
+
+    def __init__(self, backend: BaseCacheBackend, *, ttl: Optional[float] = DEFAULT_TTL,
+                 key_prefix: str = "tgbotcalendar", cache_version: Optional[str] = None,
+                 max_prefetched_keys: int = 4096):
+
+        if (ttl is not None) and (ttl <= 0):
+            raise ValueError("cache TTL must be positive!")
+
+        self._backend = backend
+        self._ttl = ttl
+        self._key_prefix = key_prefix
+        self.cache_version = cache_version
+        self._max_prefetched_keys = max_prefetched_keys
+        self._prefetched_keys = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.prefetch_hits = 0
+
+    def __contains__(self, key: Tuple[Hashable, tuple]) -> bool:
+
+        return self._backend.get(self._make_backend_key(key)) is not None
+
+    @property
+    def hit_rate(self) -> float:
+
+        requests_quantity = self.hits + self.misses
+        return self.hits / requests_quantity if requests_quantity else 0.0
+
+    @property
+    def prefetch_hit_rate(self) -> float:
+
+        return self.prefetch_hits / self.prefetched if self.prefetched else 0.0
+
+    def get(self, key: Tuple[Hashable, tuple]) -> Optional[MarkupIR]:
+
+        backend_key = self._make_backend_key(key)
+        data = self._backend.get(backend_key)
+
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if backend_key in self._prefetched_keys:
+                self._prefetched_keys.discard(backend_key)
+                self.prefetch_hits += 1
+
+        return self.decode(data)
+
+    def put(self, key: Tuple[Hashable, tuple], value: MarkupIR, *, is_prefetched: bool = False):
+
+        backend_key = self._make_backend_key(key)
+        self._backend.set(backend_key, self.encode(value), self._ttl)
+
+        if is_prefetched:
+            with self._lock:
+                self.prefetched += 1
+                if len(self._prefetched_keys) >= self._max_prefetched_keys:
+                    self._prefetched_keys.clear()
+                self._prefetched_keys.add(backend_key)
+
+    def invalidate(self, key: Tuple[Hashable, tuple]):
+
+        self._backend.delete(self._make_backend_key(key))
+
+    @staticmethod
+    def encode(markup_ir: MarkupIR) -> bytes:
+
+        return json.dumps(markup_ir.rows, ensure_ascii=False, separators=(",", ":")).encode("UTF-8")
+
+    @staticmethod
+    def decode(data: bytes) -> MarkupIR:
+
+        return MarkupIR([tuple(button) for button in row] for row in json.loads(data))
+
+    def _make_backend_key(self, key: Tuple[Hashable, tuple]) -> str:
+
+        namespace, state_key = key
+        digest = helpers.make_fingerprint(state_key, digest_size=CACHE_KEY_DIGEST_SIZE)
+
+        return f"{self._key_prefix}:{namespace}:{digest}"
@@ -1,33 +1,116 @@
 from abc import ABC, abstractmethod
 import datetime as datetimelib
-from typing import Optional, List, Union, Callable, Tuple, Any
+from typing import Optional, List, Union, Callable, Tuple, Any, Collection, Hashable, Iterable, Sequence
+import itertools
+import concurrent.futures
+import copy
 import functools
-import calendar
-import uuid
+import time
 
 from tgbotcalendar.utils.callback_data.filters_parts_holder import CallbackFiltersPartsHolder
+from tgbotcalendar.utils.callback_data.codecs import BaseCallbackDataCodec, DefaultCallbackDataCodec
+from tgbotcalendar.utils.month_skeleton import MonthSkeleton, get_month_skeleton
+from tgbotcalendar.utils.render_cache import RenderCache
+from tgbotcalendar.cache.shared_render_cache import SharedRenderCache
+from tgbotcalendar.utils.instrumentation import RenderObserver
+from tgbotcalendar.utils.disabled_dates_index import DisabledDatesIndex, DisabledDatesValue
+from tgbotcalendar.availability.month_availability import MonthAvailability
+from tgbotcalendar.availability.providers import BaseAvailabilityProvider
+from tgbotcalendar.utils.prefetcher import MonthsPrefetcher
+from tgbotcalendar.markup.markup_ir import MarkupIR, ButtonIR
+from tgbotcalendar.markup.adapters import BaseMarkupAdapter, RowsMarkupAdapter
 from tgbotcalendar.utils import helpers
+from tgbotcalendar import exceptions
+import tgbotcalendar
+
+
+MonthsRange = Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]
 
 
 class BaseCalendar(ABC):
 
     _DAYS_IN_WEEK_QUANTITY = 7
-
-    def __init__(self, *, markup_class: Callable, button_class: Callable, formatter,
+    _MAX_MONTH_CELLS_QUANTITY = 42
+    _CALLBACK_DATA_MAX_SIZE = 64
+    _LAYOUT_VERSION = 1
+    _LOCAL_CACHE_NAMESPACES = itertools.count()
+    _SHARED_ATTRIBUTES_NAMES = ("_render_cache", "_markup_adapter", "_render_observer", "_availability_provider",
+                                "_prefetcher")
+
+    _HEADER_PASS_POSITION = "h"
+    _PREVIOUS_MONTH_PASS_POSITION = "p"
+    _NEXT_MONTH_PASS_POSITION = "n"
+    _RESET_PASS_POSITION = "r"
+    _CONFIRM_PASS_POSITION = "f"
+    _DAYS_OF_WEEK_PASS_POSITIONS = tuple(f"w{i}" for i in range(_DAYS_IN_WEEK_QUANTITY))
+    _MONTH_CELLS_PASS_POSITIONS = tuple(f"c{i}" for i in range(_MAX_MONTH_CELLS_QUANTITY))
+    _MONTHS_IN_YEAR_QUANTITY = 12
+    _MONTHS_ROW_WIDTH = 3
+    _YEARS_PAGE_SIZE = 12
+    _YEARS_ROW_WIDTH = 4
+    _MONTHS_PASS_POSITIONS = tuple(f"m{i}" for i in range(_MONTHS_IN_YEAR_QUANTITY))
+    _YEARS_PASS_POSITIONS = tuple(f"y{i}" for i in range(_YEARS_PAGE_SIZE))
+
+    def __init__(self, *, markup_class: Optional[Callable] = None, button_class: Optional[Callable] = None, formatter,
                  callback_data_build_func: Callable[[Union[str, int], Union[str, int, list, None]], str],
-                 callback_filters_parts_holder: CallbackFiltersPartsHolder):
-
-        try:
-            getattr(markup_class, "row")
-        except AttributeError:
-            raise ValueError(f"'{repr(markup_class)}' has no attribute 'row'!")
-
-        self._markup_class = markup_class
-        self._button_class = button_class
-        self._formatter = formatter
-        self._calendar = calendar.Calendar(firstweekday=self._formatter.first_day_of_week)
+                 callback_filters_parts_holder: CallbackFiltersPartsHolder,
+                 pass_button_data_func: Optional[Callable[[str], Union[str, int, list, None]]] = None,
+                 render_cache: Union[RenderCache, SharedRenderCache, None] = None,
+                 callback_data_codec: Optional[BaseCallbackDataCodec] = None,
+                 stateless: bool = False,
+                 markup_adapter: Optional[BaseMarkupAdapter] = None,
+                 render_observer: Optional[RenderObserver] = None,
+                 disabled_dates: Union[DisabledDatesIndex, Iterable[DisabledDatesValue], None] = None,
+                 availability_provider: Optional[BaseAvailabilityProvider] = None,
+                 prefetcher: Optional[MonthsPrefetcher] = None):
+
+        if markup_adapter is None:
+            if (markup_class is None) or (button_class is None):
+                raise ValueError("either markup and button classes or markup adapter must be set!")
+            markup_adapter = RowsMarkupAdapter(markup_class=markup_class, button_class=button_class,
+                                               row_width=self._DAYS_IN_WEEK_QUANTITY)
+
+        if callback_data_codec is None:
+            callback_data_codec = DefaultCallbackDataCodec()
+
+        if (prefetcher is not None) and (render_cache is None):
+            raise ValueError("prefetching requires render cache!")
+
+        if (disabled_dates is not None) and (not isinstance(disabled_dates, DisabledDatesIndex)):
+            disabled_dates = DisabledDatesIndex(disabled_dates)
+
+        self._markup_adapter = markup_adapter
+        self._formatter = formatter.compile()
+        self._days_of_week_buttons = None
         self._callback_data_build_func = callback_data_build_func
         self._callback_filters_parts_holder = callback_filters_parts_holder
+        self._pass_button_data_func = pass_button_data_func
+        self._render_cache = render_cache
+        self._callback_data_codec = callback_data_codec
+        self._stateless = stateless
+        self._render_observer = render_observer
+        self._disabled_dates = disabled_dates or None
+        self._availability_provider = availability_provider
+        self._prefetcher = prefetcher
+        if getattr(render_cache, "is_shared", False):
+            self._cache_namespace = self._make_cache_namespace()
+        else:
+            self._cache_namespace = next(self._LOCAL_CACHE_NAMESPACES)
+
+    @property
+    def callback_data_codec(self) -> BaseCallbackDataCodec:
+
+        return self._callback_data_codec
+
+    @property
+    def callback_filters_parts_holder(self) -> CallbackFiltersPartsHolder:
+
+        return self._callback_filters_parts_holder
+
+    @property
+    def is_stateless(self) -> bool:
+
+        return self._stateless
 
     @abstractmethod
     def render_markup(self, *args, **kwargs):
@@ -35,64 +118,503 @@ class BaseCalendar(ABC):
         pass
 
     @abstractmethod
-    def _set_available_month_cells(self, current_year: int, current_month: int,
-                                   month_cells: List[Optional[datetimelib.date]],
-                                   selected_dates: List[datetimelib.date]):
+    def render_state(self, state, *, edge_start_date: Optional[datetimelib.date] = None,
+                     edge_end_date: Optional[datetimelib.date] = None, with_fingerprint: bool = False):
 
         pass
 
+    async def render_state_async(self, state, *, edge_start_date: Optional[datetimelib.date] = None,
+                                 edge_end_date: Optional[datetimelib.date] = None, with_fingerprint: bool = False):
+
+        return await self._render_markup_async(state.year, state.month,
+                                               selected_dates=self._get_state_selected_dates(state),
+                                               edge_start_date=edge_start_date,
+                                               edge_end_date=edge_end_date,
+                                               with_fingerprint=with_fingerprint)
+
+    def render_months_state(self, state, *, edge_start_date: Optional[datetimelib.date] = None,
+                            edge_end_date: Optional[datetimelib.date] = None, with_fingerprint: bool = False):
+
+        if self._callback_filters_parts_holder.show_months is None:
+            raise ValueError("months view requires 'show_months' and 'select_month' filters parts!")
+
+        selected_dates = self._get_state_selected_dates(state)
+        markup_ir = self._make_months_markup_ir(state.year, state.month,
+                                                selected_dates=selected_dates,
+                                                edge_start_date=edge_start_date,
+                                                edge_end_date=edge_end_date)
+
+        return self._materialize_view(markup_ir, "months", state.year, state.month, selected_dates,
+                                      edge_start_date, edge_end_date, with_fingerprint)
+
+    def render_years_state(self, state, *, edge_start_date: Optional[datetimelib.date] = None,
+                           edge_end_date: Optional[datetimelib.date] = None, with_fingerprint: bool = False):
+
+        if self._callback_filters_parts_holder.show_years is None:
+            raise ValueError("years view requires 'show_years' filter part!")
+
+        selected_dates = self._get_state_selected_dates(state)
+        markup_ir = self._make_years_markup_ir(state.year, state.month,
+                                               selected_dates=selected_dates,
+                                               edge_start_date=edge_start_date,
+                                               edge_end_date=edge_end_date)
+
+        return self._materialize_view(markup_ir, "years", state.year, state.month, selected_dates,
+                                      edge_start_date, edge_end_date, with_fingerprint)
+
+    @property
+    def cache_namespace(self):
+
+        return self._cache_namespace
+
     @abstractmethod
-    def _make_confirm_button(self, selected_dates: List[datetimelib.date]):
+    def decode_state(self, data: list):
 
         pass
 
     @abstractmethod
-    def _make_navigation_buttons(self, current_year: int, current_month: int,
-                                 selected_dates: List[datetimelib.date],
-                                 edge_start_date: Optional[datetimelib.date] = None,
-                                 edge_end_date: Optional[datetimelib.date] = None) -> Tuple[Any, Any]:
+    def make_initial_state(self, year: int, month: int):
+
+        pass
+
+    @abstractmethod
+    def move_state(self, state, year: int, month: int):
+
+        pass
+
+    @abstractmethod
+    def select_state_date(self, state, date: datetimelib.date):
+
+        pass
+
+    @abstractmethod
+    def reset_state(self, state):
+
+        pass
+
+    def clamp_state(self, state, *, edge_start_date: Optional[datetimelib.date] = None,
+                    edge_end_date: Optional[datetimelib.date] = None):
+
+        months_range = self._get_months_range(self._get_state_selected_dates(state), edge_start_date, edge_end_date)
+        year, month = self._clamp_year_month(state.year, state.month, months_range)
+        if (year, month) == (state.year, state.month):
+            return state
+
+        return self.move_state(state, year, month)
+
+    def is_month_disabled(self, year: int, month: int) -> bool:
+
+        if self._disabled_dates is None:
+            return False
+
+        days_quantity = self._get_month_skeleton(year, month).days_quantity
+        return self._disabled_dates.get_month_mask(year, month) == (1 << days_quantity) - 1
+
+    @abstractmethod
+    def _set_available_month_cells(self, current_year: int, current_month: int,
+                                   month_cells: List[Optional[datetimelib.date]],
+                                   selected_dates: Optional[Collection[datetimelib.date]]):
+
+        pass
+
+    @abstractmethod
+    def _make_confirm_button(self, current_year: int, current_month: int,
+                             selected_dates: Optional[Collection[datetimelib.date]]):
 
         pass
 
     @abstractmethod
     def _make_month_buttons(self, current_year: int, current_month: int,
                             month_cells: List[Optional[datetimelib.date]],
-                            selected_dates: List[datetimelib.date]):
+                            selected_dates: Optional[Collection[datetimelib.date]]):
 
         pass
 
-    def _make_reset_button(self, selected_dates: List[datetimelib.date]):
+    @abstractmethod
+    def _make_selection_key(self, current_year: int, current_month: int,
+                            selected_dates: Optional[Collection[datetimelib.date]]) -> Hashable:
+
+        pass
+
+    @abstractmethod
+    def _get_state_selected_dates(self, state) -> Optional[Collection[datetimelib.date]]:
+
+        pass
+
+    @abstractmethod
+    def _encode_state(self, year: int, month: int, selected_dates: Optional[Collection[datetimelib.date]]) -> list:
+
+        pass
+
+    def _make_reset_button(self, current_year: int, current_month: int,
+                           selected_dates: Optional[Collection[datetimelib.date]]):
 
         if selected_dates:
+            data = self._encode_state(current_year, current_month, None) if self._stateless else None
             button = self._make_button(self._formatter.reset_text,
-                                       self._callback_filters_parts_holder.reset)
+                                       self._callback_filters_parts_holder.reset,
+                                       data)
         else:
-            button = self._make_pass_button()
+            button = self._make_pass_button(self._RESET_PASS_POSITION)
 
         return button
 
     def _render_markup(self, current_year: int, current_month: int, *,
-                       selected_dates: List[datetimelib.date],
+                       selected_dates: Optional[Collection[datetimelib.date]],
                        edge_start_date: Optional[datetimelib.date] = None,
-                       edge_end_date: Optional[datetimelib.date] = None):
+                       edge_end_date: Optional[datetimelib.date] = None,
+                       with_fingerprint: bool = False,
+                       availability: Optional[MonthAvailability] = None,
+                       is_async: bool = False):
+
+        if (self._availability_provider is not None) and not is_async:
+            raise exceptions.AsyncRenderRequiredError("calendar with availability provider must be rendered "
+                                                      "with 'render_markup_async' or 'render_state_async'!")
+
+        state_key = None
+        if (self._render_cache is not None) or with_fingerprint:
+            state_key = self._make_state_key(current_year, current_month,
+                                             selected_dates=selected_dates,
+                                             edge_start_date=edge_start_date,
+                                             edge_end_date=edge_end_date,
+                                             availability=availability)
+
+        observer = self._render_observer
+        markup_ir = None
+        if self._render_cache is not None:
+            markup_ir = self._render_cache.get((self._cache_namespace, state_key))
+            if observer is not None:
+                observer.on_cache_lookup(markup_ir is not None)
+        if markup_ir is None:
+            markup_ir = self._make_markup_ir(current_year, current_month,
+                                             selected_dates=selected_dates,
+                                             edge_start_date=edge_start_date,
+                                             edge_end_date=edge_end_date,
+                                             availability=availability)
+            if self._render_cache is not None:
+                self._render_cache.put((self._cache_namespace, state_key), markup_ir)
+
+        if observer is None:
+            markup = self._markup_adapter.materialize(markup_ir)
+        else:
+            started_at = time.perf_counter()
+            markup = self._markup_adapter.materialize(markup_ir)
+            self._observe_stage(observer, "materialize", started_at)
+
+        if (self._prefetcher is not None) and not is_async:
+            self._prefetch_adjacent_months(current_year, current_month,
+                                           selected_dates=selected_dates,
+                                           edge_start_date=edge_start_date,
+                                           edge_end_date=edge_end_date)
+
+        if with_fingerprint:
+            return markup, helpers.make_fingerprint(state_key)
+
+        return markup
 
+    async def _render_markup_async(self, current_year: int, current_month: int, *,
+                                   selected_dates: Optional[Collection[datetimelib.date]],
+                                   edge_start_date: Optional[datetimelib.date] = None,
+                                   edge_end_date: Optional[datetimelib.date] = None,
+                                   with_fingerprint: bool = False):
+
+        availability = None
+        if self._availability_provider is not None:
+            availability = await self._availability_provider.get_month_availability(current_year, current_month)
+
+        markup = self._render_markup(current_year, current_month,
+                                     selected_dates=selected_dates,
+                                     edge_start_date=edge_start_date,
+                                     edge_end_date=edge_end_date,
+                                     with_fingerprint=with_fingerprint,
+                                     availability=availability or None,
+                                     is_async=True)
+
+        if self._prefetcher is not None:
+            self._prefetch_adjacent_months(current_year, current_month,
+                                           selected_dates=selected_dates,
+                                           edge_start_date=edge_start_date,
+                                           edge_end_date=edge_end_date,
+                                           is_async=True)
+
+        return markup
+
+    def _prefetch_adjacent_months(self, current_year: int, current_month: int, *,
+                                  selected_dates: Optional[Collection[datetimelib.date]],
+                                  edge_start_date: Optional[datetimelib.date] = None,
+                                  edge_end_date: Optional[datetimelib.date] = None,
+                                  is_async: bool = False):
+
+        adjacent_months = []
+        previous_year_month = helpers.make_offset_previous_month(current_year, current_month)
+        if (edge_start_date is None) or (previous_year_month >= (edge_start_date.year, edge_start_date.month)):
+            adjacent_months.append(previous_year_month)
+        next_year_month = helpers.make_offset_next_month(current_year, current_month)
+        if (edge_end_date is None) or (next_year_month <= (edge_end_date.year, edge_end_date.month)):
+            adjacent_months.append(next_year_month)
+
+        for year, month in adjacent_months:
+            state_key = self._make_state_key(year, month,
+                                             selected_dates=selected_dates,
+                                             edge_start_date=edge_start_date,
+                                             edge_end_date=edge_end_date)
+            prefetch_month = functools.partial(self._prefetch_month_async if is_async else self._prefetch_month,
+                                               year, month, state_key,
+                                               selected_dates=selected_dates,
+                                               edge_start_date=edge_start_date,
+                                               edge_end_date=edge_end_date)
+            if is_async:
+                self._prefetcher.submit_async((self._cache_namespace, state_key), prefetch_month)
+            elif self._render_cache.is_shared or ((self._cache_namespace, state_key) not in self._render_cache):
+                self._prefetcher.submit((self._cache_namespace, state_key), prefetch_month)
+
+    def _prefetch_month(self, year: int, month: int, state_key: tuple, *,
+                        selected_dates: Optional[Collection[datetimelib.date]],
+                        edge_start_date: Optional[datetimelib.date] = None,
+                        edge_end_date: Optional[datetimelib.date] = None,
+                        availability: Optional[MonthAvailability] = None):
+
+        if (self._cache_namespace, state_key) in self._render_cache:
+            return
+
+        markup_ir = self._make_markup_ir(year, month,
+                                         selected_dates=selected_dates,
+                                         edge_start_date=edge_start_date,
+                                         edge_end_date=edge_end_date,
+                                         availability=availability)
+        self._render_cache.put((self._cache_namespace, state_key), markup_ir, is_prefetched=True)
+
+    async def _prefetch_month_async(self, year: int, month: int, state_key: tuple, *,
+                                    selected_dates: Optional[Collection[datetimelib.date]],
+                                    edge_start_date: Optional[datetimelib.date] = None,
+                                    edge_end_date: Optional[datetimelib.date] = None):
+
+        availability = None
+        if self._availability_provider is not None:
+            availability = await self._availability_provider.get_month_availability(year, month) or None
+            if availability is not None:
+                state_key += (availability,)
+
+        self._prefetch_month(year, month, state_key,
+                             selected_dates=selected_dates,
+                             edge_start_date=edge_start_date,
+                             edge_end_date=edge_end_date,
+                             availability=availability)
+
+    def render_many(self, states: Iterable[Any], *,
+                    edge_start_date: Optional[datetimelib.date] = None,
+                    edge_end_date: Optional[datetimelib.date] = None,
+                    processes: Optional[int] = None,
+                    chunk_size: int = 1000) -> list:
+
+        if self._availability_provider is not None:
+            raise exceptions.AsyncRenderRequiredError("calendar with availability provider can't render many states!")
+
+        states_keys = []
+        unique_states = {}
+        for state in states:
+            state_key = self._make_state_key(state.year, state.month,
+                                             selected_dates=self._get_state_selected_dates(state),
+                                             edge_start_date=edge_start_date,
+                                             edge_end_date=edge_end_date)
+            states_keys.append(state_key)
+            unique_states.setdefault(state_key, state)
+
+        markups_ir = {}
+        missed_states = {}
+        for state_key, state in unique_states.items():
+            markup_ir = None
+            if self._render_cache is not None:
+                markup_ir = self._render_cache.get((self._cache_namespace, state_key))
+            if markup_ir is None:
+                missed_states[state_key] = state
+            else:
+                markups_ir[state_key] = markup_ir
+
+        if (processes is not None) and (processes > 1) and (len(missed_states) > chunk_size):
+            chunks = helpers.slice_list(list(missed_states.values()), chunk_size)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+                rendered_chunks = executor.map(_render_states_markups_ir,
+                                               itertools.repeat(self._make_worker_calendar(), len(chunks)), chunks,
+                                               itertools.repeat(edge_start_date, len(chunks)),
+                                               itertools.repeat(edge_end_date, len(chunks)))
+                rendered_markups_ir = [i for chunk in rendered_chunks for i in chunk]
+        else:
+            rendered_markups_ir = self._render_states_markups_ir(missed_states.values(),
+                                                                 edge_start_date=edge_start_date,
+                                                                 edge_end_date=edge_end_date)
+
+        for state_key, markup_ir in zip(missed_states, rendered_markups_ir):
+            markups_ir[state_key] = markup_ir
+            if self._render_cache is not None:
+                self._render_cache.put((self._cache_namespace, state_key), markup_ir)
+
+        markups = {state_key: self._markup_adapter.materialize(markup_ir)
+                   for state_key, markup_ir in markups_ir.items()}
+
+        return [markups[state_key] for state_key in states_keys]
+
+    def __deepcopy__(self, memo: dict) -> "BaseCalendar":
+
+        for name in self._SHARED_ATTRIBUTES_NAMES:
+            value = getattr(self, name)
+            memo.setdefault(id(value), value)
+
+        calendar_copy = type(self).__new__(type(self))
+        memo[id(self)] = calendar_copy
+        for name, value in self.__dict__.items():
+            calendar_copy.__dict__[name] = copy.deepcopy(value, memo)
+
+        return calendar_copy
+
+    def _make_worker_calendar(self) -> "BaseCalendar":
+
+        worker_calendar = copy.copy(self)
+        for name in self._SHARED_ATTRIBUTES_NAMES:
+            worker_calendar.__dict__[name] = None
+
+        return worker_calendar
+
+    def _render_states_markups_ir(self, states: Iterable[Any], *,
+                                  edge_start_date: Optional[datetimelib.date] = None,
+                                  edge_end_date: Optional[datetimelib.date] = None) -> List[MarkupIR]:
+
+        months_frames = {}
+        markups_ir = []
+        for state in states:
+            year_month = (state.year, state.month)
+            month_frame = months_frames.get(year_month)
+            if month_frame is None:
+                month_frame = self._make_month_frame(state.year, state.month,
+                                                     edge_start_date=edge_start_date,
+                                                     edge_end_date=edge_end_date)
+                months_frames[year_month] = month_frame
+            markups_ir.append(self._make_markup_ir(state.year, state.month,
+                                                   selected_dates=self._get_state_selected_dates(state),
+                                                   edge_start_date=edge_start_date,
+                                                   edge_end_date=edge_end_date,
+                                                   month_frame=month_frame))
+
+        return markups_ir
+
+    def _make_cache_namespace(self) -> str:
+
+        formatter_config = sorted((k, repr(v)) for k, v in vars(self._formatter).items() if not k.startswith("_"))
+        disabled_dates_config = None
+        if self._disabled_dates is not None:
+            disabled_dates_config = (self._disabled_dates.intervals, self._disabled_dates.weekdays)
+
+        return helpers.make_fingerprint((
+            self._LAYOUT_VERSION,
+            tgbotcalendar.__version__,
+            self._render_cache.cache_version,
+            _get_qualified_name(type(self)),
+            formatter_config,
+            _get_qualified_name(type(self._callback_data_codec)),
+            sorted(vars(self._callback_filters_parts_holder).items(), key=lambda item: item[0]),
+            _get_qualified_name(self._callback_data_build_func),
+            _get_qualified_name(self._pass_button_data_func),
+            self._stateless,
+            disabled_dates_config,
+            self._get_cache_config()
+        ))
+
+    def _get_cache_config(self) -> Hashable:
+
+        return None
+
+    def _make_state_key(self, current_year: int, current_month: int, *,
+                        selected_dates: Optional[Collection[datetimelib.date]],
+                        edge_start_date: Optional[datetimelib.date] = None,
+                        edge_end_date: Optional[datetimelib.date] = None,
+                        availability: Optional[MonthAvailability] = None) -> tuple:
+
+        current_year_month = (current_year, current_month)
+        if (edge_start_date is not None) and ((edge_start_date.year, edge_start_date.month) != current_year_month):
+            edge_start_date = None
+        if (edge_end_date is not None) and ((edge_end_date.year, edge_end_date.month) != current_year_month):
+            edge_end_date = None
+
+        state_key = (type(self).__name__, current_year, current_month,
+                     self._make_selection_key(current_year, current_month, selected_dates),
+                     edge_start_date, edge_end_date)
+        if availability is not None:
+            state_key += (availability,)
+
+        return state_key
+
+    def _make_month_frame(self, current_year: int, current_month: int, *,
+                          edge_start_date: Optional[datetimelib.date] = None,
+                          edge_end_date: Optional[datetimelib.date] = None) -> tuple:
+
+        observer = self._render_observer
+        started_at = time.perf_counter() if observer is not None else None
         header_button = self._make_header_button(current_year, current_month)
+        if observer is not None:
+            started_at = self._observe_stage(observer, "header", started_at)
         days_of_week_buttons = self._make_days_of_week_buttons() if self._formatter.include_days_of_week else None
-        month_cells = self._get_month_cells(current_year, current_month)
-        self._cut_edges_of_month_cells(current_year, current_month,
+        if observer is not None:
+            started_at = self._observe_stage(observer, "days_of_week", started_at)
+        month_skeleton = self._get_month_skeleton(current_year, current_month)
+        month_cells = list(month_skeleton.cells)
+        if observer is not None:
+            started_at = self._observe_stage(observer, "month_cells", started_at)
+        self._cut_edges_of_month_cells(month_skeleton,
                                        month_cells=month_cells,
                                        edge_start_date=edge_start_date,
                                        edge_end_date=edge_end_date)
+        if observer is not None:
+            started_at = self._observe_stage(observer, "edges", started_at)
+        if self._disabled_dates is not None:
+            self._cut_disabled_month_cells(month_skeleton, month_cells)
+            if observer is not None:
+                self._observe_stage(observer, "disabled_dates", started_at)
+
+        return header_button, days_of_week_buttons, tuple(month_cells)
+
+    def _make_markup_ir(self, current_year: int, current_month: int, *,
+                        selected_dates: Optional[Collection[datetimelib.date]],
+                        edge_start_date: Optional[datetimelib.date] = None,
+                        edge_end_date: Optional[datetimelib.date] = None,
+                        month_frame: Optional[tuple] = None,
+                        availability: Optional[MonthAvailability] = None) -> MarkupIR:
+
+        if month_frame is None:
+            month_frame = self._make_month_frame(current_year, current_month,
+                                                 edge_start_date=edge_start_date,
+                                                 edge_end_date=edge_end_date)
+        observer = self._render_observer
+        started_at = time.perf_counter() if observer is not None else None
+        header_button, days_of_week_buttons, month_frame_cells = month_frame
+        if self._is_header_selection_dependent():
+            header_button = self._make_header_button(current_year, current_month, selected_dates)
+        month_cells = list(month_frame_cells)
         self._set_available_month_cells(current_year, current_month, month_cells, selected_dates)
+        if observer is not None:
+            started_at = self._observe_stage(observer, "availability", started_at)
+        if availability is not None:
+            self._cut_unavailable_month_cells(current_year, current_month, month_cells, availability)
+            if observer is not None:
+                started_at = self._observe_stage(observer, "month_availability", started_at)
         month_buttons = self._make_month_buttons(current_year, current_month, month_cells, selected_dates)
+        if observer is not None:
+            started_at = self._observe_stage(observer, "month_buttons", started_at)
+        if (availability is not None) and availability.texts:
+            self._annotate_month_buttons(current_year, current_month, month_cells, month_buttons, availability)
+            if observer is not None:
+                started_at = self._observe_stage(observer, "annotations", started_at)
         previous_month_button, next_month_button = self._make_navigation_buttons(current_year, current_month,
                                                                                  selected_dates=selected_dates,
                                                                                  edge_start_date=edge_start_date,
                                                                                  edge_end_date=edge_end_date)
-        reset_button = self._make_reset_button(selected_dates)
-        confirm_button = self._make_confirm_button(selected_dates)
-
-        markup = self._build_markup(
+        if observer is not None:
+            started_at = self._observe_stage(observer, "navigation", started_at)
+        reset_button = self._make_reset_button(current_year, current_month, selected_dates)
+        confirm_button = self._make_confirm_button(current_year, current_month, selected_dates)
+        if observer is not None:
+            started_at = self._observe_stage(observer, "reset_confirm", started_at)
+
+        markup_ir = self._build_markup_ir(
             header_button=header_button,
             month_buttons=month_buttons,
             previous_month_button=previous_month_button,
@@ -101,99 +623,347 @@ class BaseCalendar(ABC):
             confirm_button=confirm_button,
             days_of_week_buttons=days_of_week_buttons
         )
+        if observer is not None:
+            self._observe_stage(observer, "build_markup", started_at)
+            observer.on_render(markup_ir.buttons_quantity,
+                               [len(callback_data.encode("UTF-8"))
+                                for row in markup_ir.rows for _, callback_data in row])
 
-        return markup
+        return markup_ir
 
-    def _get_empty_markup(self):
+    @staticmethod
+    def _observe_stage(observer: RenderObserver, stage: str, started_at: float) -> float:
 
-        return self._markup_class(row_width=self._DAYS_IN_WEEK_QUANTITY)
+        observer.on_stage(stage, time.perf_counter() - started_at)
+        return time.perf_counter()
 
-    def _build_markup(self, *, header_button, month_buttons, previous_month_button,
-                      next_month_button, reset_button, confirm_button, days_of_week_buttons=None):
+    def _make_months_markup_ir(self, current_year: int, current_month: int, *,
+                               selected_dates: Optional[Collection[datetimelib.date]],
+                               edge_start_date: Optional[datetimelib.date] = None,
+                               edge_end_date: Optional[datetimelib.date] = None) -> MarkupIR:
 
-        markup = self._get_empty_markup()
+        filters_parts_holder = self._callback_filters_parts_holder
+        header_text = self._formatter.get_months_header_text(current_year)
+        if filters_parts_holder.show_years is None:
+            header_button = self._make_pass_button(self._HEADER_PASS_POSITION, header_text)
+        else:
+            header_button = self._make_button(header_text,
+                                              filters_parts_holder.show_years,
+                                              self._make_month_payload(current_year, current_month, selected_dates))
+
+        months_range = self._get_months_range(selected_dates, edge_start_date, edge_end_date)
+        months_buttons = []
+        for month, position in zip(range(1, self._MONTHS_IN_YEAR_QUANTITY + 1), self._MONTHS_PASS_POSITIONS):
+            if self._is_month_selectable(current_year, month, months_range):
+                months_buttons.append(self._make_button(self._formatter.months_mapping[month],
+                                                        filters_parts_holder.select_month,
+                                                        self._make_month_payload(current_year, month, selected_dates)))
+            else:
+                months_buttons.append(self._make_pass_button(position))
 
-        markup.row(header_button)
+        return self._build_picker_markup_ir(
+            header_button=header_button,
+            buttons=months_buttons,
+            row_width=self._MONTHS_ROW_WIDTH,
+            navigation_filter_part=filters_parts_holder.show_months,
+            previous_year=current_year - 1,
+            next_year=current_year + 1,
+            current_month=current_month,
+            selected_dates=selected_dates,
+            months_range=months_range
+        )
+
+    def _make_years_markup_ir(self, current_year: int, current_month: int, *,
+                              selected_dates: Optional[Collection[datetimelib.date]],
+                              edge_start_date: Optional[datetimelib.date] = None,
+                              edge_end_date: Optional[datetimelib.date] = None) -> MarkupIR:
+
+        filters_parts_holder = self._callback_filters_parts_holder
+        start_year = current_year - current_year % self._YEARS_PAGE_SIZE
+        end_year = start_year + self._YEARS_PAGE_SIZE - 1
+        header_button = self._make_pass_button(self._HEADER_PASS_POSITION,
+                                               self._formatter.get_years_header_text(start_year, end_year))
+
+        months_range = self._get_months_range(selected_dates, edge_start_date, edge_end_date)
+        years_buttons = []
+        for year, position in zip(range(start_year, end_year + 1), self._YEARS_PASS_POSITIONS):
+            if any(self._is_month_selectable(year, month, months_range)
+                   for month in range(1, self._MONTHS_IN_YEAR_QUANTITY + 1)):
+                years_buttons.append(self._make_button(
+                    str(year),
+                    filters_parts_holder.show_months,
+                    self._make_month_payload(*self._clamp_year_month(year, current_month, months_range),
+                                             selected_dates)
+                ))
+            else:
+                years_buttons.append(self._make_pass_button(position))
+
+        return self._build_picker_markup_ir(
+            header_button=header_button,
+            buttons=years_buttons,
+            row_width=self._YEARS_ROW_WIDTH,
+            navigation_filter_part=filters_parts_holder.show_years,
+            previous_year=start_year - 1,
+            next_year=end_year + 1,
+            current_month=current_month,
+            selected_dates=selected_dates,
+            months_range=months_range
+        )
+
+    def _build_picker_markup_ir(self, *, header_button: ButtonIR, buttons: List[ButtonIR], row_width: int,
+                                navigation_filter_part: Union[str, int], previous_year: int, next_year: int,
+                                current_month: int, selected_dates: Optional[Collection[datetimelib.date]],
+                                months_range: MonthsRange) -> MarkupIR:
+
+        first_year_month, last_year_month = months_range
+        if (first_year_month is not None) and (previous_year < first_year_month[0]):
+            previous_button = self._make_pass_button(self._PREVIOUS_MONTH_PASS_POSITION)
+        else:
+            previous_button = self._make_button(self._formatter.previous_month_text,
+                                                navigation_filter_part,
+                                                self._make_month_payload(*self._clamp_year_month(previous_year,
+                                                                                                 current_month,
+                                                                                                 months_range),
+                                                                         selected_dates))
+        if (last_year_month is not None) and (next_year > last_year_month[0]):
+            next_button = self._make_pass_button(self._NEXT_MONTH_PASS_POSITION)
+        else:
+            next_button = self._make_button(self._formatter.next_month_text,
+                                            navigation_filter_part,
+                                            self._make_month_payload(*self._clamp_year_month(next_year, current_month,
+                                                                                             months_range),
+                                                                     selected_dates))
+
+        rows = [(header_button,)]
+        for row_buttons in helpers.slice_list(buttons, row_width):
+            rows.append(tuple(row_buttons))
+        rows.append((previous_button, next_button))
+
+        return MarkupIR(rows)
+
+    def _materialize_view(self, markup_ir: MarkupIR, view: str, year: int, month: int,
+                          selected_dates: Optional[Collection[datetimelib.date]],
+                          edge_start_date: Optional[datetimelib.date],
+                          edge_end_date: Optional[datetimelib.date],
+                          with_fingerprint: bool):
+
+        markup = self._markup_adapter.materialize(markup_ir)
+        if not with_fingerprint:
+            return markup
+
+        selection_key = self._make_selection_key(year, month, selected_dates) if self._stateless else None
+        return markup, helpers.make_fingerprint((type(self).__name__, view, year, month, selection_key,
+                                                 edge_start_date, edge_end_date))
+
+    def _build_markup_ir(self, *, header_button: ButtonIR, month_buttons: List[ButtonIR],
+                         previous_month_button: ButtonIR, next_month_button: ButtonIR,
+                         reset_button: ButtonIR, confirm_button: ButtonIR,
+                         days_of_week_buttons: Optional[Sequence[ButtonIR]] = None) -> MarkupIR:
+
+        rows = [(header_button,)]
         if days_of_week_buttons is not None:
-            markup.row(*days_of_week_buttons)
+            rows.append(tuple(days_of_week_buttons))
         for dates_row_buttons in helpers.slice_list(month_buttons, self._DAYS_IN_WEEK_QUANTITY):
-            markup.row(*dates_row_buttons)
-        markup.row(previous_month_button, next_month_button)
-        markup.row(reset_button, confirm_button)
+            rows.append(tuple(dates_row_buttons))
+        rows.append((previous_month_button, next_month_button))
+        rows.append((reset_button, confirm_button))
 
-        return markup
+        return MarkupIR(rows)
 
     def _make_button(self, text: str, filter_part: Union[str, int],
-                     data: Union[str, list, None] = None):
+                     data: Union[str, list, None] = None) -> ButtonIR:
 
-        return self._button_class(
-            text=text,
-            callback_data=self._callback_data_build_func(filter_part, data)
-        )
+        if self._render_observer is None:
+            callback_data = self._callback_data_build_func(filter_part, data)
+        else:
+            started_at = time.perf_counter()
+            callback_data = self._callback_data_build_func(filter_part, data)
+            self._observe_stage(self._render_observer, "callback_data_build_func", started_at)
+        if self._stateless and (len(callback_data.encode("UTF-8")) > self._CALLBACK_DATA_MAX_SIZE):
+            raise exceptions.CallbackDataSizeError(f"callback data '{callback_data}' is longer than "
+                                                   f"{self._CALLBACK_DATA_MAX_SIZE} bytes!")
 
-    def _make_pass_button(self, text: str = " "):
+        return text, callback_data
 
-        return self._make_button(text, self._callback_filters_parts_holder.pass_, str(uuid.uuid4()))
+    def _make_pass_button(self, position: str, text: str = " "):
 
-    def _make_header_button(self, year: int, month: int):
+        if self._pass_button_data_func is None:
+            data = position
+        else:
+            data = self._pass_button_data_func(position)
 
-        return self._make_pass_button(self._formatter.header_template.format(
-            current_month=self._formatter.months_mapping[month],
-            current_year=year)
-        )
+        return self._make_button(text, self._callback_filters_parts_holder.pass_, data)
 
-    @functools.lru_cache(maxsize=1)
-    def _make_days_of_week_buttons(self):
+    def _make_cell_pass_button(self, index: int, text: str = " "):
 
-        return [self._make_pass_button(i) for i in self._formatter.days_of_week]
+        return self._make_pass_button(self._MONTH_CELLS_PASS_POSITIONS[index], text)
 
-    def _get_month_cells(self, year: int, month: int) -> List[Optional[datetimelib.date]]:
+    def _make_header_button(self, year: int, month: int,
+                            selected_dates: Optional[Collection[datetimelib.date]] = None):
 
-        matrix = self._calendar.monthdayscalendar(year, month)
-        cells = []
+        text = self._formatter.get_header_text(year, month)
+        if self._callback_filters_parts_holder.show_months is None:
+            return self._make_pass_button(self._HEADER_PASS_POSITION, text)
 
-        for row in matrix:
-            cells.extend(row)
+        return self._make_button(text,
+                                 self._callback_filters_parts_holder.show_months,
+                                 self._make_month_payload(year, month, selected_dates))
 
-        for index, cell in enumerate(cells):
-            cells.pop(index)
-            if cell == 0:
-                cells.insert(index, None)
-            else:
-                cells.insert(index, datetimelib.date(year, month, cell))
+    def _is_header_selection_dependent(self) -> bool:
+
+        return self._stateless and (self._callback_filters_parts_holder.show_months is not None)
+
+    def _make_days_of_week_buttons(self) -> Tuple[ButtonIR, ...]:
 
-        return cells
+        if self._days_of_week_buttons is None:
+            self._days_of_week_buttons = tuple(
+                self._make_pass_button(position, text)
+                for position, text in zip(self._DAYS_OF_WEEK_PASS_POSITIONS, self._formatter.days_of_week)
+            )
+
+        return self._days_of_week_buttons
+
+    def _get_month_skeleton(self, year: int, month: int) -> MonthSkeleton:
+
+        return get_month_skeleton(year, month, self._formatter.first_day_of_week)
+
+    def _get_month_cells(self, year: int, month: int) -> List[Optional[datetimelib.date]]:
+
+        return list(self._get_month_skeleton(year, month).cells)
 
     @staticmethod
-    def _cut_edges_of_month_cells(current_year: int, current_month: int,
+    def _cut_edges_of_month_cells(month_skeleton: MonthSkeleton,
                                   month_cells: List[Optional[datetimelib.date]],
                                   edge_start_date: Optional[datetimelib.date] = None,
                                   edge_end_date: Optional[datetimelib.date] = None):
 
-        pop_ranges = []
-
         if edge_start_date is not None:
-            if (current_year, current_month) == (edge_start_date.year, edge_start_date.month):
-                start_split_index = month_cells.index(edge_start_date)
-                pop_ranges.append(range(start_split_index))
+            start_split_index = month_skeleton.get_date_offset(edge_start_date)
+            if start_split_index is not None:
+                month_cells[:start_split_index] = [None] * start_split_index
         if edge_end_date is not None:
-            if (current_year, current_month) == (edge_end_date.year, edge_end_date.month):
-                end_split_index = month_cells.index(edge_end_date)
-                pop_ranges.append(range(end_split_index + 1, len(month_cells)))
+            end_split_index = month_skeleton.get_date_offset(edge_end_date)
+            if end_split_index is not None:
+                month_cells[end_split_index + 1:] = [None] * (len(month_cells) - end_split_index - 1)
+
+    def _cut_disabled_month_cells(self, month_skeleton: MonthSkeleton, month_cells: List[Optional[datetimelib.date]]):
+
+        self._cut_month_cells_by_mask(month_skeleton, month_cells,
+                                      self._disabled_dates.get_month_mask(month_skeleton.year, month_skeleton.month))
+
+    def _cut_unavailable_month_cells(self, year: int, month: int, month_cells: List[Optional[datetimelib.date]],
+                                     availability: MonthAvailability):
+
+        self._cut_month_cells_by_mask(self._get_month_skeleton(year, month), month_cells,
+                                      availability.unavailable_mask)
+
+    @staticmethod
+    def _cut_month_cells_by_mask(month_skeleton: MonthSkeleton, month_cells: List[Optional[datetimelib.date]],
+                                 mask: int):
+
+        mask &= (1 << month_skeleton.days_quantity) - 1
+        index = month_skeleton.first_day_offset
+        while mask:
+            if mask & 1:
+                month_cells[index] = None
+            mask >>= 1
+            index += 1
+
+    def _annotate_month_buttons(self, year: int, month: int, month_cells: List[Optional[datetimelib.date]],
+                                month_buttons: List[ButtonIR], availability: MonthAvailability):
+
+        month_skeleton = self._get_month_skeleton(year, month)
+        for day, text in availability.texts.items():
+            if day > month_skeleton.days_quantity:
+                continue
+            index = month_skeleton.get_day_offset(day)
+            button_text, callback_data = month_buttons[index]
+            if (month_cells[index] is not None) and (button_text == self._formatter.days_texts[day]):
+                month_buttons[index] = (text, callback_data)
+
+    def _get_months_range(self, selected_dates: Optional[Collection[datetimelib.date]],
+                          edge_start_date: Optional[datetimelib.date] = None,
+                          edge_end_date: Optional[datetimelib.date] = None) -> MonthsRange:
+
+        first_year_month = None if edge_start_date is None else (edge_start_date.year, edge_start_date.month)
+        last_year_month = None if edge_end_date is None else (edge_end_date.year, edge_end_date.month)
+
+        return first_year_month, last_year_month
+
+    @staticmethod
+    def _clamp_year_month(year: int, month: int, months_range: MonthsRange) -> Tuple[int, int]:
+
+        first_year_month, last_year_month = months_range
+        if (first_year_month is not None) and ((year, month) < first_year_month):
+            return first_year_month
+        if (last_year_month is not None) and ((year, month) > last_year_month):
+            return last_year_month
+
+        return year, month
+
+    def _is_month_selectable(self, year: int, month: int, months_range: MonthsRange) -> bool:
+
+        if self._clamp_year_month(year, month, months_range) != (year, month):
+            return False
 
-        for range_ in pop_ranges:
-            for i in range_:
-                month_cells.pop(i)
-                month_cells.insert(i, None)
+        return not self.is_month_disabled(year, month)
 
-    def _make_previous_month_button(self, current_year: int, current_month: int):
+    def _make_navigation_buttons(self, current_year: int, current_month: int,
+                                 selected_dates: Optional[Collection[datetimelib.date]],
+                                 edge_start_date: Optional[datetimelib.date] = None,
+                                 edge_end_date: Optional[datetimelib.date] = None) -> Tuple[Any, Any]:
+
+        first_year_month, last_year_month = self._get_months_range(selected_dates, edge_start_date, edge_end_date)
+        current_year_month = (current_year, current_month)
+
+        if (first_year_month is not None) and (current_year_month <= first_year_month):
+            previous_month_button = self._make_pass_button(self._PREVIOUS_MONTH_PASS_POSITION)
+        else:
+            previous_month_button = self._make_previous_month_button(current_year, current_month, selected_dates)
+        if (last_year_month is not None) and (current_year_month >= last_year_month):
+            next_month_button = self._make_pass_button(self._NEXT_MONTH_PASS_POSITION)
+        else:
+            next_month_button = self._make_next_month_button(current_year, current_month, selected_dates)
+
+        return previous_month_button, next_month_button
+
+    def _make_month_payload(self, year: int, month: int,
+                            selected_dates: Optional[Collection[datetimelib.date]] = None) -> Union[str, list]:
+
+        if self._stateless:
+            return self._encode_state(year, month, selected_dates)
+
+        return self._callback_data_codec.encode_month(year, month)
+
+    def _make_previous_month_button(self, current_year: int, current_month: int,
+                                    selected_dates: Optional[Collection[datetimelib.date]] = None):
 
         return self._make_button(self._formatter.previous_month_text,
                                  self._callback_filters_parts_holder.previous_month,
-                                 list(helpers.make_offset_previous_month(current_year, current_month)))
+                                 self._make_month_payload(*helpers.make_offset_previous_month(current_year,
+                                                                                              current_month),
+                                                          selected_dates))
 
-    def _make_next_month_button(self, current_year: int, current_month: int):
+    def _make_next_month_button(self, current_year: int, current_month: int,
+                                selected_dates: Optional[Collection[datetimelib.date]] = None):
 
         return self._make_button(self._formatter.next_month_text,
                                  self._callback_filters_parts_holder.next_month,
-                                 list(helpers.make_offset_next_month(current_year, current_month)))
+                                 self._make_month_payload(*helpers.make_offset_next_month(current_year,
+                                                                                          current_month),
+                                                          selected_dates))
+
+
+def _get_qualified_name(obj: Any) -> Optional[str]:
+
+    if obj is None:
+        return None
+
+    return f"{getattr(obj, '__module__', None)}.{getattr(obj, '__qualname__', type(obj).__qualname__)}"
+
+
+def _render_states_markups_ir(calendar: BaseCalendar, states: List[Any],
+                              edge_start_date: Optional[datetimelib.date] = None,
+                              edge_end_date: Optional[datetimelib.date] = None) -> List[MarkupIR]:
+
+    return calendar._render_states_markups_ir(states, edge_start_date=edge_start_date, edge_end_date=edge_end_date)
@@ -1,5 +1,7 @@
 from typing import Optional, Dict
 import calendar
+import sys
+import types
 
 from tgbotcalendar import exceptions
 
@@ -69,16 +71,23 @@ class BaseFormatter:
                  include_days_of_week: bool = True,
                  first_day_of_week: int = calendar.MONDAY,
                  days_of_week: tuple = ENG_DAYS_OF_WEEK_STARTING_ON_MONDAY,
-                 days_of_week_is_uppercase: bool = False):
+                 days_of_week_is_uppercase: bool = False,
+                 months_header_template: str = "{current_year}",
+                 years_header_template: str = "{start_year} – {end_year}"):
 
         self._check_fields_is_not_empty(header_template, previous_month_text,
                                         next_month_text, reset_text, confirm_text,
+                                        months_header_template, years_header_template,
                                         *days_of_week)
         if months_mapping is not None:
             self._check_fields_is_not_empty(*months_mapping.values())
 
         if any(i not in header_template for i in ("{current_month}", "{current_year}")):
             raise exceptions.FormatterSettingError("date placeholders not found in header template!")
+        if "{current_year}" not in months_header_template:
+            raise exceptions.FormatterSettingError("year placeholder not found in months header template!")
+        if any(i not in years_header_template for i in ("{start_year}", "{end_year}")):
+            raise exceptions.FormatterSettingError("years placeholders not found in years header template!")
 
         if len(days_of_week) != 7:
             raise exceptions.FormatterSettingError("quantity of days in a week should be equal to seven!")
@@ -99,6 +108,8 @@ class BaseFormatter:
                 raise exceptions.FormatterSettingError("the first day of the week starting on Sunday is not Sunday!")
 
         self.header_template = header_template
+        self.months_header_template = months_header_template
+        self.years_header_template = years_header_template
         self.previous_month_text = previous_month_text
         self.next_month_text = next_month_text
         self.reset_text = reset_text
@@ -109,8 +120,82 @@ class BaseFormatter:
         self.first_day_of_week = first_day_of_week
         self.days_of_week = days_of_week if not days_of_week_is_uppercase else tuple((i.upper() for i in days_of_week))
 
+    def compile(self) -> "CompiledFormatter":
+
+        return CompiledFormatter(self)
+
     @staticmethod
     def _check_fields_is_not_empty(*fields):
 
         if any(not i for i in fields):
             raise exceptions.FormatterSettingError("fields for text cannot be empty!")
+
+
+class CompiledFormatter:
+
+    _MAX_DAYS_IN_MONTH_QUANTITY = 31
+    _MAX_CACHED_TEXTS_QUANTITY = 1024
+
+    def __init__(self, formatter: BaseFormatter):
+
+        for name, value in vars(formatter).items():
+            if isinstance(value, dict):
+                value = types.MappingProxyType(dict(value))
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "days_texts",
+                           ("",) + tuple(sys.intern(str(i)) for i in range(1, self._MAX_DAYS_IN_MONTH_QUANTITY + 1)))
+        object.__setattr__(self, "_headers_texts", {})
+        object.__setattr__(self, "_confirm_texts", {})
+
+    def __setattr__(self, name, value):
+
+        raise AttributeError("compiled formatter is immutable!")
+
+    def __delattr__(self, name):
+
+        raise AttributeError("compiled formatter is immutable!")
+
+    def __reduce__(self):
+
+        fields = {k: dict(v) if isinstance(v, types.MappingProxyType) else v
+                  for k, v in vars(self).items() if k not in ("days_texts", "_headers_texts", "_confirm_texts")}
+        return _restore_compiled_formatter, (fields,)
+
+    def compile(self) -> "CompiledFormatter":
+
+        return self
+
+    def get_header_text(self, year: int, month: int) -> str:
+
+        try:
+            return self._headers_texts[(year, month)]
+        except KeyError:
+            text = self.header_template.format(current_month=self.months_mapping[month], current_year=year)
+            if len(self._headers_texts) < self._MAX_CACHED_TEXTS_QUANTITY:
+                self._headers_texts[(year, month)] = text
+            return text
+
+    def get_months_header_text(self, year: int) -> str:
+
+        return self.months_header_template.format(current_year=year)
+
+    def get_years_header_text(self, start_year: int, end_year: int) -> str:
+
+        return self.years_header_template.format(start_year=start_year, end_year=end_year)
+
+    def get_confirm_text(self, selected_dates_quantity: int) -> str:
+
+        try:
+            return self._confirm_texts[selected_dates_quantity]
+        except KeyError:
+            text = f"{self.confirm_text} ({selected_dates_quantity})"
+            if len(self._confirm_texts) < self._MAX_CACHED_TEXTS_QUANTITY:
+                self._confirm_texts[selected_dates_quantity] = text
+            return text
+
+
+def _restore_compiled_formatter(fields: dict) -> CompiledFormatter:
+
+    formatter = BaseFormatter.__new__(BaseFormatter)
+    vars(formatter).update(fields)
+    return CompiledFormatter(formatter)
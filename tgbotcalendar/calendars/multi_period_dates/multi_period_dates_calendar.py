@@ -0,0 +1,252 @@
+import calendar
+import datetime as datetimelib
+from typing import Optional, List, Callable, Union, Tuple, Hashable, Iterable
+
+from tgbotcalendar.calendars.base.base_calendar import BaseCalendar
+from tgbotcalendar.calendars.multi_period_dates.multi_period_dates_formatter import MultiPeriodDatesFormatter
+from tgbotcalendar.calendars.multi_period_dates.multi_period_dates_selection import MultiPeriodDatesSelection
+from tgbotcalendar.calendars.multi_period_dates.multi_period_dates_state import MultiPeriodDatesState
+from tgbotcalendar.utils.callback_data.filters_parts_holder import CallbackFiltersPartsHolder
+from tgbotcalendar.utils.callback_data.codecs import BaseCallbackDataCodec
+from tgbotcalendar.utils.render_cache import RenderCache
+from tgbotcalendar.cache.shared_render_cache import SharedRenderCache
+from tgbotcalendar.utils.instrumentation import RenderObserver
+from tgbotcalendar.utils.disabled_dates_index import DisabledDatesIndex, DisabledDatesValue
+from tgbotcalendar.availability.providers import BaseAvailabilityProvider
+from tgbotcalendar.utils.prefetcher import MonthsPrefetcher
+from tgbotcalendar.markup.adapters import BaseMarkupAdapter
+from tgbotcalendar.utils.selections.dates_period import DatesPeriod
+from tgbotcalendar.utils.selections.dates_periods_index import DatesPeriodsIndex
+
+
+SelectedPeriodValue = Union[DatesPeriod, Tuple[Union[datetimelib.date, str], Union[datetimelib.date, str]]]
+
+
+class MultiPeriodDatesCalendar(BaseCalendar):
+
+    def __init__(self, *, markup_class: Optional[Callable] = None, button_class: Optional[Callable] = None,
+                 formatter: MultiPeriodDatesFormatter,
+                 callback_data_build_func: Callable[[Union[str, int], Union[str, int, list, None]], str],
+                 callback_filters_parts_holder: CallbackFiltersPartsHolder,
+                 pass_button_data_func: Optional[Callable[[str], Union[str, int, list, None]]] = None,
+                 render_cache: Union[RenderCache, SharedRenderCache, None] = None,
+                 callback_data_codec: Optional[BaseCallbackDataCodec] = None,
+                 stateless: bool = False,
+                 markup_adapter: Optional[BaseMarkupAdapter] = None,
+                 render_observer: Optional[RenderObserver] = None,
+                 disabled_dates: Union[DisabledDatesIndex, Iterable[DisabledDatesValue], None] = None,
+                 availability_provider: Optional[BaseAvailabilityProvider] = None,
+                 prefetcher: Optional[MonthsPrefetcher] = None):
+
+        super().__init__(markup_class=markup_class, button_class=button_class,
+                         formatter=formatter, callback_data_build_func=callback_data_build_func,
+                         callback_filters_parts_holder=callback_filters_parts_holder,
+                         pass_button_data_func=pass_button_data_func,
+                         render_cache=render_cache,
+                         callback_data_codec=callback_data_codec,
+                         stateless=stateless,
+                         markup_adapter=markup_adapter,
+                         render_observer=render_observer,
+                         disabled_dates=disabled_dates,
+                         availability_provider=availability_provider,
+                         prefetcher=prefetcher)
+
+    def render_state(self, state: MultiPeriodDatesState, *,
+                     edge_start_date: Optional[datetimelib.date] = None,
+                     edge_end_date: Optional[datetimelib.date] = None,
+                     with_fingerprint: bool = False):
+
+        return self.render_markup(state.year, state.month,
+                                  selected_periods=state.selected_periods,
+                                  pending_start_date=state.pending_start_date,
+                                  edge_start_date=edge_start_date,
+                                  edge_end_date=edge_end_date,
+                                  with_fingerprint=with_fingerprint)
+
+    def decode_state(self, data: list) -> MultiPeriodDatesState:
+
+        month_data, selected_periods_data, pending_start_date_data = data
+        year, month = self._callback_data_codec.decode_month(month_data)
+
+        return MultiPeriodDatesState(
+            year, month,
+            selected_periods=DatesPeriodsIndex.from_compact_string(selected_periods_data),
+            pending_start_date=(self._callback_data_codec.decode_date(pending_start_date_data)
+                                if pending_start_date_data else None)
+        )
+
+    def make_initial_state(self, year: int, month: int) -> MultiPeriodDatesState:
+
+        return MultiPeriodDatesState(year, month)
+
+    def move_state(self, state: MultiPeriodDatesState, year: int, month: int) -> MultiPeriodDatesState:
+
+        return MultiPeriodDatesState(year, month,
+                                     selected_periods=state.selected_periods,
+                                     pending_start_date=state.pending_start_date)
+
+    def select_state_date(self, state: MultiPeriodDatesState, date: datetimelib.date) -> MultiPeriodDatesState:
+
+        next_selection = self._get_state_selected_dates(state).select(date)
+        return MultiPeriodDatesState(state.year, state.month,
+                                     selected_periods=next_selection.selected_periods,
+                                     pending_start_date=next_selection.pending_start_date)
+
+    def reset_state(self, state: MultiPeriodDatesState) -> MultiPeriodDatesState:
+
+        return MultiPeriodDatesState(state.year, state.month)
+
+    def render_markup(self, current_year: int, current_month: int, *,
+                      selected_periods: Union[DatesPeriodsIndex, Iterable[SelectedPeriodValue], None] = None,
+                      pending_start_date: Union[datetimelib.date, str, None] = None,
+                      edge_start_date: Optional[datetimelib.date] = None,
+                      edge_end_date: Optional[datetimelib.date] = None,
+                      with_fingerprint: bool = False):
+
+        return self._render_markup(current_year, current_month,
+                                   selected_dates=self._make_selection(selected_periods, pending_start_date),
+                                   edge_start_date=edge_start_date,
+                                   edge_end_date=edge_end_date,
+                                   with_fingerprint=with_fingerprint)
+
+    async def render_markup_async(self, current_year: int, current_month: int, *,
+                                  selected_periods: Union[DatesPeriodsIndex, Iterable[SelectedPeriodValue],
+                                                          None] = None,
+                                  pending_start_date: Union[datetimelib.date, str, None] = None,
+                                  edge_start_date: Optional[datetimelib.date] = None,
+                                  edge_end_date: Optional[datetimelib.date] = None,
+                                  with_fingerprint: bool = False):
+
+        return await self._render_markup_async(current_year, current_month,
+                                               selected_dates=self._make_selection(selected_periods,
+                                                                                   pending_start_date),
+                                               edge_start_date=edge_start_date,
+                                               edge_end_date=edge_end_date,
+                                               with_fingerprint=with_fingerprint)
+
+    def _make_selection(self, selected_periods: Union[DatesPeriodsIndex, Iterable[SelectedPeriodValue], None],
+                        pending_start_date: Union[datetimelib.date, str, None]) -> MultiPeriodDatesSelection:
+
+        if isinstance(pending_start_date, str):
+            pending_start_date = self._callback_data_codec.decode_date(pending_start_date)
+
+        if (selected_periods is not None) and not isinstance(selected_periods, DatesPeriodsIndex):
+            periods = []
+            for period in selected_periods:
+                if not isinstance(period, DatesPeriod):
+                    start_date, end_date = period
+                    if isinstance(start_date, str):
+                        start_date = self._callback_data_codec.decode_date(start_date)
+                    if isinstance(end_date, str):
+                        end_date = self._callback_data_codec.decode_date(end_date)
+                    period = DatesPeriod(start_date, end_date)
+                periods.append(period)
+            selected_periods = DatesPeriodsIndex(periods)
+
+        return MultiPeriodDatesSelection(selected_periods, pending_start_date)
+
+    def _set_available_month_cells(self, current_year: int, current_month: int,
+                                   month_cells: List[Optional[datetimelib.date]],
+                                   selected_dates: MultiPeriodDatesSelection):
+
+        pass
+
+    def _make_confirm_button(self, current_year: int, current_month: int, selected_dates: MultiPeriodDatesSelection):
+
+        if selected_dates.selected_periods and (selected_dates.pending_start_date is None):
+            data = self._encode_state(current_year, current_month, selected_dates) if self._stateless else None
+            button = self._make_button(self._formatter.get_confirm_text(len(selected_dates)),
+                                       self._callback_filters_parts_holder.confirm,
+                                       data)
+        else:
+            button = self._make_pass_button(self._CONFIRM_PASS_POSITION)
+
+        return button
+
+    def _make_month_buttons(self, current_year: int, current_month: int,
+                            month_cells: List[Optional[datetimelib.date]],
+                            selected_dates: MultiPeriodDatesSelection):
+
+        buttons = []
+        days_texts = {}
+        for first_day, last_day, is_start, is_end in self._get_month_periods_ranges(current_year, current_month,
+                                                                                    selected_dates):
+            for day in range(first_day, last_day + 1):
+                days_texts[day] = self._formatter.selected_period_date
+            days_texts[last_day] = self._formatter.selected_end_date if is_end else "..."
+            days_texts[first_day] = self._formatter.selected_start_date if is_start else "..."
+        pending_start_date = selected_dates.pending_start_date
+        if (pending_start_date is not None) and ((pending_start_date.year, pending_start_date.month) ==
+                                                 (current_year, current_month)):
+            days_texts[pending_start_date.day] = self._formatter.pending_start_date
+
+        for index, cell in enumerate(month_cells):
+            if cell is not None:
+                button_text = days_texts.get(cell.day)
+                if button_text is None:
+                    button_text = self._formatter.days_texts[cell.day]
+                button = self._make_button(button_text, self._callback_filters_parts_holder.select_date,
+                                           self._make_select_date_payload(current_year, current_month,
+                                                                          cell, selected_dates))
+            else:
+                button = self._make_cell_pass_button(index)
+            buttons.append(button)
+
+        return buttons
+
+    def _make_selection_key(self, current_year: int, current_month: int,
+                            selected_dates: MultiPeriodDatesSelection) -> Hashable:
+
+        if self._stateless:
+            return selected_dates
+
+        pending_start_date = selected_dates.pending_start_date
+        pending_start_day = None
+        if (pending_start_date is not None) and ((pending_start_date.year, pending_start_date.month) ==
+                                                 (current_year, current_month)):
+            pending_start_day = pending_start_date.day
+
+        return (self._get_month_periods_ranges(current_year, current_month, selected_dates),
+                pending_start_day, pending_start_date is not None, len(selected_dates))
+
+    def _get_state_selected_dates(self, state: MultiPeriodDatesState) -> MultiPeriodDatesSelection:
+
+        return MultiPeriodDatesSelection(state.selected_periods, state.pending_start_date)
+
+    def _encode_state(self, year: int, month: int, selected_dates: Optional[MultiPeriodDatesSelection]) -> list:
+
+        selected_periods_data = ""
+        pending_start_date_data = ""
+        if selected_dates is not None:
+            selected_periods_data = selected_dates.selected_periods.to_compact_string()
+            if selected_dates.pending_start_date is not None:
+                pending_start_date_data = self._callback_data_codec.encode_date(selected_dates.pending_start_date)
+
+        return [self._callback_data_codec.encode_month(year, month), selected_periods_data, pending_start_date_data]
+
+    def _make_select_date_payload(self, current_year: int, current_month: int, date: datetimelib.date,
+                                  selected_dates: MultiPeriodDatesSelection) -> Union[str, list]:
+
+        if not self._stateless:
+            return self._callback_data_codec.encode_date(date)
+
+        return self._encode_state(current_year, current_month, selected_dates.select(date))
+
+    @staticmethod
+    def _get_month_periods_ranges(current_year: int, current_month: int,
+                                  selected_dates: MultiPeriodDatesSelection) -> Tuple[Tuple[int, int, bool, bool], ...]:
+
+        selected_periods = selected_dates.selected_periods
+        days_ranges = selected_periods.get_month_days_ranges(current_year, current_month)
+        if not days_ranges:
+            return ()
+
+        first_date = datetimelib.date(current_year, current_month, 1)
+        last_date = datetimelib.date(current_year, current_month, calendar.monthrange(current_year, current_month)[1])
+        month_periods_ranges = []
+        for first_day, last_day in days_ranges:
+            is_start = (first_day != 1) or (selected_periods.find(first_date).start_date == first_date)
+            is_end = (last_day != last_date.day) or (selected_periods.find(last_date).end_date == last_date)
+            month_periods_ranges.append((first_day, last_day, is_start, is_end))
+
+        return tuple(month_periods_ranges)
@@ -0,0 +1,53 @@
+import datetime as datetimelib
+from typing import Optional
+
+from tgbotcalendar.utils.selections.dates_periods_index import DatesPeriodsIndex
+
+
+class MultiPeriodDatesSelection:
+
+    __slots__ = ("selected_periods", "pending_start_date")
+
+    def __init__(self, selected_periods: Optional[DatesPeriodsIndex] = None,
+                 pending_start_date: Optional[datetimelib.date] = None):
+
+        self.selected_periods = selected_periods if selected_periods is not None else DatesPeriodsIndex()
+        self.pending_start_date = pending_start_date
+
+    def __repr__(self):
+
+        return (f"{type(self).__name__}(selected_periods={self.selected_periods!r}, "
+                f"pending_start_date={self.pending_start_date!r})")
+
+    def __eq__(self, other):
+
+        if not isinstance(other, MultiPeriodDatesSelection):
+            return NotImplemented
+
+        return (self.selected_periods, self.pending_start_date) == (other.selected_periods, other.pending_start_date)
+
+    def __hash__(self):
+
+        return hash((self.selected_periods, self.pending_start_date))
+
+    def __bool__(self) -> bool:
+
+        return bool(self.selected_periods) or (self.pending_start_date is not None)
+
+    def __len__(self) -> int:
+
+        return len(self.selected_periods)
+
+    def select(self, date: datetimelib.date) -> "MultiPeriodDatesSelection":
+
+        if self.pending_start_date is None:
+            selected_period = self.selected_periods.find(date)
+            if selected_period is not None:
+                return MultiPeriodDatesSelection(self.selected_periods.remove(selected_period.start_date,
+                                                                              selected_period.end_date))
+            return MultiPeriodDatesSelection(self.selected_periods, date)
+
+        if date < self.pending_start_date:
+            return MultiPeriodDatesSelection(self.selected_periods, date)
+
+        return MultiPeriodDatesSelection(self.selected_periods.add(self.pending_start_date, date))
@@ -0,0 +1,52 @@
+import datetime as datetimelib
+from typing import Optional
+
+from tgbotcalendar.utils.selections.dates_periods_index import DatesPeriodsIndex
+from tgbotcalendar.utils import helpers
+
+
+class MultiPeriodDatesState:
+
+    __slots__ = ("year", "month", "selected_periods", "pending_start_date")
+
+    def __init__(self, year: int, month: int, *,
+                 selected_periods: Optional[DatesPeriodsIndex] = None,
+                 pending_start_date: Optional[datetimelib.date] = None):
+
+        self.year = year
+        self.month = month
+        self.selected_periods = selected_periods if selected_periods is not None else DatesPeriodsIndex()
+        self.pending_start_date = pending_start_date
+
+    def __repr__(self):
+
+        return (f"{type(self).__name__}(year={self.year}, month={self.month}, "
+                f"selected_periods={self.selected_periods!r}, pending_start_date={self.pending_start_date!r})")
+
+    def __eq__(self, other):
+
+        if not isinstance(other, MultiPeriodDatesState):
+            return NotImplemented
+
+        return ((self.year, self.month, self.selected_periods, self.pending_start_date) ==
+                (other.year, other.month, other.selected_periods, other.pending_start_date))
+
+    @classmethod
+    def deserialize(cls, data: str) -> "MultiPeriodDatesState":
+
+        month_data, selected_periods_data, pending_start_date_data = data.split(".")
+        year, month = helpers.deserialize_month_compact(month_data)
+
+        return cls(year, month,
+                   selected_periods=DatesPeriodsIndex.from_compact_string(selected_periods_data),
+                   pending_start_date=(helpers.deserialize_date_compact(pending_start_date_data)
+                                       if pending_start_date_data else None))
+
+    def serialize(self) -> str:
+
+        pending_start_date_data = ""
+        if self.pending_start_date is not None:
+            pending_start_date_data = helpers.serialize_date_compact(self.pending_start_date)
+
+        return (f"{helpers.serialize_month_compact(self.year, self.month)}."
+                f"{self.selected_periods.to_compact_string()}.{pending_start_date_data}")
@@ -1,138 +1,303 @@
 import calendar
 import datetime as datetimelib
-from typing import Optional, List, Callable, Union, Tuple, Any
+from typing import Optional, List, Callable, Union, Hashable, Iterable
 
-from tgbotcalendar.calendars.base.base_calendar import BaseCalendar
+from tgbotcalendar.calendars.base.base_calendar import BaseCalendar, MonthsRange
 from tgbotcalendar.calendars.period_dates.period_dates_formatter import PeriodDatesFormatter
+from tgbotcalendar.calendars.period_dates.period_dates_constraints import PeriodDatesConstraints
+from tgbotcalendar.calendars.period_dates.period_dates_state import PeriodDatesState
 from tgbotcalendar.utils.callback_data.filters_parts_holder import CallbackFiltersPartsHolder
-from tgbotcalendar.utils import helpers
+from tgbotcalendar.utils.callback_data.codecs import BaseCallbackDataCodec
+from tgbotcalendar.utils.render_cache import RenderCache
+from tgbotcalendar.cache.shared_render_cache import SharedRenderCache
+from tgbotcalendar.utils.instrumentation import RenderObserver
+from tgbotcalendar.utils.disabled_dates_index import DisabledDatesIndex, DisabledDatesValue
+from tgbotcalendar.availability.providers import BaseAvailabilityProvider
+from tgbotcalendar.utils.prefetcher import MonthsPrefetcher
+from tgbotcalendar.markup.adapters import BaseMarkupAdapter
+from tgbotcalendar.utils.selections.dates_period import DatesPeriod
 
 
 class PeriodDatesCalendar(BaseCalendar):
 
-    def __init__(self, *, markup_class: Callable, button_class: Callable, formatter: PeriodDatesFormatter,
+    def __init__(self, *, markup_class: Optional[Callable] = None, button_class: Optional[Callable] = None,
+                 formatter: PeriodDatesFormatter,
                  callback_data_build_func: Callable[[Union[str, int], Union[str, int, list, None]], str],
-                 callback_filters_parts_holder: CallbackFiltersPartsHolder):
+                 callback_filters_parts_holder: CallbackFiltersPartsHolder,
+                 pass_button_data_func: Optional[Callable[[str], Union[str, int, list, None]]] = None,
+                 render_cache: Union[RenderCache, SharedRenderCache, None] = None,
+                 callback_data_codec: Optional[BaseCallbackDataCodec] = None,
+                 stateless: bool = False,
+                 markup_adapter: Optional[BaseMarkupAdapter] = None,
+                 render_observer: Optional[RenderObserver] = None,
+                 disabled_dates: Union[DisabledDatesIndex, Iterable[DisabledDatesValue], None] = None,
+                 availability_provider: Optional[BaseAvailabilityProvider] = None,
+                 prefetcher: Optional[MonthsPrefetcher] = None,
+                 constraints: Optional[PeriodDatesConstraints] = None):
 
+        self._constraints = constraints
         super().__init__(markup_class=markup_class, button_class=button_class,
                          formatter=formatter, callback_data_build_func=callback_data_build_func,
-                         callback_filters_parts_holder=callback_filters_parts_holder)
+                         callback_filters_parts_holder=callback_filters_parts_holder,
+                         pass_button_data_func=pass_button_data_func,
+                         render_cache=render_cache,
+                         callback_data_codec=callback_data_codec,
+                         stateless=stateless,
+                         markup_adapter=markup_adapter,
+                         render_observer=render_observer,
+                         disabled_dates=disabled_dates,
+                         availability_provider=availability_provider,
+                         prefetcher=prefetcher)
+
+    def render_state(self, state: PeriodDatesState, *,
+                     edge_start_date: Optional[datetimelib.date] = None,
+                     edge_end_date: Optional[datetimelib.date] = None,
+                     with_fingerprint: bool = False):
+
+        return self.render_markup(state.year, state.month,
+                                  selected_start_date=state.selected_start_date,
+                                  selected_end_date=state.selected_end_date,
+                                  edge_start_date=edge_start_date,
+                                  edge_end_date=edge_end_date,
+                                  with_fingerprint=with_fingerprint)
+
+    def decode_state(self, data: list) -> PeriodDatesState:
+
+        month_data, start_date_data, end_date_data = data
+        year, month = self._callback_data_codec.decode_month(month_data)
+
+        return PeriodDatesState(
+            year, month,
+            selected_start_date=self._callback_data_codec.decode_date(start_date_data) if start_date_data else None,
+            selected_end_date=self._callback_data_codec.decode_date(end_date_data) if end_date_data else None
+        )
+
+    def make_initial_state(self, year: int, month: int) -> PeriodDatesState:
+
+        return PeriodDatesState(year, month)
+
+    def move_state(self, state: PeriodDatesState, year: int, month: int) -> PeriodDatesState:
+
+        return PeriodDatesState(year, month,
+                                selected_start_date=state.selected_start_date,
+                                selected_end_date=state.selected_end_date)
+
+    def select_state_date(self, state: PeriodDatesState, date: datetimelib.date) -> PeriodDatesState:
+
+        if (state.selected_start_date is None) or (date < state.selected_start_date):
+            if (self._constraints is not None) and (not self._constraints.is_start_date_allowed(date)):
+                return state
+            return PeriodDatesState(state.year, state.month, selected_start_date=date)
+
+        if (self._constraints is not None) and (not self._constraints.is_end_date_allowed(state.selected_start_date,
+                                                                                          date)):
+            return state
+
+        return PeriodDatesState(state.year, state.month,
+                                selected_start_date=state.selected_start_date,
+                                selected_end_date=date)
+
+    def reset_state(self, state: PeriodDatesState) -> PeriodDatesState:
+
+        return PeriodDatesState(state.year, state.month)
 
     def render_markup(self, current_year: int, current_month: int, *,
                       selected_start_date: Union[datetimelib.date, str, None] = None,
                       selected_end_date: Union[datetimelib.date, str, None] = None,
                       edge_start_date: Optional[datetimelib.date] = None,
-                      edge_end_date: Optional[datetimelib.date] = None):
+                      edge_end_date: Optional[datetimelib.date] = None,
+                      with_fingerprint: bool = False):
+
+        return self._render_markup(current_year, current_month,
+                                   selected_dates=self._make_selected_period(selected_start_date, selected_end_date),
+                                   edge_start_date=edge_start_date,
+                                   edge_end_date=edge_end_date,
+                                   with_fingerprint=with_fingerprint)
+
+    async def render_markup_async(self, current_year: int, current_month: int, *,
+                                  selected_start_date: Union[datetimelib.date, str, None] = None,
+                                  selected_end_date: Union[datetimelib.date, str, None] = None,
+                                  edge_start_date: Optional[datetimelib.date] = None,
+                                  edge_end_date: Optional[datetimelib.date] = None,
+                                  with_fingerprint: bool = False):
+
+        selected_period = self._make_selected_period(selected_start_date, selected_end_date)
+        return await self._render_markup_async(current_year, current_month,
+                                               selected_dates=selected_period,
+                                               edge_start_date=edge_start_date,
+                                               edge_end_date=edge_end_date,
+                                               with_fingerprint=with_fingerprint)
+
+    def _make_selected_period(self, selected_start_date: Union[datetimelib.date, str, None],
+                              selected_end_date: Union[datetimelib.date, str, None]) -> Optional[DatesPeriod]:
 
         if isinstance(selected_start_date, str):
-            selected_start_date = helpers.deserialize_date(selected_start_date)
+            selected_start_date = self._callback_data_codec.decode_date(selected_start_date)
         if isinstance(selected_end_date, str):
-            selected_end_date = helpers.deserialize_date(selected_end_date)
+            selected_end_date = self._callback_data_codec.decode_date(selected_end_date)
 
-        selected_dates = []
-        if selected_start_date is not None:
-            if selected_end_date is None:
-                selected_dates.append(selected_start_date)
-            else:
-                if selected_start_date > selected_end_date:
-                    raise ValueError("selected start date can't be later than selected end date!")
-                period_dates = helpers.get_period_dates(selected_start_date, selected_end_date)
-                selected_dates.extend(period_dates)
+        if selected_start_date is None:
+            return None
 
-        return self._render_markup(current_year, current_month,
-                                   selected_dates=selected_dates,
-                                   edge_start_date=edge_start_date,
-                                   edge_end_date=edge_end_date)
+        return DatesPeriod(selected_start_date, selected_end_date)
 
     def _set_available_month_cells(self, current_year: int, current_month: int,
                                    month_cells: List[Optional[datetimelib.date]],
-                                   selected_dates: List[datetimelib.date]):
+                                   selected_dates: Optional[DatesPeriod]):
 
-        excess_cells = []
-        month_dates = [i for i in month_cells if i is not None]
-        current_year_month = (current_year, current_month)
+        if selected_dates is None:
+            if self._constraints is not None:
+                for index, cell in enumerate(month_cells):
+                    if (cell is not None) and (not self._constraints.is_start_date_allowed(cell)):
+                        month_cells[index] = None
+            return
 
-        if selected_dates:
-            start_date = selected_dates[0]
-            if current_year_month == (start_date.year, start_date.month):
-                start_index = month_dates.index(start_date)
-                excess_cells.extend(month_dates[:start_index])
-        if len(selected_dates) > 1:
-            end_date = selected_dates[-1]
-            if current_year_month == (end_date.year, end_date.month):
-                end_index = month_dates.index(end_date)
-                excess_cells.extend(month_dates[end_index + 1:])
+        current_year_month = (current_year, current_month)
+        start_date = selected_dates.start_date
+        end_date = selected_dates.end_date
+        is_start_month = current_year_month == (start_date.year, start_date.month)
+        is_end_month = selected_dates.is_closed and (current_year_month == (end_date.year, end_date.month))
 
         for index, cell in enumerate(month_cells):
-            if (cell is not None) and (cell in excess_cells):
-                month_cells[index] = None
+            if cell is not None:
+                if (is_start_month and (cell < start_date)) or (is_end_month and (cell > end_date)):
+                    month_cells[index] = None
+
+        if (self._constraints is not None) and (not selected_dates.is_closed):
+            min_end_ordinal, max_end_ordinal = self._constraints.get_end_ordinals_range(start_date)
+            for index, cell in enumerate(month_cells):
+                if (cell is not None) and (cell != start_date):
+                    ordinal = cell.toordinal()
+                    if (ordinal < min_end_ordinal) or ((max_end_ordinal is not None) and (ordinal > max_end_ordinal)):
+                        month_cells[index] = None
 
-    def _make_confirm_button(self, selected_dates: List[datetimelib.date]):
+    def _make_confirm_button(self, current_year: int, current_month: int, selected_dates: Optional[DatesPeriod]):
 
-        if len(selected_dates) > 1:
-            button = self._make_button(f"{self._formatter.confirm_text} ({len(selected_dates)})",
-                                       self._callback_filters_parts_holder.confirm)
+        if (selected_dates is not None) and selected_dates.is_closed:
+            data = self._encode_state(current_year, current_month, selected_dates) if self._stateless else None
+            button = self._make_button(self._formatter.get_confirm_text(len(selected_dates)),
+                                       self._callback_filters_parts_holder.confirm,
+                                       data)
         else:
-            button = self._make_pass_button()
+            button = self._make_pass_button(self._CONFIRM_PASS_POSITION)
 
         return button
 
-    def _make_navigation_buttons(self, current_year: int, current_month: int,
-                                 selected_dates: List[datetimelib.date],
-                                 edge_start_date: Optional[datetimelib.date] = None,
-                                 edge_end_date: Optional[datetimelib.date] = None) -> Tuple[Any, Any]:
+    def _get_months_range(self, selected_dates: Optional[DatesPeriod],
+                          edge_start_date: Optional[datetimelib.date] = None,
+                          edge_end_date: Optional[datetimelib.date] = None) -> MonthsRange:
 
-        previous_month_button = None
-        next_month_button = None
-        current_year_month = (current_year, current_month)
+        first_year_month, last_year_month = super()._get_months_range(selected_dates, edge_start_date, edge_end_date)
+        if selected_dates is None:
+            return first_year_month, last_year_month
+
+        start_date = selected_dates.start_date
+        start_year_month = (start_date.year, start_date.month)
+        if (first_year_month is None) or (start_year_month > first_year_month):
+            first_year_month = start_year_month
 
-        if edge_start_date is not None:
-            if current_year_month == (edge_start_date.year, edge_start_date.month):
-                previous_month_button = self._make_pass_button()
-        if selected_dates:
-            start_date = selected_dates[0]
-            if current_year_month == (start_date.year, start_date.month):
-                previous_month_button = self._make_pass_button()
-
-        if edge_end_date is not None:
-            if current_year_month == (edge_end_date.year, edge_end_date.month):
-                next_month_button = self._make_pass_button()
-        if len(selected_dates) > 1:
-            end_date = selected_dates[-1]
-            if current_year_month == (end_date.year, end_date.month):
-                next_month_button = self._make_pass_button()
-
-        if previous_month_button is None:
-            previous_month_button = self._make_previous_month_button(current_year, current_month)
-        if next_month_button is None:
-            next_month_button = self._make_next_month_button(current_year, current_month)
-
-        return previous_month_button, next_month_button
+        end_date = None
+        if selected_dates.is_closed:
+            end_date = selected_dates.end_date
+        elif self._constraints is not None:
+            _, max_end_ordinal = self._constraints.get_end_ordinals_range(start_date)
+            if max_end_ordinal is not None:
+                end_date = datetimelib.date.fromordinal(max_end_ordinal)
+        if end_date is not None:
+            end_year_month = (end_date.year, end_date.month)
+            if (last_year_month is None) or (end_year_month < last_year_month):
+                last_year_month = end_year_month
+
+        return first_year_month, last_year_month
 
     def _make_month_buttons(self, current_year: int, current_month: int,
                             month_cells: List[Optional[datetimelib.date]],
-                            selected_dates: List[datetimelib.date]):
+                            selected_dates: Optional[DatesPeriod]):
 
         buttons = []
+        selected_days_range = None
+        if selected_dates is not None:
+            selected_days_range = selected_dates.get_month_days_range(current_year, current_month)
+        month_edge_days = (1, calendar.monthrange(current_year, current_month)[1])
 
-        for cell in month_cells:
+        for index, cell in enumerate(month_cells):
             if cell is not None:
-                if cell in selected_dates:
-                    if cell == selected_dates[0]:
+                if (selected_days_range is not None) and (selected_days_range[0] <= cell.day <= selected_days_range[1]):
+                    if cell == selected_dates.start_date:
                         button_text = self._formatter.selected_start_date
-                    elif (len(selected_dates) > 1) and (cell == selected_dates[-1]):
+                    elif selected_dates.is_closed and (cell == selected_dates.end_date):
                         button_text = self._formatter.selected_end_date
-                    elif cell.day in (1, calendar.monthrange(current_year, current_month)[1]):
+                    elif cell.day in month_edge_days:
                         button_text = "..."
                     else:
                         button_text = self._formatter.selected_period_date
-                    button = self._make_pass_button(button_text)
+                    button = self._make_cell_pass_button(index, button_text)
                 else:
-                    button_text = str(cell.day)
+                    button_text = self._formatter.days_texts[cell.day]
                     button = self._make_button(button_text, self._callback_filters_parts_holder.select_date,
-                                               helpers.serialize_date(cell))
+                                               self._make_select_date_payload(current_year, current_month,
+                                                                              cell, selected_dates))
             else:
-                button = self._make_pass_button()
+                button = self._make_cell_pass_button(index)
             buttons.append(button)
 
         return buttons
+
+    def _make_selection_key(self, current_year: int, current_month: int,
+                            selected_dates: Optional[DatesPeriod]) -> Hashable:
+
+        if selected_dates is None:
+            return None
+        if self._stateless:
+            return selected_dates.start_date, selected_dates.end_date
+
+        current_year_month = (current_year, current_month)
+        start_date = selected_dates.start_date
+        end_date = selected_dates.end_date
+        is_start_month = current_year_month == (start_date.year, start_date.month)
+        is_end_month = selected_dates.is_closed and (current_year_month == (end_date.year, end_date.month))
+
+        if (self._constraints is not None) and (not selected_dates.is_closed):
+            return start_date
+
+        return (selected_dates.get_month_days_range(current_year, current_month),
+                is_start_month, is_end_month, len(selected_dates) if selected_dates.is_closed else 1)
+
+    def _get_cache_config(self) -> Hashable:
+
+        return self._constraints
+
+    def _get_state_selected_dates(self, state: PeriodDatesState) -> Optional[DatesPeriod]:
+
+        if state.selected_start_date is None:
+            return None
+
+        return DatesPeriod(state.selected_start_date, state.selected_end_date)
+
+    def _encode_state(self, year: int, month: int, selected_dates: Optional[DatesPeriod]) -> list:
+
+        start_date_data = ""
+        end_date_data = ""
+        if selected_dates is not None:
+            start_date_data = self._callback_data_codec.encode_date(selected_dates.start_date)
+            if selected_dates.is_closed:
+                end_date_data = self._callback_data_codec.encode_date(selected_dates.end_date)
+
+        return [self._callback_data_codec.encode_month(year, month), start_date_data, end_date_data]
+
+    def _make_select_date_payload(self, current_year: int, current_month: int, date: datetimelib.date,
+                                  selected_dates: Optional[DatesPeriod]) -> Union[str, list]:
+
+        if not self._stateless:
+            return self._callback_data_codec.encode_date(date)
+
+        if selected_dates is None:
+            state = PeriodDatesState(current_year, current_month)
+        else:
+            state = PeriodDatesState(current_year, current_month,
+                                     selected_start_date=selected_dates.start_date,
+                                     selected_end_date=selected_dates.end_date if selected_dates.is_closed else None)
+        next_state = self.select_state_date(state, date)
+        next_selected_dates = DatesPeriod(next_state.selected_start_date, next_state.selected_end_date)
+
+        return self._encode_state(current_year, current_month, next_selected_dates)
@@ -0,0 +1,84 @@
+import datetime as datetimelib
+from typing import Optional, Iterable, Tuple
+import calendar
+
+
+class PeriodDatesConstraints:
+
+    __slots__ = ("min_days_quantity", "max_days_quantity", "start_weekdays", "_start_weekdays_mask")
+
+    def __init__(self, *, min_days_quantity: Optional[int] = None, max_days_quantity: Optional[int] = None,
+                 start_weekdays: Optional[Iterable[int]] = None):
+
+        if (min_days_quantity is not None) and (min_days_quantity < 1):
+            raise ValueError("minimum days quantity must be positive!")
+        if (max_days_quantity is not None) and (max_days_quantity < max(min_days_quantity or 1, 2)):
+            raise ValueError("maximum days quantity must be at least two and not less than minimum!")
+
+        start_weekdays_mask = None
+        if start_weekdays is not None:
+            start_weekdays = tuple(sorted(set(start_weekdays)))
+            if not start_weekdays:
+                raise ValueError("start weekdays can't be empty!")
+            start_weekdays_mask = 0
+            for weekday in start_weekdays:
+                if not calendar.MONDAY <= weekday <= calendar.SUNDAY:
+                    raise ValueError(f"incorrect weekday '{weekday}'!")
+                start_weekdays_mask |= 1 << weekday
+
+        object.__setattr__(self, "min_days_quantity", min_days_quantity)
+        object.__setattr__(self, "max_days_quantity", max_days_quantity)
+        object.__setattr__(self, "start_weekdays", start_weekdays)
+        object.__setattr__(self, "_start_weekdays_mask", start_weekdays_mask)
+
+    def __setattr__(self, key, value):
+
+        raise AttributeError(f"'{type(self).__name__}' object is immutable!")
+
+    def __reduce__(self):
+
+        return _restore_period_dates_constraints, (self.min_days_quantity, self.max_days_quantity, self.start_weekdays)
+
+    def __repr__(self):
+
+        return (f"{type(self).__name__}(min_days_quantity={self.min_days_quantity!r}, "
+                f"max_days_quantity={self.max_days_quantity!r}, start_weekdays={self.start_weekdays!r})")
+
+    def __eq__(self, other):
+
+        if not isinstance(other, PeriodDatesConstraints):
+            return NotImplemented
+
+        return ((self.min_days_quantity, self.max_days_quantity, self.start_weekdays) ==
+                (other.min_days_quantity, other.max_days_quantity, other.start_weekdays))
+
+    def __hash__(self):
+
+        return hash((self.min_days_quantity, self.max_days_quantity, self.start_weekdays))
+
+    def is_start_date_allowed(self, date: datetimelib.date) -> bool:
+
+        return (self._start_weekdays_mask is None) or bool((self._start_weekdays_mask >> date.weekday()) & 1)
+
+    def get_end_ordinals_range(self, start_date: datetimelib.date) -> Tuple[int, Optional[int]]:
+
+        start_ordinal = start_date.toordinal()
+        min_end_ordinal = start_ordinal + max((self.min_days_quantity or 2) - 1, 1)
+        max_end_ordinal = None if self.max_days_quantity is None else start_ordinal + self.max_days_quantity - 1
+
+        return min_end_ordinal, max_end_ordinal
+
+    def is_end_date_allowed(self, start_date: datetimelib.date, date: datetimelib.date) -> bool:
+
+        min_end_ordinal, max_end_ordinal = self.get_end_ordinals_range(start_date)
+        ordinal = date.toordinal()
+
+        return (min_end_ordinal <= ordinal) and ((max_end_ordinal is None) or (ordinal <= max_end_ordinal))
+
+
+def _restore_period_dates_constraints(min_days_quantity: Optional[int], max_days_quantity: Optional[int],
+                                      start_weekdays: Optional[Tuple[int, ...]]) -> PeriodDatesConstraints:
+
+    return PeriodDatesConstraints(min_days_quantity=min_days_quantity,
+                                  max_days_quantity=max_days_quantity,
+                                  start_weekdays=start_weekdays)
@@ -0,0 +1,55 @@
+import datetime as datetimelib
+from typing import Optional
+
+from tgbotcalendar.utils import helpers
+
+
+class PeriodDatesState:
+
+    __slots__ = ("year", "month", "selected_start_date", "selected_end_date")
+
+    def __init__(self, year: int, month: int, *,
+                 selected_start_date: Optional[datetimelib.date] = None,
+                 selected_end_date: Optional[datetimelib.date] = None):
+
+        if (selected_start_date is None) and (selected_end_date is not None):
+            raise ValueError("selected end date can't be set without selected start date!")
+
+        self.year = year
+        self.month = month
+        self.selected_start_date = selected_start_date
+        self.selected_end_date = selected_end_date
+
+    def __repr__(self):
+
+        return (f"{type(self).__name__}(year={self.year}, month={self.month}, "
+                f"selected_start_date={self.selected_start_date!r}, selected_end_date={self.selected_end_date!r})")
+
+    def __eq__(self, other):
+
+        if not isinstance(other, PeriodDatesState):
+            return NotImplemented
+
+        return ((self.year, self.month, self.selected_start_date, self.selected_end_date) ==
+                (other.year, other.month, other.selected_start_date, other.selected_end_date))
+
+    @classmethod
+    def deserialize(cls, data: str) -> "PeriodDatesState":
+
+        month_data, start_date_data, end_date_data = data.split(".")
+        year, month = helpers.deserialize_month_compact(month_data)
+
+        return cls(year, month,
+                   selected_start_date=helpers.deserialize_date_compact(start_date_data) if start_date_data else None,
+                   selected_end_date=helpers.deserialize_date_compact(end_date_data) if end_date_data else None)
+
+    def serialize(self) -> str:
+
+        start_date_data = ""
+        if self.selected_start_date is not None:
+            start_date_data = helpers.serialize_date_compact(self.selected_start_date)
+        end_date_data = ""
+        if self.selected_end_date is not None:
+            end_date_data = helpers.serialize_date_compact(self.selected_end_date)
+
+        return f"{helpers.serialize_month_compact(self.year, self.month)}.{start_date_data}.{end_date_data}"
@@ -1,94 +1,207 @@
 import datetime as datetimelib
-from typing import Optional, List, Callable, Union, Tuple, Any
+from typing import Optional, List, Callable, Union, Hashable, Iterable
 
 from tgbotcalendar.calendars.base.base_calendar import BaseCalendar
 from tgbotcalendar.calendars.specific_dates.specific_dates_formatter import SpecificDatesFormatter
+from tgbotcalendar.calendars.specific_dates.specific_dates_state import SpecificDatesState
 from tgbotcalendar.utils.callback_data.filters_parts_holder import CallbackFiltersPartsHolder
-from tgbotcalendar.utils import helpers
+from tgbotcalendar.utils.callback_data.codecs import BaseCallbackDataCodec
+from tgbotcalendar.utils.render_cache import RenderCache
+from tgbotcalendar.cache.shared_render_cache import SharedRenderCache
+from tgbotcalendar.utils.instrumentation import RenderObserver
+from tgbotcalendar.utils.disabled_dates_index import DisabledDatesIndex, DisabledDatesValue
+from tgbotcalendar.availability.providers import BaseAvailabilityProvider
+from tgbotcalendar.utils.prefetcher import MonthsPrefetcher
+from tgbotcalendar.markup.adapters import BaseMarkupAdapter
+from tgbotcalendar.utils.selections.dates_masks_index import DatesMasksIndex
+from tgbotcalendar.utils.selections.recurrence_rules import BaseRecurrenceRule
+from tgbotcalendar.utils.selections.recurring_dates_index import RecurringDatesIndex, deserialize_selected_dates
+
+
+SelectedDates = Union[DatesMasksIndex, RecurringDatesIndex]
 
 
 class SpecificDatesCalendar(BaseCalendar):
 
-    def __init__(self, *, markup_class: Callable, button_class: Callable, formatter: SpecificDatesFormatter,
+    def __init__(self, *, markup_class: Optional[Callable] = None, button_class: Optional[Callable] = None,
+                 formatter: SpecificDatesFormatter,
                  callback_data_build_func: Callable[[Union[str, int], Union[str, int, list, None]], str],
-                 callback_filters_parts_holder: CallbackFiltersPartsHolder):
+                 callback_filters_parts_holder: CallbackFiltersPartsHolder,
+                 pass_button_data_func: Optional[Callable[[str], Union[str, int, list, None]]] = None,
+                 render_cache: Union[RenderCache, SharedRenderCache, None] = None,
+                 callback_data_codec: Optional[BaseCallbackDataCodec] = None,
+                 stateless: bool = False,
+                 markup_adapter: Optional[BaseMarkupAdapter] = None,
+                 render_observer: Optional[RenderObserver] = None,
+                 disabled_dates: Union[DisabledDatesIndex, Iterable[DisabledDatesValue], None] = None,
+                 availability_provider: Optional[BaseAvailabilityProvider] = None,
+                 prefetcher: Optional[MonthsPrefetcher] = None):
 
         super().__init__(markup_class=markup_class, button_class=button_class,
                          formatter=formatter, callback_data_build_func=callback_data_build_func,
-                         callback_filters_parts_holder=callback_filters_parts_holder)
+                         callback_filters_parts_holder=callback_filters_parts_holder,
+                         pass_button_data_func=pass_button_data_func,
+                         render_cache=render_cache,
+                         callback_data_codec=callback_data_codec,
+                         stateless=stateless,
+                         markup_adapter=markup_adapter,
+                         render_observer=render_observer,
+                         disabled_dates=disabled_dates,
+                         availability_provider=availability_provider,
+                         prefetcher=prefetcher)
+
+    def render_state(self, state: SpecificDatesState, *,
+                     edge_start_date: Optional[datetimelib.date] = None,
+                     edge_end_date: Optional[datetimelib.date] = None,
+                     with_fingerprint: bool = False):
+
+        return self.render_markup(state.year, state.month,
+                                  selected_dates=state.selected_dates,
+                                  edge_start_date=edge_start_date,
+                                  edge_end_date=edge_end_date,
+                                  with_fingerprint=with_fingerprint)
+
+    def decode_state(self, data: list) -> SpecificDatesState:
+
+        month_data, selected_dates_data = data
+        year, month = self._callback_data_codec.decode_month(month_data)
+
+        return SpecificDatesState(year, month, selected_dates=deserialize_selected_dates(selected_dates_data))
+
+    def make_initial_state(self, year: int, month: int) -> SpecificDatesState:
+
+        return SpecificDatesState(year, month)
+
+    def move_state(self, state: SpecificDatesState, year: int, month: int) -> SpecificDatesState:
+
+        return SpecificDatesState(year, month, selected_dates=state.selected_dates)
+
+    def select_state_date(self, state: SpecificDatesState, date: datetimelib.date) -> SpecificDatesState:
+
+        return SpecificDatesState(state.year, state.month, selected_dates=state.selected_dates.toggle(date))
+
+    def reset_state(self, state: SpecificDatesState) -> SpecificDatesState:
+
+        return SpecificDatesState(state.year, state.month)
 
     def render_markup(self, current_year: int, current_month: int, *,
-                      selected_dates: List[Union[datetimelib.date, str]],
+                      selected_dates: Union[List[Union[datetimelib.date, str]], DatesMasksIndex, RecurringDatesIndex],
+                      recurrence_rules: Optional[Iterable[BaseRecurrenceRule]] = None,
+                      excluded_dates: Optional[List[Union[datetimelib.date, str]]] = None,
                       edge_start_date: Optional[datetimelib.date] = None,
-                      edge_end_date: Optional[datetimelib.date] = None):
-
-        deserialized_selected_dates = []
-        for date in selected_dates:
-            if isinstance(date, str):
-                deserialized_date = helpers.deserialize_date(date)
-            else:
-                deserialized_date = date
-            deserialized_selected_dates.append(deserialized_date)
+                      edge_end_date: Optional[datetimelib.date] = None,
+                      with_fingerprint: bool = False):
 
         return self._render_markup(current_year, current_month,
-                                   selected_dates=deserialized_selected_dates,
+                                   selected_dates=self._make_selected_dates_index(selected_dates, recurrence_rules,
+                                                                                  excluded_dates),
                                    edge_start_date=edge_start_date,
-                                   edge_end_date=edge_end_date)
+                                   edge_end_date=edge_end_date,
+                                   with_fingerprint=with_fingerprint)
+
+    async def render_markup_async(self, current_year: int, current_month: int, *,
+                                  selected_dates: Union[List[Union[datetimelib.date, str]], DatesMasksIndex,
+                                                        RecurringDatesIndex],
+                                  recurrence_rules: Optional[Iterable[BaseRecurrenceRule]] = None,
+                                  excluded_dates: Optional[List[Union[datetimelib.date, str]]] = None,
+                                  edge_start_date: Optional[datetimelib.date] = None,
+                                  edge_end_date: Optional[datetimelib.date] = None,
+                                  with_fingerprint: bool = False):
+
+        selected_dates_index = self._make_selected_dates_index(selected_dates, recurrence_rules, excluded_dates)
+        return await self._render_markup_async(current_year, current_month,
+                                               selected_dates=selected_dates_index,
+                                               edge_start_date=edge_start_date,
+                                               edge_end_date=edge_end_date,
+                                               with_fingerprint=with_fingerprint)
+
+    def _make_selected_dates_index(self, selected_dates: Union[List[Union[datetimelib.date, str]], SelectedDates],
+                                   recurrence_rules: Optional[Iterable[BaseRecurrenceRule]] = None,
+                                   excluded_dates: Optional[List[Union[datetimelib.date, str]]] = None
+                                   ) -> SelectedDates:
+
+        if not isinstance(selected_dates, (DatesMasksIndex, RecurringDatesIndex)):
+            selected_dates = DatesMasksIndex.from_values(selected_dates, self._callback_data_codec.decode_date)
+        if (recurrence_rules is None) and (excluded_dates is None):
+            return selected_dates
+
+        if isinstance(selected_dates, RecurringDatesIndex):
+            rules = selected_dates.rules
+            included_dates = selected_dates.included_dates
+            excluded_dates_index = selected_dates.excluded_dates
+        else:
+            rules = ()
+            included_dates = selected_dates
+            excluded_dates_index = DatesMasksIndex()
+        if recurrence_rules is not None:
+            rules += tuple(recurrence_rules)
+        if excluded_dates is not None:
+            excluded_dates_index = excluded_dates_index.union(
+                DatesMasksIndex.from_values(excluded_dates, self._callback_data_codec.decode_date))
+
+        return RecurringDatesIndex(rules, included_dates=included_dates, excluded_dates=excluded_dates_index)
 
     def _set_available_month_cells(self, current_year: int, current_month: int,
                                    month_cells: List[Optional[datetimelib.date]],
-                                   selected_dates: List[datetimelib.date]):
+                                   selected_dates: SelectedDates):
 
         pass
 
-    def _make_confirm_button(self, selected_dates: List[datetimelib.date]):
+    def _make_confirm_button(self, current_year: int, current_month: int, selected_dates: SelectedDates):
 
         if selected_dates:
-            button = self._make_button(f"{self._formatter.confirm_text} ({len(selected_dates)})",
-                                       self._callback_filters_parts_holder.confirm)
+            data = self._encode_state(current_year, current_month, selected_dates) if self._stateless else None
+            button = self._make_button(self._formatter.get_confirm_text(len(selected_dates)),
+                                       self._callback_filters_parts_holder.confirm,
+                                       data)
         else:
-            button = self._make_pass_button()
+            button = self._make_pass_button(self._CONFIRM_PASS_POSITION)
 
         return button
 
-    def _make_navigation_buttons(self, current_year: int, current_month: int,
-                                 selected_dates: List[datetimelib.date],
-                                 edge_start_date: Optional[datetimelib.date] = None,
-                                 edge_end_date: Optional[datetimelib.date] = None) -> Tuple[Any, Any]:
-
-        previous_month_button = None
-        next_month_button = None
-        current_year_month = (current_year, current_month)
-
-        if edge_start_date is not None:
-            if current_year_month == (edge_start_date.year, edge_start_date.month):
-                previous_month_button = self._make_pass_button()
-        if edge_end_date is not None:
-            if current_year_month == (edge_end_date.year, edge_end_date.month):
-                next_month_button = self._make_pass_button()
-
-        if previous_month_button is None:
-            previous_month_button = self._make_previous_month_button(current_year, current_month)
-        if next_month_button is None:
-            next_month_button = self._make_next_month_button(current_year, current_month)
-
-        return previous_month_button, next_month_button
-
     def _make_month_buttons(self, current_year: int, current_month: int,
                             month_cells: List[Optional[datetimelib.date]],
-                            selected_dates: List[datetimelib.date]):
+                            selected_dates: SelectedDates):
 
         buttons = []
-        for cell in month_cells:
+        selected_month_mask = selected_dates.get_month_mask(current_year, current_month)
+
+        for index, cell in enumerate(month_cells):
             if cell is not None:
-                if cell in selected_dates:
+                if (selected_month_mask >> (cell.day - 1)) & 1:
                     button_text = self._formatter.selected_date_text
                 else:
-                    button_text = str(cell.day)
+                    button_text = self._formatter.days_texts[cell.day]
                 button = self._make_button(button_text, self._callback_filters_parts_holder.select_date,
-                                           helpers.serialize_date(cell))
+                                           self._make_select_date_payload(current_year, current_month,
+                                                                          cell, selected_dates))
             else:
-                button = self._make_pass_button()
+                button = self._make_cell_pass_button(index)
             buttons.append(button)
 
         return buttons
+
+    def _make_selection_key(self, current_year: int, current_month: int,
+                            selected_dates: SelectedDates) -> Hashable:
+
+        if self._stateless:
+            return selected_dates
+
+        return selected_dates.get_month_mask(current_year, current_month), len(selected_dates)
+
+    def _get_state_selected_dates(self, state: SpecificDatesState) -> SelectedDates:
+
+        return state.selected_dates
+
+    def _encode_state(self, year: int, month: int, selected_dates: Optional[SelectedDates]) -> list:
+
+        return [self._callback_data_codec.encode_month(year, month),
+                selected_dates.to_compact_string() if selected_dates is not None else ""]
+
+    def _make_select_date_payload(self, current_year: int, current_month: int, date: datetimelib.date,
+                                  selected_dates: SelectedDates) -> Union[str, list]:
+
+        if not self._stateless:
+            return self._callback_data_codec.encode_date(date)
+
+        return self._encode_state(current_year, current_month, selected_dates.toggle(date))
@@ -17,12 +17,16 @@ class SpecificDatesFormatter(BaseFormatter):
                  first_day_of_week: int = calendar.MONDAY,
                  days_of_week: tuple = ENG_DAYS_OF_WEEK_STARTING_ON_MONDAY,
                  days_of_week_is_uppercase: bool = False,
+                 months_header_template: str = "{current_year}",
+                 years_header_template: str = "{start_year} – {end_year}",
                  selected_date_text: str = "✅"):
 
         super().__init__(header_template=header_template, previous_month_text=previous_month_text,
                          next_month_text=next_month_text, reset_text=reset_text, confirm_text=confirm_text,
                          months_mapping=months_mapping, months_is_uppercase=months_is_uppercase,
                          include_days_of_week=include_days_of_week, first_day_of_week=first_day_of_week,
-                         days_of_week=days_of_week, days_of_week_is_uppercase=days_of_week_is_uppercase)
+                         days_of_week=days_of_week, days_of_week_is_uppercase=days_of_week_is_uppercase,
+                         months_header_template=months_header_template,
+                         years_header_template=years_header_template)
         self._check_fields_is_not_empty(selected_date_text)
         self.selected_date_text = selected_date_text
@@ -0,0 +1,40 @@
+from typing import Union
+
+from tgbotcalendar.utils.selections.dates_masks_index import DatesMasksIndex
+from tgbotcalendar.utils.selections.recurring_dates_index import RecurringDatesIndex, deserialize_selected_dates
+from tgbotcalendar.utils import helpers
+
+
+class SpecificDatesState:
+
+    __slots__ = ("year", "month", "selected_dates")
+
+    def __init__(self, year: int, month: int, *,
+                 selected_dates: Union[DatesMasksIndex, RecurringDatesIndex, None] = None):
+
+        self.year = year
+        self.month = month
+        self.selected_dates = selected_dates if selected_dates is not None else DatesMasksIndex()
+
+    def __repr__(self):
+
+        return f"{type(self).__name__}(year={self.year}, month={self.month}, selected_dates={self.selected_dates!r})"
+
+    def __eq__(self, other):
+
+        if not isinstance(other, SpecificDatesState):
+            return NotImplemented
+
+        return (self.year, self.month, self.selected_dates) == (other.year, other.month, other.selected_dates)
+
+    @classmethod
+    def deserialize(cls, data: str) -> "SpecificDatesState":
+
+        month_data, selected_dates_data = data.split(".")
+        year, month = helpers.deserialize_month_compact(month_data)
+
+        return cls(year, month, selected_dates=deserialize_selected_dates(selected_dates_data))
+
+    def serialize(self) -> str:
+
+        return f"{helpers.serialize_month_compact(self.year, self.month)}.{self.selected_dates.to_compact_string()}"
@@ -8,3 +8,13 @@ class ConfigurationError(Exception):
 class FormatterSettingError(Exception):
 
     pass
+
+
+class CallbackDataSizeError(Exception):
+
+    pass
+
+
+class AsyncRenderRequiredError(RuntimeError):
+
+    pass
@@ -0,0 +1,97 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Tuple
+import functools
+import json
+
+from tgbotcalendar.markup.markup_ir import MarkupIR, ButtonIR
+
+
+class BaseMarkupAdapter(ABC):
+
+    @abstractmethod
+    def materialize(self, markup_ir: MarkupIR):
+
+        pass
+
+
+class RowsMarkupAdapter(BaseMarkupAdapter):
+
+    def __init__(self, *, markup_class: Callable, button_class: Callable, row_width: int = 7):
+
+        try:
+            getattr(markup_class, "row")
+        except AttributeError:
+            raise ValueError(f"'{repr(markup_class)}' has no attribute 'row'!")
+
+        self._markup_class = markup_class
+        self._button_class = button_class
+        self._row_width = row_width
+
+    def materialize(self, markup_ir: MarkupIR):
+
+        button_class = self._button_class
+        markup = self._markup_class(row_width=self._row_width)
+        for row in markup_ir.rows:
+            markup.row(*[button_class(text=text, callback_data=callback_data) for text, callback_data in row])
+
+        return markup
+
+
+class InlineKeyboardMarkupAdapter(BaseMarkupAdapter):
+
+    def __init__(self, *, markup_class: Callable, button_class: Callable):
+
+        self._markup_class = markup_class
+        self._button_class = button_class
+
+    def materialize(self, markup_ir: MarkupIR):
+
+        button_class = self._button_class
+        return self._markup_class(inline_keyboard=[
+            [button_class(text=text, callback_data=callback_data) for text, callback_data in row]
+            for row in markup_ir.rows
+        ])
+
+
+class DictMarkupAdapter(BaseMarkupAdapter):
+
+    def materialize(self, markup_ir: MarkupIR) -> dict:
+
+        return {
+            "inline_keyboard": [
+                [{"text": text, "callback_data": callback_data} for text, callback_data in row]
+                for row in markup_ir.rows
+            ]
+        }
+
+
+class JSONMarkupAdapter(BaseMarkupAdapter):
+
+    _MARKUP_START_FRAGMENT = b'{"inline_keyboard":['
+    _MARKUP_END_FRAGMENT = b"]}"
+
+    def __init__(self, *, buttons_cache_size: int = 4096, rows_cache_size: int = 1024):
+
+        self._encode_button = functools.lru_cache(maxsize=buttons_cache_size)(self._encode_button)
+        self._encode_row = functools.lru_cache(maxsize=rows_cache_size)(self._encode_row)
+
+    def materialize(self, markup_ir: MarkupIR) -> bytes:
+
+        encode_row = self._encode_row
+        return b"".join((
+            self._MARKUP_START_FRAGMENT,
+            b",".join([encode_row(row) for row in markup_ir.rows]),
+            self._MARKUP_END_FRAGMENT
+        ))
+
+    def _encode_row(self, row: Tuple[ButtonIR, ...]) -> bytes:
+
+        encode_button = self._encode_button
+        return b"[" + b",".join([encode_button(button) for button in row]) + b"]"
+
+    @staticmethod
+    def _encode_button(button: ButtonIR) -> bytes:
+
+        text, callback_data = button
+        return json.dumps({"text": text, "callback_data": callback_data},
+                          ensure_ascii=False, separators=(",", ":")).encode("UTF-8")
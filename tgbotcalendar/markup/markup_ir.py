@@ -0,0 +1,49 @@
+from typing import Tuple, Iterable, Iterator
+
+
+ButtonIR = Tuple[str, str]
+
+
+class MarkupIR:
+
+    __slots__ = ("rows",)
+
+    def __init__(self, rows: Iterable[Iterable[ButtonIR]]):
+
+        object.__setattr__(self, "rows", tuple(tuple(row) for row in rows))
+
+    def __setattr__(self, key, value):
+
+        raise AttributeError(f"'{type(self).__name__}' object is immutable!")
+
+    def __reduce__(self):
+
+        return type(self), (self.rows,)
+
+    def __repr__(self):
+
+        return f"{type(self).__name__}({self.rows!r})"
+
+    def __eq__(self, other):
+
+        if not isinstance(other, MarkupIR):
+            return NotImplemented
+
+        return self.rows == other.rows
+
+    def __hash__(self):
+
+        return hash(self.rows)
+
+    def __iter__(self) -> Iterator[Tuple[ButtonIR, ...]]:
+
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+
+        return len(self.rows)
+
+    @property
+    def buttons_quantity(self) -> int:
+
+        return sum(len(row) for row in self.rows)
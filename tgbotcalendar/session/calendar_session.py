@@ -0,0 +1,180 @@
+import datetime as datetimelib
+from typing import Optional, Union, Callable, Tuple, Any
+import enum
+
+from tgbotcalendar.calendars.base.base_calendar import BaseCalendar
+
+
+class CalendarEvent(enum.Enum):
+
+    PASS = "pass"
+    MONTH_CHANGED = "month_changed"
+    DATE_SELECTED = "date_selected"
+    RESET = "reset"
+    CONFIRMED = "confirmed"
+    MONTHS_SHOWN = "months_shown"
+    YEARS_SHOWN = "years_shown"
+
+
+class CalendarSession:
+
+    def __init__(self, calendar: BaseCalendar, *,
+                 edge_start_date: Union[datetimelib.date, Callable[[], datetimelib.date], None] = None,
+                 edge_end_date: Union[datetimelib.date, Callable[[], datetimelib.date], None] = None):
+
+        self._calendar = calendar
+        self._edge_start_date = edge_start_date
+        self._edge_end_date = edge_end_date
+
+        filters_parts_holder = calendar.callback_filters_parts_holder
+        self._handlers = {
+            filters_parts_holder.pass_: self._handle_pass,
+            filters_parts_holder.previous_month: self._handle_offset_month,
+            filters_parts_holder.next_month: self._handle_offset_month,
+            filters_parts_holder.select_date: self._handle_select_date,
+            filters_parts_holder.reset: self._handle_reset,
+            filters_parts_holder.confirm: self._handle_confirm
+        }
+        if filters_parts_holder.show_months is not None:
+            self._handlers[filters_parts_holder.show_months] = self._handle_show_months
+            self._handlers[filters_parts_holder.select_month] = self._handle_select_month
+        if filters_parts_holder.show_years is not None:
+            self._handlers[filters_parts_holder.show_years] = self._handle_show_years
+
+    def start(self, year: int, month: int, *, with_fingerprint: bool = False) -> Tuple[Any, Any]:
+
+        state = self._calendar.make_initial_state(year, month)
+        return state, self.render(state, with_fingerprint=with_fingerprint)
+
+    async def start_async(self, year: int, month: int, *, with_fingerprint: bool = False) -> Tuple[Any, Any]:
+
+        state = self._calendar.make_initial_state(year, month)
+        return state, await self.render_async(state, with_fingerprint=with_fingerprint)
+
+    def render(self, state, *, with_fingerprint: bool = False):
+
+        return self._calendar.render_state(state,
+                                           edge_start_date=self._get_edge_date(self._edge_start_date),
+                                           edge_end_date=self._get_edge_date(self._edge_end_date),
+                                           with_fingerprint=with_fingerprint)
+
+    async def render_async(self, state, *, with_fingerprint: bool = False):
+
+        return await self._calendar.render_state_async(state,
+                                                       edge_start_date=self._get_edge_date(self._edge_start_date),
+                                                       edge_end_date=self._get_edge_date(self._edge_end_date),
+                                                       with_fingerprint=with_fingerprint)
+
+    def handle(self, state, filter_part: Union[str, int], payload: Union[str, list, None] = None, *,
+               with_fingerprint: bool = False) -> Tuple[Any, Any, CalendarEvent]:
+
+        next_state, event = self._reduce(state, filter_part, payload)
+        if event in (CalendarEvent.PASS, CalendarEvent.CONFIRMED):
+            markup = None
+        elif event in (CalendarEvent.MONTHS_SHOWN, CalendarEvent.YEARS_SHOWN):
+            markup = self._render_view(next_state, event, with_fingerprint=with_fingerprint)
+        else:
+            markup = self.render(next_state, with_fingerprint=with_fingerprint)
+
+        return next_state, markup, event
+
+    async def handle_async(self, state, filter_part: Union[str, int], payload: Union[str, list, None] = None, *,
+                           with_fingerprint: bool = False) -> Tuple[Any, Any, CalendarEvent]:
+
+        next_state, event = self._reduce(state, filter_part, payload)
+        if event in (CalendarEvent.PASS, CalendarEvent.CONFIRMED):
+            markup = None
+        elif event in (CalendarEvent.MONTHS_SHOWN, CalendarEvent.YEARS_SHOWN):
+            markup = self._render_view(next_state, event, with_fingerprint=with_fingerprint)
+        else:
+            markup = await self.render_async(next_state, with_fingerprint=with_fingerprint)
+
+        return next_state, markup, event
+
+    def _render_view(self, state, event: CalendarEvent, *, with_fingerprint: bool = False):
+
+        if event is CalendarEvent.MONTHS_SHOWN:
+            render_func = self._calendar.render_months_state
+        else:
+            render_func = self._calendar.render_years_state
+
+        return render_func(state,
+                           edge_start_date=self._get_edge_date(self._edge_start_date),
+                           edge_end_date=self._get_edge_date(self._edge_end_date),
+                           with_fingerprint=with_fingerprint)
+
+    def _reduce(self, state, filter_part: Union[str, int],
+                payload: Union[str, list, None]) -> Tuple[Any, CalendarEvent]:
+
+        try:
+            handler = self._handlers[filter_part]
+        except KeyError:
+            raise ValueError(f"unknown callback filter part '{filter_part}'!")
+
+        return handler(state, payload)
+
+    def _handle_pass(self, state, payload: Union[str, list, None]) -> Tuple[Any, CalendarEvent]:
+
+        return state, CalendarEvent.PASS
+
+    def _handle_offset_month(self, state, payload: Union[str, list]) -> Tuple[Any, CalendarEvent]:
+
+        if self._calendar.is_stateless:
+            next_state = self._calendar.decode_state(payload)
+        else:
+            year, month = self._calendar.callback_data_codec.decode_month(payload)
+            next_state = self._calendar.move_state(state, year, month)
+
+        next_state = self._calendar.clamp_state(next_state,
+                                                edge_start_date=self._get_edge_date(self._edge_start_date),
+                                                edge_end_date=self._get_edge_date(self._edge_end_date))
+        return next_state, CalendarEvent.MONTH_CHANGED
+
+    def _handle_select_month(self, state, payload: Union[str, list]) -> Tuple[Any, CalendarEvent]:
+
+        next_state, event = self._handle_offset_month(state, payload)
+        if self._calendar.is_month_disabled(next_state.year, next_state.month):
+            return state, CalendarEvent.PASS
+
+        return next_state, event
+
+    def _handle_show_months(self, state, payload: Union[str, list]) -> Tuple[Any, CalendarEvent]:
+
+        next_state, _ = self._handle_offset_month(state, payload)
+        return next_state, CalendarEvent.MONTHS_SHOWN
+
+    def _handle_show_years(self, state, payload: Union[str, list]) -> Tuple[Any, CalendarEvent]:
+
+        next_state, _ = self._handle_offset_month(state, payload)
+        return next_state, CalendarEvent.YEARS_SHOWN
+
+    def _handle_select_date(self, state, payload: Union[str, list]) -> Tuple[Any, CalendarEvent]:
+
+        if self._calendar.is_stateless:
+            return self._calendar.decode_state(payload), CalendarEvent.DATE_SELECTED
+
+        date = self._calendar.callback_data_codec.decode_date(payload)
+        return self._calendar.select_state_date(state, date), CalendarEvent.DATE_SELECTED
+
+    def _handle_reset(self, state, payload: Union[list, None]) -> Tuple[Any, CalendarEvent]:
+
+        if self._calendar.is_stateless:
+            return self._calendar.decode_state(payload), CalendarEvent.RESET
+
+        return self._calendar.reset_state(state), CalendarEvent.RESET
+
+    def _handle_confirm(self, state, payload: Union[list, None]) -> Tuple[Any, CalendarEvent]:
+
+        if self._calendar.is_stateless:
+            return self._calendar.decode_state(payload), CalendarEvent.CONFIRMED
+
+        return state, CalendarEvent.CONFIRMED
+
+    @staticmethod
+    def _get_edge_date(edge_date: Union[datetimelib.date, Callable[[], datetimelib.date], None]
+                       ) -> Optional[datetimelib.date]:
+
+        if callable(edge_date):
+            return edge_date()
+
+        return edge_date
@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+import datetime as datetimelib
+from typing import Union, Tuple
+
+from tgbotcalendar.utils import helpers
+
+
+class BaseCallbackDataCodec(ABC):
+
+    @abstractmethod
+    def encode_date(self, date: datetimelib.date) -> str:
+
+        pass
+
+    @abstractmethod
+    def decode_date(self, data: str) -> datetimelib.date:
+
+        pass
+
+    @abstractmethod
+    def encode_month(self, year: int, month: int) -> Union[str, list]:
+
+        pass
+
+    @abstractmethod
+    def decode_month(self, data: Union[str, list]) -> Tuple[int, int]:
+
+        pass
+
+
+class DefaultCallbackDataCodec(BaseCallbackDataCodec):
+
+    def encode_date(self, date: datetimelib.date) -> str:
+
+        return helpers.serialize_date(date)
+
+    def decode_date(self, data: str) -> datetimelib.date:
+
+        return helpers.deserialize_date(data)
+
+    def encode_month(self, year: int, month: int) -> list:
+
+        return [year, month]
+
+    def decode_month(self, data: list) -> Tuple[int, int]:
+
+        year, month = data
+        return int(year), int(month)
+
+
+class CompactCallbackDataCodec(BaseCallbackDataCodec):
+
+    def encode_date(self, date: datetimelib.date) -> str:
+
+        return helpers.serialize_date_compact(date)
+
+    def decode_date(self, data: str) -> datetimelib.date:
+
+        return helpers.deserialize_date_compact(data)
+
+    def encode_month(self, year: int, month: int) -> str:
+
+        return helpers.serialize_month_compact(year, month)
+
+    def decode_month(self, data: str) -> Tuple[int, int]:
+
+        return helpers.deserialize_month_compact(data)
@@ -1,11 +1,19 @@
-from typing import Union
+from typing import Union, Optional
 
 
 class CallbackFiltersPartsHolder:
 
     def __init__(self, *, pass_: Union[str, int], previous_month: Union[str, int],
                  next_month: Union[str, int], select_date: Union[str, int],
-                 reset: Union[str, int], confirm: Union[str, int]):
+                 reset: Union[str, int], confirm: Union[str, int],
+                 show_months: Optional[Union[str, int]] = None,
+                 show_years: Optional[Union[str, int]] = None,
+                 select_month: Optional[Union[str, int]] = None):
+
+        if (show_months is None) != (select_month is None):
+            raise ValueError("'show_months' and 'select_month' must be set together!")
+        if (show_years is not None) and (show_months is None):
+            raise ValueError("'show_years' requires 'show_months' and 'select_month'!")
 
         self.pass_ = pass_
         self.previous_month = previous_month
@@ -13,3 +21,6 @@ class CallbackFiltersPartsHolder:
         self.select_date = select_date
         self.reset = reset
         self.confirm = confirm
+        self.show_months = show_months
+        self.show_years = show_years
+        self.select_month = select_month
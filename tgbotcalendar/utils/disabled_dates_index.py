@@ -0,0 +1,119 @@
+import datetime as datetimelib
+from typing import Iterable, Union, Tuple, List
+import bisect
+import calendar
+
+from tgbotcalendar.utils import helpers
+from tgbotcalendar.utils.selections.dates_period import DatesPeriod
+
+
+DateValue = Union[datetimelib.date, str]
+DisabledDatesValue = Union[DateValue, Tuple[DateValue, DateValue], DatesPeriod, int]
+
+MONTHS_MASKS_CACHE_SIZE = 256
+
+
+def _make_date(date: DateValue) -> datetimelib.date:
+
+    if isinstance(date, str):
+        return helpers.deserialize_date(date)
+
+    return date
+
+
+class DisabledDatesIndex:
+
+    __slots__ = ("_starts", "_ends", "_weekdays", "_months_masks")
+
+    def __init__(self, values: Iterable[DisabledDatesValue] = ()):
+
+        intervals = []
+        weekdays = 0
+        for value in values:
+            if isinstance(value, bool):
+                raise ValueError(f"incorrect disabled dates value '{value}'!")
+            elif isinstance(value, int):
+                if not calendar.MONDAY <= value <= calendar.SUNDAY:
+                    raise ValueError(f"incorrect weekday '{value}'!")
+                weekdays |= 1 << value
+            elif isinstance(value, DatesPeriod):
+                intervals.append((value.start_date.toordinal(), value.end_date.toordinal()))
+            elif isinstance(value, (tuple, list)):
+                start_date, end_date = map(_make_date, value)
+                if start_date > end_date:
+                    raise ValueError("disabled start date can't be later than disabled end date!")
+                intervals.append((start_date.toordinal(), end_date.toordinal()))
+            elif isinstance(value, (datetimelib.date, str)):
+                ordinal = _make_date(value).toordinal()
+                intervals.append((ordinal, ordinal))
+            else:
+                raise ValueError(f"incorrect disabled dates value '{value}'!")
+
+        starts = []
+        ends = []
+        for start, end in sorted(intervals):
+            if ends and (start <= ends[-1] + 1):
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        self._starts = tuple(starts)
+        self._ends = tuple(ends)
+        self._weekdays = weekdays
+        self._months_masks = {}
+
+    def __repr__(self):
+
+        return f"{type(self).__name__}(intervals={len(self._starts)}, weekdays={self.weekdays!r})"
+
+    def __bool__(self) -> bool:
+
+        return bool(self._starts) or bool(self._weekdays)
+
+    def __contains__(self, date: datetimelib.date) -> bool:
+
+        if (self._weekdays >> date.weekday()) & 1:
+            return True
+
+        ordinal = date.toordinal()
+        index = bisect.bisect_right(self._starts, ordinal) - 1
+        return (index >= 0) and (ordinal <= self._ends[index])
+
+    @property
+    def intervals(self) -> List[Tuple[datetimelib.date, datetimelib.date]]:
+
+        return [(datetimelib.date.fromordinal(start), datetimelib.date.fromordinal(end))
+                for start, end in zip(self._starts, self._ends)]
+
+    @property
+    def weekdays(self) -> Tuple[int, ...]:
+
+        return tuple(i for i in range(7) if (self._weekdays >> i) & 1)
+
+    def get_month_mask(self, year: int, month: int) -> int:
+
+        try:
+            return self._months_masks[(year, month)]
+        except KeyError:
+            pass
+
+        first_weekday, days_quantity = calendar.monthrange(year, month)
+        first_ordinal = datetimelib.date(year, month, 1).toordinal()
+        last_ordinal = first_ordinal + days_quantity - 1
+
+        mask = helpers.make_weekdays_mask(first_weekday, days_quantity, self._weekdays) if self._weekdays else 0
+        index = max(bisect.bisect_right(self._starts, first_ordinal) - 1, 0)
+        while (index < len(self._starts)) and (self._starts[index] <= last_ordinal):
+            if self._ends[index] >= first_ordinal:
+                start_day = max(self._starts[index], first_ordinal) - first_ordinal
+                end_day = min(self._ends[index], last_ordinal) - first_ordinal
+                mask |= ((1 << (end_day - start_day + 1)) - 1) << start_day
+            index += 1
+
+        if len(self._months_masks) >= MONTHS_MASKS_CACHE_SIZE:
+            self._months_masks.clear()
+        self._months_masks[(year, month)] = mask
+
+        return mask
@@ -1,10 +1,24 @@
 import datetime as datetimelib
-from typing import List, Tuple, Union
+from typing import List, Tuple, Union, Optional, Iterable
+import hashlib
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+FINGERPRINT_SIZE = 8
+BASE36_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+MONTHS_IN_YEAR_QUANTITY = 12
+SERIALIZED_DATE_LENGTH = 10
+NUMPY_MEMBERSHIP_MIN_DATES_QUANTITY = 512
+EPOCH_ORDINAL = datetimelib.date(1970, 1, 1).toordinal()
 
 
 def serialize_date(date: datetimelib.date) -> str:
 
-    return date.strftime(r"%d.%m.%Y")
+    return f"{date.day:02}.{date.month:02}.{date.year}"
 
 
 def deserialize_date(date: str) -> datetimelib.date:
@@ -13,6 +27,83 @@ def deserialize_date(date: str) -> datetimelib.date:
     return datetimelib.date(year, month, day)
 
 
+def encode_base36(number: int) -> str:
+
+    if number < 0:
+        raise ValueError("negative numbers are not supported!")
+
+    digits = []
+    while True:
+        number, remainder = divmod(number, 36)
+        digits.append(BASE36_ALPHABET[remainder])
+        if not number:
+            break
+
+    return "".join(reversed(digits))
+
+
+def decode_base36(number: str) -> int:
+
+    return int(number, 36)
+
+
+def serialize_date_compact(date: datetimelib.date) -> str:
+
+    return encode_base36(date.toordinal())
+
+
+def deserialize_date_compact(date: str) -> datetimelib.date:
+
+    return datetimelib.date.fromordinal(int(date, 36))
+
+
+def serialize_month_compact(year: int, month: int) -> str:
+
+    return encode_base36(year * MONTHS_IN_YEAR_QUANTITY + month - 1)
+
+
+def deserialize_month_compact(month: str) -> Tuple[int, int]:
+
+    year, month_index = divmod(int(month, 36), MONTHS_IN_YEAR_QUANTITY)
+    return year, month_index + 1
+
+
+def encode_varint(number: int, data: bytearray):
+
+    if number < 0:
+        raise ValueError("negative numbers are not supported!")
+
+    while number > 0x7F:
+        data.append((number & 0x7F) | 0x80)
+        number >>= 7
+    data.append(number)
+
+
+def decode_varint(data: bytes, offset: int = 0) -> Tuple[int, int]:
+
+    number = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("truncated varint data!")
+        byte = data[offset]
+        offset += 1
+        number |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return number, offset
+        shift += 7
+
+
+def make_weekdays_mask(first_weekday: int, days_quantity: int, weekdays: int) -> int:
+
+    mask = 0
+    for day in range(days_quantity):
+        if (weekdays >> ((first_weekday + day) % 7)) & 1:
+            mask |= 1 << day
+
+    return mask
+
+
 def make_offset_previous_month(year: int, month: int) -> Tuple[int, int]:
 
     if month == 1:
@@ -59,10 +150,127 @@ def get_period_dates(start_date: Union[datetimelib.date, str],
     if isinstance(end_date, str):
         end_date = deserialize_date(end_date)
 
-    period_dates = []
-    period_date = start_date
-    while period_date <= end_date:
-        period_dates.append(period_date)
-        period_date += datetimelib.timedelta(days=1)
+    from_ordinal = datetimelib.date.fromordinal
+    return [from_ordinal(i) for i in range(start_date.toordinal(), end_date.toordinal() + 1)]
+
+
+def get_period_dates_array(start_date: Union[datetimelib.date, str],
+                           end_date: Union[datetimelib.date, str]) -> "numpy.ndarray":
+
+    if numpy is None:
+        raise ImportError("numpy is required for dates arrays!")
+
+    if isinstance(start_date, str):
+        start_date = deserialize_date(start_date)
+    if isinstance(end_date, str):
+        end_date = deserialize_date(end_date)
+
+    return numpy.arange(start_date, end_date + datetimelib.timedelta(days=1), dtype="datetime64[D]")
+
+
+def serialize_dates(dates: Iterable[datetimelib.date]) -> List[str]:
+
+    if (numpy is None) or not isinstance(dates, numpy.ndarray):
+        return [serialize_date(i) for i in dates]
+
+    dates_array = dates.astype("datetime64[D]")
+    months_array = dates_array.astype("datetime64[M]")
+    years = dates_array.astype("datetime64[Y]").astype(numpy.int64) + 1970
+    if (years < 1000).any():
+        return [serialize_date(i) for i in dates_array.tolist()]
+    months = months_array.astype(numpy.int64) % MONTHS_IN_YEAR_QUANTITY + 1
+    days = (dates_array - months_array).astype(numpy.int64) + 1
+
+    two_digits_numbers = numpy.array([f"{i:02}" for i in range(32)])
+    serialized_dates = numpy.char.add(two_digits_numbers[days], ".")
+    serialized_dates = numpy.char.add(serialized_dates, two_digits_numbers[months])
+    serialized_dates = numpy.char.add(serialized_dates, ".")
+    serialized_dates = numpy.char.add(serialized_dates, years.astype(str))
+
+    return serialized_dates.tolist()
+
+
+def deserialize_dates(dates: Iterable[str]) -> List[datetimelib.date]:
+
+    dates = list(dates)
+    if (numpy is None) or any(len(i) != SERIALIZED_DATE_LENGTH for i in dates):
+        return [deserialize_date(i) for i in dates]
+    if not dates:
+        return []
+
+    characters = numpy.array(dates, dtype=f"U{SERIALIZED_DATE_LENGTH}").view(numpy.uint32)
+    characters = characters.reshape(-1, SERIALIZED_DATE_LENGTH).astype(numpy.int64) - ord("0")
+    digits = characters[:, [0, 1, 3, 4, 6, 7, 8, 9]]
+    separators = characters[:, [2, 5]]
+    if (digits.min() < 0) or (digits.max() > 9) or (separators != ord(".") - ord("0")).any():
+        return [deserialize_date(i) for i in dates]
+
+    days = digits[:, 0] * 10 + digits[:, 1]
+    months = digits[:, 2] * 10 + digits[:, 3]
+    years = digits[:, 4] * 1000 + digits[:, 5] * 100 + digits[:, 6] * 10 + digits[:, 7]
+    if (years < 1).any() or (months < 1).any() or (months > 12).any() or (days < 1).any():
+        raise ValueError("incorrect dates in batch!")
+
+    months_array = ((years - 1970) * MONTHS_IN_YEAR_QUANTITY + months - 1).astype("datetime64[M]")
+    dates_array = months_array + (days - 1).astype("timedelta64[D]")
+    if (dates_array.astype("datetime64[M]") != months_array).any():
+        raise ValueError("incorrect dates in batch!")
+
+    return dates_array.tolist()
+
+
+def get_dates_membership(dates: Iterable[datetimelib.date],
+                         selected_dates: Iterable[datetimelib.date]) -> List[bool]:
+
+    if (numpy is not None) and isinstance(dates, numpy.ndarray):
+        if len(dates) >= NUMPY_MEMBERSHIP_MIN_DATES_QUANTITY:
+            return get_dates_membership_array(dates, selected_dates).tolist()
+        dates = dates.astype("datetime64[D]").tolist()
+    if (numpy is not None) and isinstance(selected_dates, numpy.ndarray):
+        selected_dates = selected_dates.astype("datetime64[D]").tolist()
+    selected_dates = set(selected_dates)
+
+    return [i in selected_dates for i in dates]
+
+
+def get_dates_membership_array(dates: Iterable[datetimelib.date],
+                               selected_dates: Iterable[datetimelib.date]) -> "numpy.ndarray":
+
+    if numpy is None:
+        raise ImportError("numpy is required for dates arrays!")
+
+    return numpy.isin(_get_days_since_epoch(dates), _get_days_since_epoch(selected_dates))
+
+
+def _get_days_since_epoch(dates: Iterable[datetimelib.date]) -> "numpy.ndarray":
+
+    if isinstance(dates, numpy.ndarray):
+        return dates.astype("datetime64[D]", copy=False).view(numpy.int64)
+
+    dates = list(dates)
+    ordinals = numpy.fromiter((i.toordinal() for i in dates), dtype=numpy.int64, count=len(dates))
+
+    return ordinals - EPOCH_ORDINAL
+
+
+def get_canonical_repr(value) -> str:
+
+    if isinstance(value, (tuple, list)):
+        return f"({', '.join(get_canonical_repr(i) for i in value)},)"
+    if isinstance(value, (set, frozenset)):
+        return f"{{{', '.join(sorted(get_canonical_repr(i) for i in value))}}}"
+    if isinstance(value, dict):
+        items = sorted(f"{get_canonical_repr(k)}: {get_canonical_repr(v)}" for k, v in value.items())
+        return f"{{{', '.join(items)}}}"
+
+    return repr(value)
+
+
+def make_fingerprint(state_key: tuple, *, digest_size: int = FINGERPRINT_SIZE) -> str:
+
+    return hashlib.blake2b(get_canonical_repr(state_key).encode("UTF-8"), digest_size=digest_size).hexdigest()
+
+
+def is_markup_modified(fingerprint: str, last_fingerprint: Optional[str]) -> bool:
 
-    return period_dates
+    return fingerprint != last_fingerprint
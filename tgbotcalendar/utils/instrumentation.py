@@ -0,0 +1,123 @@
+from typing import Optional, Dict, Sequence, List
+import bisect
+import threading
+
+
+DEFAULT_DURATION_BOUNDS = (0.000001, 0.000005, 0.00001, 0.00005, 0.0001, 0.0005,
+                           0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+DEFAULT_SIZE_BOUNDS = (1, 2, 4, 8, 16, 24, 32, 48, 64, 96, 128)
+DEFAULT_QUANTITY_BOUNDS = (8, 16, 24, 32, 40, 48, 56, 64)
+
+
+class RenderObserver:
+
+    def on_stage(self, stage: str, duration: float):
+
+        pass
+
+    def on_render(self, buttons_quantity: int, callback_data_sizes: List[int]):
+
+        pass
+
+    def on_cache_lookup(self, is_hit: bool):
+
+        pass
+
+
+class Histogram:
+
+    __slots__ = ("bounds", "counts", "count", "total", "min", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+
+        if list(bounds) != sorted(bounds):
+            raise ValueError("histogram bounds must be sorted!")
+
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value: float):
+
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if (self.min is None) or (value < self.min):
+            self.min = value
+        if (self.max is None) or (value > self.max):
+            self.max = value
+
+    @property
+    def mean(self) -> Optional[float]:
+
+        return self.total / self.count if self.count else None
+
+    def to_dict(self) -> dict:
+
+        return {
+            "bounds": list(self.bounds),
+            "counts": list(self.counts),
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max
+        }
+
+
+class HistogramRenderObserver(RenderObserver):
+
+    def __init__(self, *, duration_bounds: Sequence[float] = DEFAULT_DURATION_BOUNDS,
+                 size_bounds: Sequence[int] = DEFAULT_SIZE_BOUNDS,
+                 quantity_bounds: Sequence[int] = DEFAULT_QUANTITY_BOUNDS):
+
+        self._duration_bounds = tuple(duration_bounds)
+        self._size_bounds = tuple(size_bounds)
+        self._quantity_bounds = tuple(quantity_bounds)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def on_stage(self, stage: str, duration: float):
+
+        with self._lock:
+            histogram = self.stages_durations.get(stage)
+            if histogram is None:
+                histogram = self.stages_durations[stage] = Histogram(self._duration_bounds)
+            histogram.add(duration)
+
+    def on_render(self, buttons_quantity: int, callback_data_sizes: List[int]):
+
+        with self._lock:
+            self.buttons_quantity.add(buttons_quantity)
+            for size in callback_data_sizes:
+                self.callback_data_size.add(size)
+
+    def on_cache_lookup(self, is_hit: bool):
+
+        with self._lock:
+            if is_hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def reset(self):
+
+        with self._lock:
+            self.stages_durations: Dict[str, Histogram] = {}
+            self.buttons_quantity = Histogram(self._quantity_bounds)
+            self.callback_data_size = Histogram(self._size_bounds)
+            self.cache_hits = 0
+            self.cache_misses = 0
+
+    def snapshot(self) -> dict:
+
+        with self._lock:
+            return {
+                "stages_durations": {k: v.to_dict() for k, v in self.stages_durations.items()},
+                "buttons_quantity": self.buttons_quantity.to_dict(),
+                "callback_data_size": self.callback_data_size.to_dict(),
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses
+            }
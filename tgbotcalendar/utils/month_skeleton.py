@@ -0,0 +1,61 @@
+import datetime as datetimelib
+from typing import Optional
+import functools
+import calendar
+
+
+MONTH_SKELETONS_CACHE_SIZE = 128
+
+
+class MonthSkeleton:
+
+    __slots__ = ("year", "month", "first_day_of_week", "cells", "first_day_offset", "last_day_offset")
+
+    def __init__(self, year: int, month: int, first_day_of_week: int):
+
+        leading_cells_quantity = (calendar.weekday(year, month, 1) - first_day_of_week) % 7
+        days_quantity = calendar.monthrange(year, month)[1]
+        cells_quantity = -(-(leading_cells_quantity + days_quantity) // 7) * 7
+        first_ordinal = datetimelib.date(year, month, 1).toordinal()
+
+        cells = [None] * cells_quantity
+        for day in range(days_quantity):
+            cells[leading_cells_quantity + day] = datetimelib.date.fromordinal(first_ordinal + day)
+
+        object.__setattr__(self, "year", year)
+        object.__setattr__(self, "month", month)
+        object.__setattr__(self, "first_day_of_week", first_day_of_week)
+        object.__setattr__(self, "cells", tuple(cells))
+        object.__setattr__(self, "first_day_offset", leading_cells_quantity)
+        object.__setattr__(self, "last_day_offset", leading_cells_quantity + days_quantity - 1)
+
+    def __setattr__(self, key, value):
+
+        raise AttributeError(f"'{type(self).__name__}' object is immutable!")
+
+    def __repr__(self):
+
+        return (f"{type(self).__name__}(year={self.year}, month={self.month}, "
+                f"first_day_of_week={self.first_day_of_week})")
+
+    @property
+    def days_quantity(self) -> int:
+
+        return self.last_day_offset - self.first_day_offset + 1
+
+    def get_day_offset(self, day: int) -> int:
+
+        return self.first_day_offset + day - 1
+
+    def get_date_offset(self, date: datetimelib.date) -> Optional[int]:
+
+        if (date.year, date.month) != (self.year, self.month):
+            return None
+
+        return self.get_day_offset(date.day)
+
+
+@functools.lru_cache(maxsize=MONTH_SKELETONS_CACHE_SIZE)
+def get_month_skeleton(year: int, month: int, first_day_of_week: int) -> MonthSkeleton:
+
+    return MonthSkeleton(year, month, first_day_of_week)
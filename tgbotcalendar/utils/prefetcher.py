@@ -0,0 +1,115 @@
+from typing import Optional, Callable, Awaitable, Hashable, Set
+import concurrent.futures
+import asyncio
+import threading
+import weakref
+
+
+class MonthsPrefetcher:
+
+    def __init__(self, *, max_concurrency: int = 2, max_pending: Optional[int] = None,
+                 executor: Optional[concurrent.futures.Executor] = None):
+
+        if max_concurrency < 1:
+            raise ValueError("prefetch concurrency must be positive!")
+        if max_pending is None:
+            max_pending = max_concurrency * 4
+        elif max_pending < max_concurrency:
+            raise ValueError("prefetch pending limit can't be less than concurrency!")
+
+        self._max_concurrency = max_concurrency
+        self._max_pending = max_pending
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._pending_keys: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._semaphores = weakref.WeakKeyDictionary()
+        self.scheduled = 0
+        self.skipped = 0
+        self.completed = 0
+        self.failed = 0
+
+    @property
+    def pending_quantity(self) -> int:
+
+        return len(self._pending_keys)
+
+    def submit(self, key: Hashable, func: Callable[[], None]) -> bool:
+
+        if not self._reserve(key):
+            return False
+
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_concurrency,
+                                                                           thread_name_prefix="tgbotcalendar-prefetch")
+        self._executor.submit(self._run, key, func)
+
+        return True
+
+    def submit_async(self, key: Hashable, func: Callable[[], Awaitable[None]]) -> bool:
+
+        if not self._reserve(key):
+            return False
+
+        task = asyncio.ensure_future(self._run_async(key, func))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return True
+
+    async def wait(self):
+
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def shutdown(self, *, wait: bool = True):
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _reserve(self, key: Hashable) -> bool:
+
+        with self._lock:
+            if (key in self._pending_keys) or (len(self._pending_keys) >= self._max_pending):
+                self.skipped += 1
+                return False
+            self._pending_keys.add(key)
+            self.scheduled += 1
+
+        return True
+
+    def _release(self, key: Hashable, is_completed: bool):
+
+        with self._lock:
+            self._pending_keys.discard(key)
+            if is_completed:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def _run(self, key: Hashable, func: Callable[[], None]):
+
+        try:
+            func()
+        except Exception:
+            self._release(key, False)
+        else:
+            self._release(key, True)
+
+    async def _run_async(self, key: Hashable, func: Callable[[], Awaitable[None]]):
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+
+        try:
+            async with semaphore:
+                await func()
+        except Exception:
+            self._release(key, False)
+        else:
+            self._release(key, True)
@@ -0,0 +1,99 @@
+from typing import Optional, Hashable, Any
+from collections import OrderedDict
+import threading
+import time
+
+
+class RenderCache:
+
+    is_shared = False
+
+    def __init__(self, *, max_size: int = 1024, ttl: Optional[float] = None):
+
+        if max_size < 1:
+            raise ValueError("cache size must be positive!")
+        if (ttl is not None) and (ttl <= 0):
+            raise ValueError("cache TTL must be positive!")
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.prefetch_hits = 0
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+
+        return self._get_entry(key) is not None
+
+    @property
+    def hit_rate(self) -> float:
+
+        requests_quantity = self.hits + self.misses
+        return self.hits / requests_quantity if requests_quantity else 0.0
+
+    @property
+    def prefetch_hit_rate(self) -> float:
+
+        return self.prefetch_hits / self.prefetched if self.prefetched else 0.0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+
+        entry = self._get_entry(key)
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if entry[2]:
+                self.prefetch_hits += 1
+                if self._entries.get(key) is entry:
+                    self._entries[key] = (entry[0], entry[1], False)
+
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any, *, is_prefetched: bool = False):
+
+        expires_at = None if self._ttl is None else time.monotonic() + self._ttl
+
+        with self._lock:
+            if is_prefetched:
+                self.prefetched += 1
+            self._entries[key] = (expires_at, value, is_prefetched)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.prefetched = 0
+            self.prefetch_hits = 0
+
+    def _get_entry(self, key: Hashable) -> Optional[tuple]:
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if (entry[0] is not None) and (entry[0] <= time.monotonic()):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+
+        return entry
@@ -0,0 +1,303 @@
+import datetime as datetimelib
+from typing import Optional, Dict, Tuple, Iterable, Iterator, Union, Mapping, Callable
+import base64
+import binascii
+import calendar
+import types
+
+from tgbotcalendar.utils import helpers
+
+
+MONTH_MASK_LIMIT = 1 << 31
+PACKED_MASKS_FORMAT = 1
+PACKED_RUNS_FORMAT = 2
+
+
+def _parse_date_string(date: str) -> Tuple[int, int, int]:
+
+    day, month, year = map(int, date.split("."))
+    return year, month, day
+
+
+def _count_mask_days(mask: int) -> int:
+
+    return bin(mask).count("1")
+
+
+def _unpack_masks(data: bytes) -> Dict[Tuple[int, int], int]:
+
+    masks = {}
+    months_quantity, offset = helpers.decode_varint(data, 1)
+    month_index = 0
+    for _ in range(months_quantity):
+        month_index_delta, offset = helpers.decode_varint(data, offset)
+        mask, offset = helpers.decode_varint(data, offset)
+        month_index += month_index_delta
+        year, month_offset = divmod(month_index, helpers.MONTHS_IN_YEAR_QUANTITY)
+        masks[(year, month_offset + 1)] = mask
+    if offset != len(data):
+        raise ValueError("unexpected trailing data!")
+
+    return masks
+
+
+def _unpack_runs(data: bytes) -> Dict[Tuple[int, int], int]:
+
+    masks = {}
+    runs_quantity, offset = helpers.decode_varint(data, 1)
+    ordinal = 0
+    for _ in range(runs_quantity):
+        start_ordinal_delta, offset = helpers.decode_varint(data, offset)
+        length, offset = helpers.decode_varint(data, offset)
+        start_ordinal = ordinal + start_ordinal_delta
+        ordinal = start_ordinal + length
+        while start_ordinal <= ordinal:
+            date = datetimelib.date.fromordinal(start_ordinal)
+            days_quantity = calendar.monthrange(date.year, date.month)[1]
+            end_day = min(days_quantity, date.day + ordinal - start_ordinal)
+            key = (date.year, date.month)
+            masks[key] = masks.get(key, 0) | (((1 << (end_day - date.day + 1)) - 1) << (date.day - 1))
+            start_ordinal += end_day - date.day + 1
+    if offset != len(data):
+        raise ValueError("unexpected trailing data!")
+
+    return masks
+
+
+class DatesMasksIndex:
+
+    __slots__ = ("_masks", "_quantity")
+
+    def __init__(self, masks: Optional[Mapping[Tuple[int, int], int]] = None):
+
+        masks_copy = {}
+        quantity = 0
+
+        if masks is not None:
+            for (year, month), mask in sorted(masks.items()):
+                if not 0 <= mask < MONTH_MASK_LIMIT:
+                    raise ValueError(f"incorrect mask '{mask}' for month {month} of year {year}!")
+                if not 1 <= month <= 12:
+                    raise ValueError(f"incorrect month '{month}'!")
+                if not datetimelib.MINYEAR <= year <= datetimelib.MAXYEAR:
+                    raise ValueError(f"incorrect year '{year}'!")
+                if mask >> calendar.monthrange(year, month)[1]:
+                    raise ValueError(f"incorrect mask '{mask}' for month {month} of year {year}!")
+                if mask:
+                    masks_copy[(year, month)] = mask
+                    quantity += _count_mask_days(mask)
+
+        self._masks = masks_copy
+        self._quantity = quantity
+
+    @classmethod
+    def from_masks(cls, masks: Mapping[Tuple[int, int], int]) -> "DatesMasksIndex":
+
+        return cls(masks)
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[datetimelib.date]) -> "DatesMasksIndex":
+
+        masks = {}
+        for date in dates:
+            key = (date.year, date.month)
+            masks[key] = masks.get(key, 0) | (1 << (date.day - 1))
+
+        return cls(masks)
+
+    @classmethod
+    def from_strings(cls, dates: Iterable[str],
+                     deserialize_func: Optional[Callable[[str], datetimelib.date]] = None) -> "DatesMasksIndex":
+
+        if deserialize_func is not None:
+            return cls.from_dates(map(deserialize_func, dates))
+
+        masks = {}
+        for date in dates:
+            year, month, day = _parse_date_string(date)
+            if (not 1 <= month <= 12) or (not datetimelib.MINYEAR <= year <= datetimelib.MAXYEAR):
+                raise ValueError(f"incorrect date '{date}'!")
+            if not 1 <= day <= calendar.monthrange(year, month)[1]:
+                raise ValueError(f"incorrect date '{date}'!")
+            key = (year, month)
+            masks[key] = masks.get(key, 0) | (1 << (day - 1))
+
+        return cls(masks)
+
+    @classmethod
+    def from_values(cls, dates: Iterable[Union[datetimelib.date, str]],
+                    deserialize_func: Optional[Callable[[str], datetimelib.date]] = None) -> "DatesMasksIndex":
+
+        date_objects = []
+        date_strings = []
+        for date in dates:
+            if isinstance(date, str):
+                date_strings.append(date)
+            else:
+                date_objects.append(date)
+
+        if not date_strings:
+            return cls.from_dates(date_objects)
+        elif not date_objects:
+            return cls.from_strings(date_strings, deserialize_func)
+
+        return cls.from_dates(date_objects).union(cls.from_strings(date_strings, deserialize_func))
+
+    @classmethod
+    def from_string(cls, data: str) -> "DatesMasksIndex":
+
+        masks = {}
+        if data:
+            for part in data.split(","):
+                month_data, mask_data = part.split(":")
+                masks[helpers.deserialize_month_compact(month_data)] = helpers.decode_base36(mask_data)
+
+        return cls(masks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DatesMasksIndex":
+
+        if not data:
+            return cls()
+
+        try:
+            if data[0] == PACKED_MASKS_FORMAT:
+                masks = _unpack_masks(data)
+            elif data[0] == PACKED_RUNS_FORMAT:
+                masks = _unpack_runs(data)
+            else:
+                raise ValueError(f"unknown packed dates format '{data[0]}'!")
+        except (ValueError, OverflowError) as error:
+            raise ValueError(f"incorrect packed dates data: {error}")
+
+        return cls(masks)
+
+    @classmethod
+    def from_base64(cls, data: str) -> "DatesMasksIndex":
+
+        try:
+            packed_data = base64.b64decode(data + "=" * (-len(data) % 4), altchars=b"-_", validate=True)
+        except (ValueError, binascii.Error):
+            raise ValueError(f"incorrect packed dates string '{data}'!")
+
+        return cls.from_bytes(packed_data)
+
+    @classmethod
+    def from_compact_string(cls, data: str) -> "DatesMasksIndex":
+
+        if ":" in data:
+            return cls.from_string(data)
+
+        return cls.from_base64(data)
+
+    def to_bytes(self) -> bytes:
+
+        if not self._masks:
+            return b""
+
+        return min(self._pack_masks(), self._pack_runs(), key=len)
+
+    def to_base64(self) -> str:
+
+        return base64.urlsafe_b64encode(self.to_bytes()).rstrip(b"=").decode("ascii")
+
+    def to_string(self) -> str:
+
+        return ",".join(f"{helpers.serialize_month_compact(year, month)}:{helpers.encode_base36(mask)}"
+                        for (year, month), mask in sorted(self._masks.items()))
+
+    def to_compact_string(self) -> str:
+
+        return min(self.to_string(), self.to_base64(), key=len)
+
+    def __repr__(self):
+
+        return f"{type(self).__name__}({self._masks!r})"
+
+    def __eq__(self, other):
+
+        if not isinstance(other, DatesMasksIndex):
+            return NotImplemented
+
+        return self._masks == other._masks
+
+    def __hash__(self):
+
+        return hash(frozenset(self._masks.items()))
+
+    def __len__(self) -> int:
+
+        return self._quantity
+
+    def __contains__(self, date: datetimelib.date) -> bool:
+
+        return bool((self._masks.get((date.year, date.month), 0) >> (date.day - 1)) & 1)
+
+    def __iter__(self) -> Iterator[datetimelib.date]:
+
+        for year, month in sorted(self._masks):
+            mask = self._masks[(year, month)]
+            day = 1
+            while mask:
+                if mask & 1:
+                    yield datetimelib.date(year, month, day)
+                mask >>= 1
+                day += 1
+
+    @property
+    def masks(self) -> Mapping[Tuple[int, int], int]:
+
+        return types.MappingProxyType(self._masks)
+
+    def get_month_mask(self, year: int, month: int) -> int:
+
+        return self._masks.get((year, month), 0)
+
+    def union(self, other: "DatesMasksIndex") -> "DatesMasksIndex":
+
+        masks = dict(self._masks)
+        for key, mask in other._masks.items():
+            masks[key] = masks.get(key, 0) | mask
+
+        return type(self)(masks)
+
+    def _pack_masks(self) -> bytes:
+
+        data = bytearray((PACKED_MASKS_FORMAT,))
+        helpers.encode_varint(len(self._masks), data)
+        previous_month_index = 0
+        for (year, month), mask in sorted(self._masks.items()):
+            month_index = year * helpers.MONTHS_IN_YEAR_QUANTITY + month - 1
+            helpers.encode_varint(month_index - previous_month_index, data)
+            helpers.encode_varint(mask, data)
+            previous_month_index = month_index
+
+        return bytes(data)
+
+    def _pack_runs(self) -> bytes:
+
+        runs = []
+        for date in self:
+            ordinal = date.toordinal()
+            if runs and (runs[-1][1] + 1 == ordinal):
+                runs[-1][1] = ordinal
+            else:
+                runs.append([ordinal, ordinal])
+
+        data = bytearray((PACKED_RUNS_FORMAT,))
+        helpers.encode_varint(len(runs), data)
+        previous_ordinal = 0
+        for start_ordinal, end_ordinal in runs:
+            helpers.encode_varint(start_ordinal - previous_ordinal, data)
+            helpers.encode_varint(end_ordinal - start_ordinal, data)
+            previous_ordinal = end_ordinal
+
+        return bytes(data)
+
+    def toggle(self, date: datetimelib.date) -> "DatesMasksIndex":
+
+        masks: Dict[Tuple[int, int], int] = dict(self._masks)
+        key = (date.year, date.month)
+        masks[key] = masks.get(key, 0) ^ (1 << (date.day - 1))
+
+        return type(self)(masks)
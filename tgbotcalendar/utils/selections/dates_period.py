@@ -0,0 +1,65 @@
+import datetime as datetimelib
+from typing import Optional, Tuple, Iterator
+import calendar
+
+
+class DatesPeriod:
+
+    __slots__ = ("start_date", "end_date")
+
+    def __init__(self, start_date: datetimelib.date, end_date: Optional[datetimelib.date] = None):
+
+        if end_date is None:
+            end_date = start_date
+        elif start_date > end_date:
+            raise ValueError("selected start date can't be later than selected end date!")
+
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def __repr__(self):
+
+        return f"{type(self).__name__}(start_date={self.start_date!r}, end_date={self.end_date!r})"
+
+    def __eq__(self, other):
+
+        if not isinstance(other, DatesPeriod):
+            return NotImplemented
+
+        return (self.start_date, self.end_date) == (other.start_date, other.end_date)
+
+    def __hash__(self):
+
+        return hash((self.start_date, self.end_date))
+
+    def __len__(self) -> int:
+
+        return self.end_date.toordinal() - self.start_date.toordinal() + 1
+
+    def __contains__(self, date: datetimelib.date) -> bool:
+
+        return self.start_date <= date <= self.end_date
+
+    def __iter__(self) -> Iterator[datetimelib.date]:
+
+        for ordinal in range(self.start_date.toordinal(), self.end_date.toordinal() + 1):
+            yield datetimelib.date.fromordinal(ordinal)
+
+    @property
+    def is_closed(self) -> bool:
+
+        return self.start_date != self.end_date
+
+    def get_month_days_range(self, year: int, month: int) -> Optional[Tuple[int, int]]:
+
+        year_month = (year, month)
+        start_year_month = (self.start_date.year, self.start_date.month)
+        end_year_month = (self.end_date.year, self.end_date.month)
+
+        if (year_month < start_year_month) or (year_month > end_year_month):
+            return None
+
+        first_day = self.start_date.day if year_month == start_year_month else 1
+        last_day = self.end_date.day if year_month == end_year_month else calendar.monthrange(year, month)[1]
+
+        return first_day, last_day
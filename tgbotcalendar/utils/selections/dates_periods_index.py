@@ -0,0 +1,274 @@
+import datetime as datetimelib
+from typing import Optional, Iterable, Iterator, Union, Tuple, List, Sequence
+import base64
+import binascii
+import bisect
+import calendar
+
+from tgbotcalendar.utils import helpers
+from tgbotcalendar.utils.selections.dates_period import DatesPeriod
+from tgbotcalendar.utils.selections.dates_masks_index import PACKED_RUNS_FORMAT
+
+
+DatesPeriodValue = Union[DatesPeriod, Tuple[datetimelib.date, datetimelib.date]]
+
+
+class DatesPeriodsIndex:
+
+    __slots__ = ("_starts", "_ends", "_quantity")
+
+    def __init__(self, periods: Iterable[DatesPeriodValue] = ()):
+
+        intervals = []
+        for period in periods:
+            if isinstance(period, DatesPeriod):
+                start_date, end_date = period.start_date, period.end_date
+            else:
+                start_date, end_date = period
+                if start_date > end_date:
+                    raise ValueError("period start date can't be later than period end date!")
+            intervals.append((start_date.toordinal(), end_date.toordinal()))
+
+        starts = []
+        ends = []
+        for start, end in sorted(intervals):
+            if ends and (start <= ends[-1] + 1):
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        self._set_intervals(starts, ends)
+
+    @classmethod
+    def _from_intervals(cls, starts: Sequence[int], ends: Sequence[int]) -> "DatesPeriodsIndex":
+
+        index = cls.__new__(cls)
+        index._set_intervals(starts, ends)
+
+        return index
+
+    @classmethod
+    def from_string(cls, data: str) -> "DatesPeriodsIndex":
+
+        starts = []
+        ends = []
+        if data:
+            for part in data.split(","):
+                start_data, length_data = part.split(":")
+                start = (ends[-1] if ends else 0) + helpers.decode_base36(start_data)
+                starts.append(start)
+                ends.append(start + helpers.decode_base36(length_data))
+
+        return cls._from_checked_intervals(starts, ends)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DatesPeriodsIndex":
+
+        if not data:
+            return cls()
+        if data[0] != PACKED_RUNS_FORMAT:
+            raise ValueError(f"unknown packed periods format '{data[0]}'!")
+
+        starts = []
+        ends = []
+        periods_quantity, offset = helpers.decode_varint(data, 1)
+        for _ in range(periods_quantity):
+            start_delta, offset = helpers.decode_varint(data, offset)
+            length, offset = helpers.decode_varint(data, offset)
+            start = (ends[-1] if ends else 0) + start_delta
+            starts.append(start)
+            ends.append(start + length)
+        if offset != len(data):
+            raise ValueError("unexpected trailing data!")
+
+        return cls._from_checked_intervals(starts, ends)
+
+    @classmethod
+    def from_base64(cls, data: str) -> "DatesPeriodsIndex":
+
+        try:
+            packed_data = base64.b64decode(data + "=" * (-len(data) % 4), altchars=b"-_", validate=True)
+        except (ValueError, binascii.Error):
+            raise ValueError(f"incorrect packed periods string '{data}'!")
+
+        return cls.from_bytes(packed_data)
+
+    @classmethod
+    def from_compact_string(cls, data: str) -> "DatesPeriodsIndex":
+
+        if ":" in data:
+            return cls.from_string(data)
+
+        return cls.from_base64(data)
+
+    @classmethod
+    def _from_checked_intervals(cls, starts: List[int], ends: List[int]) -> "DatesPeriodsIndex":
+
+        for index in range(len(starts)):
+            if starts[index] > ends[index]:
+                raise ValueError("packed period start can't be later than packed period end!")
+            if (index > 0) and (starts[index] <= ends[index - 1] + 1):
+                raise ValueError("packed periods must be separated!")
+        if ends and not 1 <= starts[0] <= ends[-1] <= datetimelib.date.max.toordinal():
+            raise ValueError("packed periods are out of range!")
+
+        return cls._from_intervals(starts, ends)
+
+    def _set_intervals(self, starts: Sequence[int], ends: Sequence[int]):
+
+        self._starts = tuple(starts)
+        self._ends = tuple(ends)
+        self._quantity = sum(ends) - sum(starts) + len(starts)
+
+    def to_string(self) -> str:
+
+        parts = []
+        previous_end = 0
+        for start, end in zip(self._starts, self._ends):
+            parts.append(f"{helpers.encode_base36(start - previous_end)}:{helpers.encode_base36(end - start)}")
+            previous_end = end
+
+        return ",".join(parts)
+
+    def to_bytes(self) -> bytes:
+
+        if not self._starts:
+            return b""
+
+        data = bytearray((PACKED_RUNS_FORMAT,))
+        helpers.encode_varint(len(self._starts), data)
+        previous_end = 0
+        for start, end in zip(self._starts, self._ends):
+            helpers.encode_varint(start - previous_end, data)
+            helpers.encode_varint(end - start, data)
+            previous_end = end
+
+        return bytes(data)
+
+    def to_base64(self) -> str:
+
+        return base64.urlsafe_b64encode(self.to_bytes()).rstrip(b"=").decode("ascii")
+
+    def to_compact_string(self) -> str:
+
+        return min(self.to_string(), self.to_base64(), key=len)
+
+    def __repr__(self):
+
+        return f"{type(self).__name__}({self.intervals!r})"
+
+    def __eq__(self, other):
+
+        if not isinstance(other, DatesPeriodsIndex):
+            return NotImplemented
+
+        return (self._starts, self._ends) == (other._starts, other._ends)
+
+    def __hash__(self):
+
+        return hash((self._starts, self._ends))
+
+    def __len__(self) -> int:
+
+        return self._quantity
+
+    def __bool__(self) -> bool:
+
+        return bool(self._starts)
+
+    def __contains__(self, date: datetimelib.date) -> bool:
+
+        return self._find_interval_index(date.toordinal()) is not None
+
+    def __iter__(self) -> Iterator[DatesPeriod]:
+
+        from_ordinal = datetimelib.date.fromordinal
+        for start, end in zip(self._starts, self._ends):
+            yield DatesPeriod(from_ordinal(start), from_ordinal(end))
+
+    @property
+    def periods_quantity(self) -> int:
+
+        return len(self._starts)
+
+    @property
+    def intervals(self) -> List[Tuple[datetimelib.date, datetimelib.date]]:
+
+        return [(datetimelib.date.fromordinal(start), datetimelib.date.fromordinal(end))
+                for start, end in zip(self._starts, self._ends)]
+
+    def find(self, date: datetimelib.date) -> Optional[DatesPeriod]:
+
+        index = self._find_interval_index(date.toordinal())
+        if index is None:
+            return None
+
+        return DatesPeriod(datetimelib.date.fromordinal(self._starts[index]),
+                           datetimelib.date.fromordinal(self._ends[index]))
+
+    def add(self, start_date: datetimelib.date, end_date: Optional[datetimelib.date] = None) -> "DatesPeriodsIndex":
+
+        start, end = self._make_interval(start_date, end_date)
+        low_index = bisect.bisect_left(self._ends, start - 1)
+        high_index = bisect.bisect_right(self._starts, end + 1)
+        if low_index < high_index:
+            start = min(start, self._starts[low_index])
+            end = max(end, self._ends[high_index - 1])
+
+        return self._from_intervals(self._starts[:low_index] + (start,) + self._starts[high_index:],
+                                    self._ends[:low_index] + (end,) + self._ends[high_index:])
+
+    def remove(self, start_date: datetimelib.date, end_date: Optional[datetimelib.date] = None) -> "DatesPeriodsIndex":
+
+        start, end = self._make_interval(start_date, end_date)
+        low_index = bisect.bisect_left(self._ends, start)
+        high_index = bisect.bisect_right(self._starts, end)
+        if low_index >= high_index:
+            return self
+
+        middle_starts = []
+        middle_ends = []
+        if self._starts[low_index] < start:
+            middle_starts.append(self._starts[low_index])
+            middle_ends.append(start - 1)
+        if self._ends[high_index - 1] > end:
+            middle_starts.append(end + 1)
+            middle_ends.append(self._ends[high_index - 1])
+
+        return self._from_intervals(self._starts[:low_index] + tuple(middle_starts) + self._starts[high_index:],
+                                    self._ends[:low_index] + tuple(middle_ends) + self._ends[high_index:])
+
+    def get_month_days_ranges(self, year: int, month: int) -> List[Tuple[int, int]]:
+
+        first_ordinal = datetimelib.date(year, month, 1).toordinal()
+        last_ordinal = first_ordinal + calendar.monthrange(year, month)[1] - 1
+
+        days_ranges = []
+        index = max(bisect.bisect_right(self._starts, first_ordinal) - 1, 0)
+        while (index < len(self._starts)) and (self._starts[index] <= last_ordinal):
+            if self._ends[index] >= first_ordinal:
+                days_ranges.append((max(self._starts[index], first_ordinal) - first_ordinal + 1,
+                                    min(self._ends[index], last_ordinal) - first_ordinal + 1))
+            index += 1
+
+        return days_ranges
+
+    def _find_interval_index(self, ordinal: int) -> Optional[int]:
+
+        index = bisect.bisect_right(self._starts, ordinal) - 1
+        if (index >= 0) and (ordinal <= self._ends[index]):
+            return index
+
+        return None
+
+    @staticmethod
+    def _make_interval(start_date: datetimelib.date, end_date: Optional[datetimelib.date]) -> Tuple[int, int]:
+
+        if end_date is None:
+            end_date = start_date
+        elif start_date > end_date:
+            raise ValueError("period start date can't be later than period end date!")
+
+        return start_date.toordinal(), end_date.toordinal()
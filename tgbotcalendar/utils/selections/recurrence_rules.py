@@ -0,0 +1,247 @@
+from abc import ABC, abstractmethod
+import datetime as datetimelib
+from typing import Iterable, Iterator, Tuple, Dict, Type
+import calendar
+
+from tgbotcalendar.utils import helpers
+
+
+LAST_WEEK_NUMBER = -1
+WEEKS_IN_MONTH_QUANTITY = 5
+
+
+class BaseRecurrenceRule(ABC):
+
+    __slots__ = ("start_date", "end_date")
+
+    kind = None
+
+    def __init__(self, *, start_date: datetimelib.date, end_date: datetimelib.date):
+
+        if start_date > end_date:
+            raise ValueError("rule start date can't be later than rule end date!")
+
+        self.start_date = start_date
+        self.end_date = end_date
+
+    @classmethod
+    def from_string(cls, data: str) -> "BaseRecurrenceRule":
+
+        try:
+            rule_class = _RULES_CLASSES[data[:1]]
+        except KeyError:
+            raise ValueError(f"unknown recurrence rule '{data}'!")
+
+        *params, start_ordinal, length = map(helpers.decode_base36, data[1:].split("_"))
+        if (len(params) != len(rule_class._get_params_names())) or (start_ordinal < 1) or (length < 0):
+            raise ValueError(f"incorrect recurrence rule '{data}'!")
+
+        try:
+            start_date = datetimelib.date.fromordinal(start_ordinal)
+            end_date = datetimelib.date.fromordinal(start_ordinal + length)
+        except (ValueError, OverflowError):
+            raise ValueError(f"incorrect recurrence rule '{data}'!")
+
+        return rule_class(**dict(zip(rule_class._get_params_names(), rule_class._decode_params(params))),
+                          start_date=start_date, end_date=end_date)
+
+    def to_string(self) -> str:
+
+        start_ordinal = self.start_date.toordinal()
+        fields = self._encode_params() + (start_ordinal, self.end_date.toordinal() - start_ordinal)
+
+        return self.kind + "_".join(map(helpers.encode_base36, fields))
+
+    def __repr__(self):
+
+        params = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._get_params_names())
+        return f"{type(self).__name__}({params}, start_date={self.start_date!r}, end_date={self.end_date!r})"
+
+    def __eq__(self, other):
+
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return self._get_key() == other._get_key()
+
+    def __hash__(self):
+
+        return hash(self._get_key())
+
+    def get_month_mask(self, year: int, month: int) -> int:
+
+        month_first_ordinal = datetimelib.date(year, month, 1).toordinal()
+        first_weekday, days_quantity = calendar.monthrange(year, month)
+        first_ordinal = max(month_first_ordinal, self.start_date.toordinal())
+        last_ordinal = min(month_first_ordinal + days_quantity - 1, self.end_date.toordinal())
+        if first_ordinal > last_ordinal:
+            return 0
+
+        mask = self._make_month_mask(year, month, month_first_ordinal, first_weekday, days_quantity)
+        bounds_mask = ((1 << (last_ordinal - first_ordinal + 1)) - 1) << (first_ordinal - month_first_ordinal)
+
+        return mask & bounds_mask
+
+    def get_months(self) -> Iterator[Tuple[int, int]]:
+
+        year, month = self.start_date.year, self.start_date.month
+        end_year_month = (self.end_date.year, self.end_date.month)
+        while (year, month) <= end_year_month:
+            yield year, month
+            year, month = helpers.make_offset_next_month(year, month)
+
+    def _get_key(self) -> tuple:
+
+        return self._encode_params() + (self.start_date, self.end_date)
+
+    @classmethod
+    def _decode_params(cls, params: list) -> list:
+
+        return params
+
+    @classmethod
+    @abstractmethod
+    def _get_params_names(cls) -> Tuple[str, ...]:
+
+        pass
+
+    @abstractmethod
+    def _encode_params(self) -> Tuple[int, ...]:
+
+        pass
+
+    @abstractmethod
+    def _make_month_mask(self, year: int, month: int, month_first_ordinal: int,
+                         first_weekday: int, days_quantity: int) -> int:
+
+        pass
+
+
+class WeekdaysRule(BaseRecurrenceRule):
+
+    __slots__ = ("weekdays", "_weekdays_mask")
+
+    kind = "w"
+
+    def __init__(self, *, weekdays: Iterable[int], start_date: datetimelib.date, end_date: datetimelib.date):
+
+        super().__init__(start_date=start_date, end_date=end_date)
+
+        weekdays_mask = 0
+        for weekday in weekdays:
+            if isinstance(weekday, bool) or not calendar.MONDAY <= weekday <= calendar.SUNDAY:
+                raise ValueError(f"incorrect weekday '{weekday}'!")
+            weekdays_mask |= 1 << weekday
+        if not weekdays_mask:
+            raise ValueError("weekdays can't be empty!")
+
+        self.weekdays = tuple(i for i in range(7) if (weekdays_mask >> i) & 1)
+        self._weekdays_mask = weekdays_mask
+
+    @classmethod
+    def _decode_params(cls, params: list) -> list:
+
+        weekdays_mask, = params
+        return [[i for i in range(7) if (weekdays_mask >> i) & 1]]
+
+    @classmethod
+    def _get_params_names(cls) -> Tuple[str, ...]:
+
+        return "weekdays",
+
+    def _encode_params(self) -> Tuple[int, ...]:
+
+        return self._weekdays_mask,
+
+    def _make_month_mask(self, year: int, month: int, month_first_ordinal: int,
+                         first_weekday: int, days_quantity: int) -> int:
+
+        return helpers.make_weekdays_mask(first_weekday, days_quantity, self._weekdays_mask)
+
+
+class EveryNDaysRule(BaseRecurrenceRule):
+
+    __slots__ = ("days_interval",)
+
+    kind = "d"
+
+    def __init__(self, *, days_interval: int, start_date: datetimelib.date, end_date: datetimelib.date):
+
+        super().__init__(start_date=start_date, end_date=end_date)
+
+        if days_interval < 1:
+            raise ValueError("days interval must be positive!")
+
+        self.days_interval = days_interval
+
+    @classmethod
+    def _get_params_names(cls) -> Tuple[str, ...]:
+
+        return "days_interval",
+
+    def _encode_params(self) -> Tuple[int, ...]:
+
+        return self.days_interval,
+
+    def _make_month_mask(self, year: int, month: int, month_first_ordinal: int,
+                         first_weekday: int, days_quantity: int) -> int:
+
+        mask = 0
+        for day in range((self.start_date.toordinal() - month_first_ordinal) % self.days_interval,
+                         days_quantity, self.days_interval):
+            mask |= 1 << day
+
+        return mask
+
+
+class NthWeekdayRule(BaseRecurrenceRule):
+
+    __slots__ = ("weekday", "week_number")
+
+    kind = "n"
+
+    def __init__(self, *, weekday: int, week_number: int, start_date: datetimelib.date, end_date: datetimelib.date):
+
+        super().__init__(start_date=start_date, end_date=end_date)
+
+        if not calendar.MONDAY <= weekday <= calendar.SUNDAY:
+            raise ValueError(f"incorrect weekday '{weekday}'!")
+        if (week_number != LAST_WEEK_NUMBER) and not 1 <= week_number <= WEEKS_IN_MONTH_QUANTITY:
+            raise ValueError(f"incorrect week number '{week_number}'!")
+
+        self.weekday = weekday
+        self.week_number = week_number
+
+    @classmethod
+    def _decode_params(cls, params: list) -> list:
+
+        weekday, week_number = params
+        return [weekday, week_number if week_number else LAST_WEEK_NUMBER]
+
+    @classmethod
+    def _get_params_names(cls) -> Tuple[str, ...]:
+
+        return "weekday", "week_number"
+
+    def _encode_params(self) -> Tuple[int, ...]:
+
+        return self.weekday, max(self.week_number, 0)
+
+    def _make_month_mask(self, year: int, month: int, month_first_ordinal: int,
+                         first_weekday: int, days_quantity: int) -> int:
+
+        first_day = (self.weekday - first_weekday) % 7
+        if self.week_number == LAST_WEEK_NUMBER:
+            day = first_day + (days_quantity - 1 - first_day) // 7 * 7
+        else:
+            day = first_day + (self.week_number - 1) * 7
+        if day >= days_quantity:
+            return 0
+
+        return 1 << day
+
+
+_RULES_CLASSES: Dict[str, Type[BaseRecurrenceRule]] = {
+    rule_class.kind: rule_class for rule_class in (WeekdaysRule, EveryNDaysRule, NthWeekdayRule)
+}
+
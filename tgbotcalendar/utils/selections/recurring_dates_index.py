@@ -0,0 +1,196 @@
+import datetime as datetimelib
+from typing import Optional, Iterable, Iterator, Tuple, Union, Mapping
+import types
+
+from tgbotcalendar.utils.selections.dates_masks_index import DatesMasksIndex
+from tgbotcalendar.utils.selections.recurrence_rules import BaseRecurrenceRule
+
+
+RECURRING_DATES_PREFIX = "~"
+MONTHS_MASKS_CACHE_SIZE = 256
+
+
+class RecurringDatesIndex:
+
+    __slots__ = ("_rules", "_included_dates", "_excluded_dates", "_months_masks", "_quantity")
+
+    def __init__(self, rules: Iterable[BaseRecurrenceRule] = (), *,
+                 included_dates: Optional[DatesMasksIndex] = None,
+                 excluded_dates: Optional[DatesMasksIndex] = None):
+
+        rules_by_strings = {rule.to_string(): rule for rule in rules}
+        self._rules = tuple(rules_by_strings[i] for i in sorted(rules_by_strings))
+        self._included_dates = included_dates if included_dates is not None else DatesMasksIndex()
+        self._excluded_dates = excluded_dates if excluded_dates is not None else DatesMasksIndex()
+        self._months_masks = {}
+        self._quantity = None
+
+    @classmethod
+    def from_compact_string(cls, data: str) -> "RecurringDatesIndex":
+
+        if not data.startswith(RECURRING_DATES_PREFIX):
+            raise ValueError(f"incorrect recurring dates string '{data}'!")
+
+        parts = data[len(RECURRING_DATES_PREFIX):].split(RECURRING_DATES_PREFIX)
+        if len(parts) != 3:
+            raise ValueError(f"incorrect recurring dates string '{data}'!")
+        rules_data, included_dates_data, excluded_dates_data = parts
+
+        return cls([BaseRecurrenceRule.from_string(i) for i in rules_data.split(",") if i],
+                   included_dates=DatesMasksIndex.from_compact_string(included_dates_data),
+                   excluded_dates=DatesMasksIndex.from_compact_string(excluded_dates_data))
+
+    def to_string(self) -> str:
+
+        return RECURRING_DATES_PREFIX.join(("", ",".join(i.to_string() for i in self._rules),
+                                            self._included_dates.to_string(),
+                                            self._excluded_dates.to_string()))
+
+    def to_compact_string(self) -> str:
+
+        return RECURRING_DATES_PREFIX.join(("", ",".join(i.to_string() for i in self._rules),
+                                            self._included_dates.to_compact_string(),
+                                            self._excluded_dates.to_compact_string()))
+
+    def __repr__(self):
+
+        return (f"{type(self).__name__}({list(self._rules)!r}, included_dates={self._included_dates!r}, "
+                f"excluded_dates={self._excluded_dates!r})")
+
+    def __eq__(self, other):
+
+        if not isinstance(other, RecurringDatesIndex):
+            return NotImplemented
+
+        return ((self._rules, self._included_dates, self._excluded_dates) ==
+                (other._rules, other._included_dates, other._excluded_dates))
+
+    def __hash__(self):
+
+        return hash((self._rules, self._included_dates, self._excluded_dates))
+
+    def __len__(self) -> int:
+
+        if self._quantity is None:
+            self._quantity = sum(bin(self._make_month_mask(year, month)).count("1")
+                                 for year, month in self._get_months())
+
+        return self._quantity
+
+    def __contains__(self, date: datetimelib.date) -> bool:
+
+        return bool((self.get_month_mask(date.year, date.month) >> (date.day - 1)) & 1)
+
+    def __iter__(self) -> Iterator[datetimelib.date]:
+
+        for year, month in self._get_months():
+            mask = self._make_month_mask(year, month)
+            day = 1
+            while mask:
+                if mask & 1:
+                    yield datetimelib.date(year, month, day)
+                mask >>= 1
+                day += 1
+
+    @property
+    def masks(self) -> Mapping[Tuple[int, int], int]:
+
+        masks = {}
+        for year, month in self._get_months():
+            mask = self.get_month_mask(year, month)
+            if mask:
+                masks[(year, month)] = mask
+
+        return types.MappingProxyType(masks)
+
+    @property
+    def rules(self) -> Tuple[BaseRecurrenceRule, ...]:
+
+        return self._rules
+
+    @property
+    def included_dates(self) -> DatesMasksIndex:
+
+        return self._included_dates
+
+    @property
+    def excluded_dates(self) -> DatesMasksIndex:
+
+        return self._excluded_dates
+
+    def get_month_mask(self, year: int, month: int) -> int:
+
+        try:
+            return self._months_masks[(year, month)]
+        except KeyError:
+            pass
+
+        mask = self._make_month_mask(year, month)
+        if len(self._months_masks) >= MONTHS_MASKS_CACHE_SIZE:
+            self._months_masks.clear()
+        self._months_masks[(year, month)] = mask
+
+        return mask
+
+    def union(self, other: Union[DatesMasksIndex, "RecurringDatesIndex"]) -> "RecurringDatesIndex":
+
+        if isinstance(other, DatesMasksIndex):
+            other = type(self)(included_dates=other)
+
+        excluded_dates = DatesMasksIndex.from_dates(
+            i for i in self._excluded_dates.union(other._excluded_dates) if (i not in self) and (i not in other)
+        )
+
+        return type(self)(self._rules + other._rules,
+                          included_dates=self._included_dates.union(other._included_dates),
+                          excluded_dates=excluded_dates)
+
+    def add_rule(self, rule: BaseRecurrenceRule) -> "RecurringDatesIndex":
+
+        return type(self)(self._rules + (rule,),
+                          included_dates=self._included_dates,
+                          excluded_dates=self._excluded_dates)
+
+    def toggle(self, date: datetimelib.date) -> "RecurringDatesIndex":
+
+        included_dates = self._included_dates
+        excluded_dates = self._excluded_dates
+        is_matched = any((i.get_month_mask(date.year, date.month) >> (date.day - 1)) & 1 for i in self._rules)
+
+        if date in self:
+            if date in included_dates:
+                included_dates = included_dates.toggle(date)
+            if is_matched:
+                excluded_dates = excluded_dates.toggle(date)
+        elif date in excluded_dates:
+            excluded_dates = excluded_dates.toggle(date)
+            if not is_matched:
+                included_dates = included_dates.toggle(date)
+        else:
+            included_dates = included_dates.toggle(date)
+
+        return type(self)(self._rules, included_dates=included_dates, excluded_dates=excluded_dates)
+
+    def _make_month_mask(self, year: int, month: int) -> int:
+
+        mask = self._included_dates.get_month_mask(year, month)
+        for rule in self._rules:
+            mask |= rule.get_month_mask(year, month)
+
+        return mask & ~self._excluded_dates.get_month_mask(year, month)
+
+    def _get_months(self) -> Iterator[Tuple[int, int]]:
+
+        months = set(self._included_dates.masks)
+        for rule in self._rules:
+            months.update(rule.get_months())
+
+        return iter(sorted(months))
+
+
+def deserialize_selected_dates(data: str) -> Union[DatesMasksIndex, RecurringDatesIndex]:
+
+    if data.startswith(RECURRING_DATES_PREFIX):
+        return RecurringDatesIndex.from_compact_string(data)
+
+    return DatesMasksIndex.from_compact_string(data)